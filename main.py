@@ -1,5 +1,69 @@
-from src.core.engine import Engine
+import argparse
+import json
+import os
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Monster Go")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a window or audio device (SDL dummy drivers), offline")
+    parser.add_argument("--frames", type=int, default=600,
+                        help="number of fixed steps to run in headless mode")
+    parser.add_argument("--scene", default=None,
+                        help="scene to start in (default: menu)")
+    parser.add_argument("--input", default=None,
+                        help="JSON input script to replay in headless mode")
+    parser.add_argument("--record", default=None,
+                        help="record live input to this JSON file")
+    parser.add_argument("--report", default=None,
+                        help="write headless per-scene timings to this JSON file (default: stdout)")
+    parser.add_argument("--build-atlas", action="store_true",
+                        help="pack the UI images into assets/images/atlas and exit")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
+    args = parse_args()
+
+    if args.build_atlas:
+        import pygame as pg
+        from src.core.managers import ResourceManager
+        pg.display.init()
+        pg.display.set_mode((1, 1), pg.HIDDEN)   # convert_alpha() needs a display mode
+        print(json.dumps(ResourceManager.build_atlas().stats(), indent=2))
+        raise SystemExit
+
+    if args.headless:
+        # Must be set before pygame initialises its video/audio subsystems
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    from src.utils import GameSettings
+    if args.headless:
+        GameSettings.IS_ONLINE = False
+        GameSettings.RENDER_MODE = "uncapped"
+
+    from src.core.engine import Engine
+    from src.core.headless import InputScript, InputRecorder
+    from src.core.services import scene_manager
+
     engine = Engine()
-    engine.run()
+    if args.scene:
+        scene_manager.change_scene(args.scene)
+    if args.record:
+        engine.recorder = InputRecorder()
+
+    try:
+        if args.headless:
+            script = InputScript.load(args.input) if args.input else None
+            report = engine.run_headless(args.frames, script)
+            if args.report:
+                with open(args.report, "w", encoding="utf-8") as f:
+                    json.dump(report, f, indent=2)
+            else:
+                print(json.dumps(report, indent=2))
+        else:
+            engine.run()
+    finally:
+        if engine.recorder:
+            engine.recorder.save(args.record)
@@ -1,7 +1,9 @@
 import pygame as pg
+import time
 
 from src.utils import GameSettings, Logger
-from .services import scene_manager, input_manager
+from .services import scene_manager, input_manager, resource_manager, profiler
+from .headless import InputScript, InputRecorder, SceneTimings
 
 from src.scenes.menu_scene import MenuScene
 from src.scenes.game_scene import GameScene
@@ -18,15 +20,21 @@ class Engine:
     screen: pg.Surface              # Screen Display of the Game
     clock: pg.time.Clock            # Clock for FPS control
     running: bool                   # Running state of the game
+    render_fps: int                 # Render cap passed to clock.tick (0 = none)
+    step: int                       # Fixed simulation steps run so far
+    recorder: InputRecorder | None  # Captures live input when recording
 
     def __init__(self):
         Logger.info("Initializing Engine")
 
         pg.init()
 
-        self.screen = pg.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+        self.screen = self._create_display()
+        resource_manager.load_atlas()   # before any scene loads its UI images
         self.clock = pg.time.Clock()
         self.running = True
+        self.step = 0
+        self.recorder = None
 
         pg.display.set_caption(GameSettings.TITLE)
 
@@ -50,20 +58,99 @@ class Engine:
         scene_manager.register_scene("setting_from_game", SettingsScene("game"))
         scene_manager.change_scene("menu")
 
+    def _create_display(self) -> pg.Surface:
+        size = (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT)
+        mode = GameSettings.RENDER_MODE
+        if mode == "vsync":
+            try:
+                # vsync is only honoured for SCALED / OPENGL displays
+                screen = pg.display.set_mode(size, pg.SCALED, vsync=1)
+                self.render_fps = 0
+                return screen
+            except pg.error as e:
+                Logger.warning(f"vsync unavailable ({e}), falling back to capped rendering")
+                mode = "capped"
+        elif mode not in ("capped", "uncapped"):
+            Logger.warning(f"Unknown RENDER_MODE '{mode}', using capped rendering")
+            mode = "capped"
+
+        self.render_fps = GameSettings.FPS if mode == "capped" else 0
+        return pg.display.set_mode(size)
+
     def run(self):
         Logger.info("Running the Game Loop ...")
 
+        # Simulation advances in fixed steps; rendering runs as often as the
+        # render mode allows and interpolates between the last two steps.
+        step = 1.0 / GameSettings.UPDATE_RATE
+        accumulator = 0.0
+        self.clock.tick()
+
         while self.running:
-            dt = self.clock.tick(GameSettings.FPS) / 1000.0
+            frame_time = self.clock.tick(self.render_fps) / 1000.0
+            # A long stall (window drag, breakpoint) must not turn into a burst of steps
+            accumulator += min(frame_time, GameSettings.MAX_FRAME_TIME)
+
+            self.handle_events()
+
+            steps = 0
+            while accumulator >= step and steps < GameSettings.MAX_CATCHUP_STEPS:
+                self.update(step)
+                accumulator -= step
+                steps += 1
+            if accumulator >= step:
+                # Still behind after the catch-up budget: drop the backlog
+                # instead of spiralling into ever longer frames
+                accumulator %= step
+
+            self.render(accumulator / step)
+
+    def run_headless(self, frames: int, script: InputScript | None = None) -> dict:
+        """
+        Run `frames` fixed steps as fast as possible, one render per step,
+        feeding input from `script`. Returns per-scene update/draw timings.
+        """
+        Logger.info(f"Running {frames} headless frames ...")
+        step = 1.0 / GameSettings.UPDATE_RATE
+        timings = SceneTimings()
+        start = time.perf_counter()
+
+        for _ in range(frames):
+            if not self.running:
+                break
+            if script is not None:
+                script.post(self.step)
             self.handle_events()
-            self.update(dt)
+
+            t0 = time.perf_counter()
+            self.update(step)
+            t1 = time.perf_counter()
+            # Pending scene switches happen inside update(), so read the name after it
+            scene = scene_manager.current_scene_name or "none"
             self.render()
+            t2 = time.perf_counter()
+            timings.add(scene, t1 - t0, t2 - t1)
+
+        wall = time.perf_counter() - start
+        return {
+            "frames": self.step,
+            "update_rate": GameSettings.UPDATE_RATE,
+            "wall_time_s": wall,
+            "fps": self.step / wall if wall > 0 else 0.0,
+            "scenes": timings.report(),
+        }
 
     def handle_events(self):
-        input_manager.reset()
+        profiler.begin("events")
         for event in pg.event.get():
             if event.type == pg.QUIT:
                 self.running = False
+            if event.type == pg.KEYDOWN and event.key == pg.K_F3:
+                self._toggle_profiler()
+            if event.type == pg.WINDOWEXPOSED:
+                scene_manager.request_full_redraw()
+            if self.recorder:
+                self.recorder.capture(self.step, event)
             # 1) 更新輸入狀態（輪詢用）
             input_manager.handle_events(event)
 
@@ -72,15 +159,48 @@ class Engine:
             for event in pg.event.get():
                 if event.type == pg.QUIT:
                     self.running = False
+                if event.type == pg.KEYDOWN and event.key == pg.K_F3:
+                    self._toggle_profiler()
+                if self.recorder:
+                    self.recorder.capture(self.step, event)
                 input_manager.handle_events(event)
+        profiler.end("events")
         
         
             
 
+    def _toggle_profiler(self) -> None:
+        profiler.toggle()
+        # Dirty-rect scenes only present what changed: turning the overlay off
+        # would leave its pixels on screen without one full frame
+        scene_manager.request_full_redraw()
+
     def update(self, dt: float):
+        profiler.begin("update")
         scene_manager.update(dt)
+        profiler.end("update")
+        self.step += 1
+        # Pressed/released edges are consumed by exactly one simulation step,
+        # even when a frame runs zero or several steps
+        input_manager.reset()
 
-    def render(self):
-        self.screen.fill((0, 0, 0))     # Make sure the display is cleared
+    def render(self, alpha: float = 1.0):
+        scene_manager.alpha = alpha     # Fraction of a step since the last update
+        # Dirty-rect scenes patch the previous frame in place instead of clearing it
+        partial = scene_manager.uses_dirty_rects and not profiler.enabled
+        if not partial:
+            if scene_manager.uses_dirty_rects:
+                scene_manager.request_full_redraw()   # the profiler overlay needs a clean frame
+            self.screen.fill((0, 0, 0)) # Make sure the display is cleared
+        profiler.begin("draw")
         scene_manager.draw(self.screen) # Draw the current scene
-        pg.display.flip()               # Render the display
+        profiler.end("draw")
+        profiler.draw(self.screen)      # F3 debug overlay (no-op when off)
+        profiler.begin("flip")
+        rects = scene_manager.dirty_rects()
+        if not partial or rects is None:
+            pg.display.flip()           # Render the display
+        elif rects:
+            pg.display.update(rects)    # Only the regions that changed
+        profiler.end("flip")
+        profiler.end_frame()
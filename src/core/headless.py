@@ -0,0 +1,140 @@
+"""
+Scripted input and frame timing for running the engine without a window.
+
+Input scripts are JSON files:
+
+    {"events": [
+        {"frame": 0,  "type": "keydown",   "key": "right"},
+        {"frame": 90, "type": "keyup",     "key": "right"},
+        {"frame": 95, "type": "mousedown", "button": 1, "pos": [640, 360]},
+        {"frame": 96, "type": "mouseup",   "button": 1, "pos": [640, 360]}
+    ]}
+
+`frame` is the simulation step the event is delivered before. Key names are
+pygame names (pg.key.name / pg.key.key_code). The same format is written by
+InputRecorder, so a recorded session can be replayed headless.
+"""
+
+from __future__ import annotations
+import json
+import pygame as pg
+from collections import defaultdict
+from pathlib import Path
+
+from src.utils import Logger
+
+
+_KEY_EVENTS = {"keydown": pg.KEYDOWN, "keyup": pg.KEYUP}
+_MOUSE_EVENTS = {"mousedown": pg.MOUSEBUTTONDOWN, "mouseup": pg.MOUSEBUTTONUP}
+
+
+class InputScript:
+    """Feeds recorded/scripted events into the pygame event queue frame by frame."""
+    _events: dict[int, list[dict]]
+    last_frame: int
+
+    def __init__(self, events: list[dict]):
+        self._events = defaultdict(list)
+        for ev in events:
+            self._events[int(ev["frame"])].append(ev)
+        self.last_frame = max(self._events, default=-1)
+
+    @classmethod
+    def load(cls, path: str | Path) -> InputScript:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        events = data["events"] if isinstance(data, dict) else data
+        Logger.info(f"Loaded input script {path} ({len(events)} events)")
+        return cls(events)
+
+    def post(self, frame: int) -> None:
+        for ev in self._events.get(frame, ()):
+            event = self._to_pygame(ev)
+            if event is not None:
+                pg.event.post(event)
+
+    @staticmethod
+    def _to_pygame(ev: dict) -> pg.event.Event | None:
+        typ = ev.get("type")
+        if typ in _KEY_EVENTS:
+            key = pg.key.key_code(ev["key"])
+            return pg.event.Event(_KEY_EVENTS[typ], key=key, mod=0, unicode=ev.get("unicode", ""))
+        if typ in _MOUSE_EVENTS:
+            return pg.event.Event(_MOUSE_EVENTS[typ], button=int(ev.get("button", 1)), pos=tuple(ev["pos"]))
+        if typ == "mousemotion":
+            return pg.event.Event(pg.MOUSEMOTION, pos=tuple(ev["pos"]), rel=(0, 0), buttons=(0, 0, 0))
+        if typ == "mousewheel":
+            return pg.event.Event(pg.MOUSEWHEEL, x=0, y=int(ev.get("y", 0)))
+        if typ == "text":
+            return pg.event.Event(pg.TEXTINPUT, text=ev["text"])
+        Logger.warning(f"Unknown scripted input event: {ev}")
+        return None
+
+
+class InputRecorder:
+    """Captures live input events in the InputScript format."""
+    events: list[dict]
+
+    def __init__(self) -> None:
+        self.events = []
+
+    def capture(self, frame: int, event: pg.event.Event) -> None:
+        if event.type in (pg.KEYDOWN, pg.KEYUP):
+            rec = {"type": "keydown" if event.type == pg.KEYDOWN else "keyup", "key": pg.key.name(event.key)}
+            if event.type == pg.KEYDOWN and event.unicode:
+                rec["unicode"] = event.unicode
+        elif event.type in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP):
+            rec = {
+                "type": "mousedown" if event.type == pg.MOUSEBUTTONDOWN else "mouseup",
+                "button": event.button, "pos": list(event.pos),
+            }
+        elif event.type == pg.MOUSEMOTION:
+            rec = {"type": "mousemotion", "pos": list(event.pos)}
+        elif event.type == pg.MOUSEWHEEL:
+            rec = {"type": "mousewheel", "y": event.y}
+        elif event.type == pg.TEXTINPUT:
+            rec = {"type": "text", "text": event.text}
+        else:
+            return
+        rec["frame"] = frame
+        self.events.append(rec)
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"events": self.events}, f, indent=1)
+        Logger.info(f"Recorded {len(self.events)} input events to {path}")
+
+
+class SceneTimings:
+    """Per-scene update/draw durations collected by Engine.run_headless."""
+    _samples: dict[str, dict[str, list[float]]]
+
+    def __init__(self) -> None:
+        self._samples = defaultdict(lambda: {"update": [], "draw": []})
+
+    def add(self, scene: str, update_s: float, draw_s: float) -> None:
+        samples = self._samples[scene]
+        samples["update"].append(update_s)
+        samples["draw"].append(draw_s)
+
+    @staticmethod
+    def _summary(values: list[float]) -> dict[str, float]:
+        ordered = sorted(values)
+        n = len(ordered)
+        ms = 1000.0
+        return {
+            "mean_ms": sum(ordered) / n * ms,
+            "p50_ms": ordered[n // 2] * ms,
+            "p95_ms": ordered[min(n - 1, int(n * 0.95))] * ms,
+            "max_ms": ordered[-1] * ms,
+        }
+
+    def report(self) -> dict[str, dict]:
+        return {
+            scene: {
+                "frames": len(samples["update"]),
+                "update": self._summary(samples["update"]),
+                "draw": self._summary(samples["draw"]),
+            }
+            for scene, samples in self._samples.items()
+        }
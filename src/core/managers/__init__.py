@@ -1,6 +1,9 @@
 from .scene_manager import SceneManager
 from .input_manager import InputManager
 from .resource_manager import ResourceManager
+from .texture_atlas import TextureAtlas
 from .sound_manager import SoundManager
 from .game_manager import GameManager
-from .online_manager import OnlineManager
\ No newline at end of file
+from .online_manager import OnlineManager
+from .text_render_cache import TextRenderCache, CachedFont
+from .profiler import Profiler
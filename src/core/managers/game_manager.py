@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.maps.map import Map
+    from src.maps.map_loader import MapLoader
     from src.entities.player import Player
     from src.entities.enemy_trainer import EnemyTrainer
     from src.data.bag import Bag
@@ -18,13 +19,13 @@ class GameManager:
     
     # Map properties
     current_map_key: str
-    maps: dict[str, Map]
+    maps: MapLoader
     
     # Changing Scene properties
     should_change_scene: bool
     next_map: str
     
-    def __init__(self, maps: dict[str, Map], start_map: str, 
+    def __init__(self, maps: MapLoader, start_map: str, 
                  player: Player | None,
                  enemy_trainers: dict[str, list[EnemyTrainer]], 
                  bag: Bag | None = None):
@@ -46,7 +47,7 @@ class GameManager:
         
     @property
     def current_map(self) -> Map:
-        return self.maps[self.current_map_key]
+        return self.maps.get(self.current_map_key)
         
     @property
     def current_enemy_trainers(self) -> list[EnemyTrainer]:
@@ -54,7 +55,16 @@ class GameManager:
         
     @property
     def current_teleporter(self) -> list[Teleport]:
-        return self.maps[self.current_map_key].teleporters
+        return self.current_map.teleporters
+
+    @property
+    def nav_destinations(self) -> dict[str, tuple[str, tuple[int, int]]]:
+        # 導航目的地: 名稱 -> (地圖, tile 座標)，存在每張地圖的存檔 entry 裡
+        places = {}
+        for key in self.maps:
+            for d in self.maps.entry(key).get("destinations", []):
+                places[d["name"]] = (key, (int(d["x"]), int(d["y"])))
+        return places
     
     def switch_map(self, target: str) -> None:
         if target not in self.maps:
@@ -70,10 +80,12 @@ class GameManager:
             self.next_map = ""
             self.should_change_scene = False
             if self.player:
-                self.player.position = self.maps[self.current_map_key].spawn
+                self.player.position = self.current_map.spawn
+            # Warm up the maps the player can reach from here
+            self.maps.prefetch_neighbours(self.current_map_key)
             
     def check_collision(self, rect: pg.Rect) -> bool:
-        if self.maps[self.current_map_key].check_collision(rect):
+        if self.current_map.check_collision(rect):
             return True
         for entity in self.enemy_trainers[self.current_map_key]:
             if rect.colliderect(entity.animation.rect):
@@ -89,6 +101,10 @@ class GameManager:
         except Exception as e:
             Logger.warning(f"Failed to save game: {e}")
              
+    def shutdown(self) -> None:
+        """Stop background work (map prefetching) when this manager is replaced, e.g. by loading a save."""
+        self.maps.shutdown()
+
     @classmethod
     def load(cls, path: str) -> "GameManager | None":
         if not os.path.exists(path):
@@ -101,8 +117,17 @@ class GameManager:
 
     def to_dict(self) -> dict[str, object]:
         map_blocks: list[dict[str, object]] = []
-        for key, m in self.maps.items():
-            block = m.to_dict()
+        loaded = self.maps.loaded()
+        for key in self.maps:
+            if key in loaded:
+                block = loaded[key].to_dict()
+            else:
+                # Never visited: write the save entry back untouched
+                entry = self.maps.entry(key)
+                block = {k: entry[k] for k in ("path", "teleport", "player")}
+            destinations = self.maps.entry(key).get("destinations")
+            if destinations:
+                block["destinations"] = destinations
             block["enemy_trainers"] = [t.to_dict() for t in self.enemy_trainers.get(key, [])]
             '''spawn = self.player_spawns.get(key)
             block["player"] = {
@@ -119,20 +144,20 @@ class GameManager:
 
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> "GameManager":
-        from src.maps.map import Map
+        from src.maps.map_loader import MapLoader
         from src.entities.player import Player
         from src.entities.enemy_trainer import EnemyTrainer
         from src.data.bag import Bag
         
         Logger.info("Loading maps")
         maps_data = data["map"]
-        maps: dict[str, Map] = {}
+        entries: dict[str, dict] = {}
         player_spawns: dict[str, Position] = {}
         trainers: dict[str, list[EnemyTrainer]] = {}
 
         for entry in maps_data:
             path = entry["path"]
-            maps[path] = Map.from_dict(entry)
+            entries[path] = entry
             sp = entry.get("player")
             if sp:
                 player_spawns[path] = Position(
@@ -140,6 +165,10 @@ class GameManager:
                     sp["y"] * GameSettings.TILE_SIZE
                 )
         current_map = data["current_map"]
+        maps = MapLoader(entries)
+        # Startup only bakes the map the player stands on
+        maps.get(current_map)
+        maps.prefetch_neighbours(current_map)
         gm = cls(
             maps, current_map,
             None, # Player
@@ -0,0 +1,144 @@
+from __future__ import annotations
+import time
+import pygame as pg
+from collections import deque
+
+from src.utils import GameSettings
+
+
+class Profiler:
+    """
+    Frame profiler behind the F3 debug overlay (only when GameSettings.DEBUG).
+
+    Code marks sections with begin(name)/end(name) and bumps counters with
+    count(name, n). All hooks return immediately while the profiler is off,
+    so they can stay in the hot paths. Section times are summed per frame,
+    so a section may be entered several times in one frame.
+    """
+    HISTORY = 120                   # frames kept for the graph
+    TEXT_REFRESH = 0.25             # seconds between overlay text updates
+    SECTIONS = ("events", "update", "online", "draw", "draw.map", "draw.entities", "ui", "flip")
+
+    enabled: bool
+    history: deque[float]           # frame times in ms, oldest first
+    last_sections: dict[str, float] # ms per section of the last finished frame
+    last_counters: dict[str, int]
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.history = deque(maxlen=self.HISTORY)
+        self.last_sections = {}
+        self.last_counters = {}
+        self._starts: dict[str, float] = {}
+        self._sections: dict[str, float] = {}
+        self._counters: dict[str, int] = {}
+        self._frame_start = time.perf_counter()
+        self._font: pg.font.Font | None = None
+        self._text: pg.Surface | None = None
+        self._panel: pg.Surface | None = None
+        self._text_time = 0.0
+
+    def toggle(self) -> None:
+        if not GameSettings.DEBUG:
+            return
+        self.enabled = not self.enabled
+        self.history.clear()
+        self._starts.clear()
+        self._sections.clear()
+        self._counters.clear()
+        self._text = None
+        self._frame_start = time.perf_counter()
+
+    def begin(self, section: str) -> None:
+        if not self.enabled:
+            return
+        self._starts[section] = time.perf_counter()
+
+    def end(self, section: str) -> None:
+        if not self.enabled:
+            return
+        start = self._starts.pop(section, None)
+        if start is not None:
+            self._sections[section] = self._sections.get(section, 0.0) + (time.perf_counter() - start)
+
+    def count(self, counter: str, n: int = 1) -> None:
+        if not self.enabled:
+            return
+        self._counters[counter] = self._counters.get(counter, 0) + n
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.history.append((now - self._frame_start) * 1000.0)
+        self._frame_start = now
+        self.last_sections = {k: v * 1000.0 for k, v in self._sections.items()}
+        self.last_counters = self._counters
+        self._sections = {}
+        self._counters = {}
+
+    # Overlay
+    def draw(self, screen: pg.Surface) -> None:
+        if not self.enabled:
+            return
+        x, y = screen.get_width() - 270, 70
+        w, graph_h = 260, 60
+
+        if self._panel is None:
+            self._panel = pg.Surface((w, graph_h + 20), pg.SRCALPHA)
+            self._panel.fill((0, 0, 0, 170))
+        screen.blit(self._panel, (x, y))
+        self._draw_graph(screen, pg.Rect(x + 5, y + 5, w - 10, graph_h))
+
+        # Numbers change every frame; re-render them a few times a second only
+        now = time.perf_counter()
+        if self._text is None or now - self._text_time >= self.TEXT_REFRESH:
+            self._text = self._render_text(w)
+            self._text_time = now
+        screen.blit(self._text, (x, y + graph_h + 20))
+
+    def _draw_graph(self, screen: pg.Surface, rect: pg.Rect) -> None:
+        scale = rect.height / 50.0      # 50 ms at the top of the graph
+        for budget, color in ((1000.0 / 60, (0, 160, 0)), (1000.0 / 30, (160, 160, 0))):
+            by = rect.bottom - int(budget * scale)
+            pg.draw.line(screen, color, (rect.left, by), (rect.right, by), 1)
+
+        if len(self.history) < 2:
+            return
+        step = rect.width / (self.HISTORY - 1)
+        points = [
+            (rect.left + int(i * step), rect.bottom - min(rect.height, int(ms * scale)))
+            for i, ms in enumerate(self.history)
+        ]
+        pg.draw.lines(screen, (255, 255, 255), False, points, 1)
+
+    def _render_text(self, width: int) -> pg.Surface:
+        if self._font is None:
+            from src.core.services import resource_manager
+            self._font = resource_manager.get_font("Minecraft.ttf", 14)
+        font = self._font
+
+        frames = list(self.history)
+        avg = sum(frames) / len(frames) if frames else 0.0
+        worst = max(frames) if frames else 0.0
+        # (label, value) rows; the font is proportional, so values are right-aligned
+        rows = [
+            ("frame", f"{avg:.1f} ms"),
+            ("worst", f"{worst:.1f} ms"),
+            ("fps", f"{1000.0 / avg if avg else 0:.0f}"),
+        ]
+        for name in self.SECTIONS:
+            if name in self.last_sections:
+                rows.append((f"  {name}", f"{self.last_sections[name]:.2f} ms"))
+        for name, value in sorted(self.last_counters.items()):
+            rows.append((name, str(value)))
+
+        line_h = font.get_linesize()
+        surf = pg.Surface((width, line_h * len(rows) + 6), pg.SRCALPHA)
+        surf.fill((0, 0, 0, 170))
+        for i, (label, value) in enumerate(rows):
+            y = 3 + i * line_h
+            surf.blit(font.render(label, True, (255, 255, 255)), (5, y))
+            value_surf = font.render(value, True, (255, 255, 255))
+            surf.blit(value_surf, (width - 5 - value_surf.get_width(), y))
+        return surf
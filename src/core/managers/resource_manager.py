@@ -1,19 +1,69 @@
 import pygame as pg
-from src.utils import load_img, load_font, load_sound
+from src.utils import Logger, load_img, load_font, load_sound
+from src.utils.loader import ASSETS_DIR
+from .texture_atlas import TextureAtlas
 
 class ResourceManager:
     """
     Make sure you are not loading the resource twice
     If the resource is already loaded, you can use the loaded image instead of loading it again.
+
+    UI images (ATLAS_FOLDERS) live in a TextureAtlas once load_atlas() has
+    run, and get_image() hands out views into its sheets. Scaled variants are
+    made once per (path, size) and shared, so treat every image as read-only.
     """
+    ATLAS_FOLDERS = ["UI", "ingame_ui"]
+    ATLAS_INDEX = "atlas/ui.json"    # prebuilt sheets (python main.py --build-atlas)
+
     def __init__(self) -> None:
         self._images: dict[str, pg.Surface] = {}
+        self._scaled: dict[tuple[str, tuple[int, int]], pg.Surface] = {}
+        self.atlas: TextureAtlas | None = None
         self._sounds: dict[str, pg.mixer.Sound] = {}
         self._fonts: dict[tuple[str, int], pg.font.Font] = {}
+        self._frames: dict[tuple[str, tuple[str, ...], int, tuple[int, int]], dict[str, tuple[pg.Surface, ...]]] = {}
+
+    def load_atlas(self) -> None:
+        """Pack the UI images, or load the prebuilt sheets. Needs a display mode (convert_alpha)."""
+        if (ASSETS_DIR / "images" / self.ATLAS_INDEX).exists():
+            Logger.info(f"Loading texture atlas: {self.ATLAS_INDEX}")
+            self.atlas = TextureAtlas.load(self.ATLAS_INDEX)
+        else:
+            self.atlas = TextureAtlas.build(self.ATLAS_FOLDERS)
+
+    @classmethod
+    def build_atlas(cls) -> TextureAtlas:
+        """Pack the UI images from scratch and save the sheets to ATLAS_INDEX."""
+        atlas = TextureAtlas.build(cls.ATLAS_FOLDERS)
+        atlas.save(cls.ATLAS_INDEX)
+        return atlas
+
+    def get_image(self, path: str, size: tuple[int, int] | None = None) -> pg.Surface:
+        """
+        Image under assets/images (a leading "assets/images/" is accepted too),
+        optionally scaled to size.
+        """
+        path = path.removeprefix("assets/images/")
+        if size is None:
+            return self._get_base_image(path)
 
-    def get_image(self, path: str) -> pg.Surface:
+        size = (int(size[0]), int(size[1]))
+        key = (path, size)
+        if key not in self._scaled:
+            base = self._get_base_image(path)
+            if base.get_size() == size:
+                self._scaled[key] = base
+            else:
+                scaled = pg.transform.scale(base, size)
+                if self.atlas is not None and path in self.atlas and self.atlas.fits(size):
+                    scaled = self.atlas.add(f"{path}@{size[0]}x{size[1]}", scaled)
+                self._scaled[key] = scaled
+        return self._scaled[key]
+
+    def _get_base_image(self, path: str) -> pg.Surface:
         if path not in self._images:
-            self._images[path] = load_img(path)
+            view = self.atlas.get(path) if self.atlas is not None else None
+            self._images[path] = view if view is not None else load_img(path)
         return self._images[path]
 
     def get_sound(self, path: str) -> pg.mixer.Sound:
@@ -27,8 +77,38 @@ class ResourceManager:
             self._fonts[key] = load_font(path, size)
         return self._fonts[key]
 
+    def get_animation_frames(
+        self, path: str, rows: list[str], n_keyframes: int, size: tuple[int, int]
+    ) -> dict[str, tuple[pg.Surface, ...]]:
+        """
+        Cut a sprite sheet into scaled frames, once per (sheet, rows, keyframes, size).
+        Every Animation made from the same sheet shares the returned frames,
+        so treat them as read-only.
+        """
+        key = (path, tuple(rows), n_keyframes, (size[0], size[1]))
+        if key not in self._frames:
+            sheet = self.get_image(path)
+            sheet_w, sheet_h = sheet.get_size()
+            frame_w = sheet_w // n_keyframes
+            frame_h = sheet_h // len(rows)
+
+            frames: dict[str, tuple[pg.Surface, ...]] = {}
+            for r, name in enumerate(rows):
+                frames[name] = tuple(
+                    pg.transform.smoothscale(
+                        sheet.subsurface(pg.Rect(c * frame_w, r * frame_h, frame_w, frame_h)),
+                        key[3]
+                    )
+                    for c in range(n_keyframes)
+                )
+            self._frames[key] = frames
+        return self._frames[key]
+
     def clear(self) -> None:
         """Clear all cached assets (useful when switching levels)."""
         self._images.clear()
+        self._scaled.clear()
         self._sounds.clear()
         self._fonts.clear()
+        self._frames.clear()
+
@@ -7,7 +7,9 @@ class SceneManager:
     
     _scenes: dict[str, Scene]
     _current_scene: Scene | None = None
+    _current_name: str | None = None
     _next_scene: str | None = None
+    alpha: float = 1.0  # Render interpolation between the last two fixed updates
     
     def __init__(self):
         Logger.info("Initializing SceneManager")
@@ -23,6 +25,10 @@ class SceneManager:
         elif hasattr(scene, "handle_event"):
             scene.handle_event(event)
         
+    @property
+    def current_scene_name(self) -> str | None:
+        return self._current_name
+
     def register_scene(self, name: str, scene: Scene) -> None:
         self._scenes[name] = scene
         
@@ -46,6 +52,19 @@ class SceneManager:
         if self._current_scene:
             self._current_scene.draw(screen)
             
+    @property
+    def uses_dirty_rects(self) -> bool:
+        return self._current_scene is not None and self._current_scene.uses_dirty_rects
+
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        if self._current_scene is None:
+            return None
+        return self._current_scene.dirty_rects()
+
+    def request_full_redraw(self) -> None:
+        if self._current_scene:
+            self._current_scene.request_full_redraw()
+            
     def _perform_scene_switch(self) -> None:
         if self._next_scene is None:
             return
@@ -55,6 +74,7 @@ class SceneManager:
             self._current_scene.exit()
         
         self._current_scene = self._scenes[self._next_scene]
+        self._current_name = self._next_scene
         
         # Enter new scene
         if self._current_scene:
@@ -0,0 +1,117 @@
+from __future__ import annotations
+import pygame as pg
+from collections import OrderedDict
+
+from src.utils import Logger
+
+Color = tuple[int, ...]
+TextKey = tuple[str, int, str, Color, bool]
+
+
+class CachedFont:
+    """
+    Drop-in stand-in for pg.font.Font.render() that goes through a TextRenderCache.
+    Scenes keep holding "a font" (self.font_label = text_cache.font(...)) and call
+    .render(text, antialias, color) like before.
+    """
+    def __init__(self, cache: TextRenderCache, font_name: str, size: int):
+        self._cache = cache
+        self.font_name = font_name
+        self.size = size
+
+    def render(self, text: str, antialias: bool, color: Color) -> pg.Surface:
+        return self._cache.render(self.font_name, self.size, text, color, antialias)
+
+
+class TextRenderCache:
+    """
+    LRU cache of rendered text surfaces keyed by (font, size, text, color, antialias).
+
+    Labels such as names, levels and button captions barely change between
+    frames, so render them once and reuse the surface. The cache holds at most
+    `budget` bytes of pixels; the least recently used surfaces are dropped first.
+
+    Font names ending in .ttf/.otf are loaded from assets/fonts through the
+    ResourceManager, anything else is treated as a system font name.
+    Returned surfaces are shared: blit them, don't draw on them.
+    """
+    DEFAULT_BUDGET = 8 * 1024 * 1024
+
+    _surfaces: OrderedDict[TextKey, pg.Surface]
+    _sysfonts: dict[tuple[str, int], pg.font.Font]
+
+    def __init__(self, budget: int = DEFAULT_BUDGET) -> None:
+        self.budget = budget
+        self._surfaces = OrderedDict()
+        self._sysfonts = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def font(self, font_name: str, size: int) -> CachedFont:
+        return CachedFont(self, font_name, size)
+
+    def render(
+        self, font_name: str, size: int, text: str,
+        color: Color, antialias: bool = True
+    ) -> pg.Surface:
+        key = (font_name, size, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        from src.core.services import profiler
+        profiler.count("text renders")
+        surf = self._get_font(font_name, size).render(text, antialias, color)
+        self._surfaces[key] = surf
+        self._bytes += self._surface_bytes(surf)
+        self._evict()
+        return surf
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._surfaces),
+            "bytes": self._bytes,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self._bytes = 0
+
+    def _get_font(self, font_name: str, size: int) -> pg.font.Font:
+        if font_name.lower().endswith((".ttf", ".otf")):
+            from src.core.services import resource_manager
+            return resource_manager.get_font(font_name, size)
+
+        key = (font_name, size)
+        if key not in self._sysfonts:
+            Logger.info(f"Loading system font: {font_name} ({size})")
+            self._sysfonts[key] = pg.font.SysFont(font_name, size)
+        return self._sysfonts[key]
+
+    def _evict(self) -> None:
+        # Always keep the newest entry, even if it alone is over budget
+        while self._bytes > self.budget and len(self._surfaces) > 1:
+            _, surf = self._surfaces.popitem(last=False)
+            self._bytes -= self._surface_bytes(surf)
+            self.evictions += 1
+
+    @staticmethod
+    def _surface_bytes(surf: pg.Surface) -> int:
+        return surf.get_pitch() * surf.get_height()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+import json
+import pygame as pg
+from pathlib import Path
+
+from src.utils import Logger, load_img
+from src.utils.loader import ASSETS_DIR
+
+
+class _Sheet:
+    """One atlas page, filled with a shelf packer (rows of images, left to right)."""
+    def __init__(self, size: int, surface: pg.Surface | None = None) -> None:
+        self.size = size
+        self.surface = surface if surface is not None else pg.Surface((size, size), pg.SRCALPHA)
+        self.shelves: list[list[int]] = []  # [y, height, next free x]
+        self.next_y = 0
+        self.used = 0                       # pixels handed out
+
+    def place(self, w: int, h: int) -> pg.Rect | None:
+        # Shortest shelf that is tall enough and still has room
+        best = None
+        for shelf in self.shelves:
+            y, shelf_h, x = shelf
+            if h <= shelf_h and x + w <= self.size and (best is None or shelf_h < best[1]):
+                best = shelf
+        if best is None:
+            if self.next_y + h > self.size or w > self.size:
+                return None
+            best = [self.next_y, h, 0]
+            self.shelves.append(best)
+            self.next_y += h
+
+        rect = pg.Rect(best[2], best[0], w, h)
+        best[2] += w
+        self.used += w * h
+        return rect
+
+
+class TextureAtlas:
+    """
+    Packs many small images into a few large sheets.
+
+    Every entry is handed out as a subsurface of its sheet, so all users of
+    an image share the same pixels and the per-surface overhead of dozens
+    of tiny images goes away. Entries are read-only: blit them, never draw
+    on them. Images larger than MAX_ENTRY on either side are not packed.
+
+    The sheets can be saved next to a JSON index (save()) and loaded again
+    with TextureAtlas.load(), which skips decoding every source image.
+    """
+    SHEET_SIZE = 512
+    MAX_ENTRY = 256
+
+    _sheets: list[_Sheet]
+    _entries: dict[str, tuple[int, pg.Rect]]
+    _views: dict[str, pg.Surface]
+
+    def __init__(self, sheet_size: int = SHEET_SIZE) -> None:
+        self.sheet_size = sheet_size
+        self._sheets = []
+        self._entries = {}
+        self._views = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def fits(self, size: tuple[int, int]) -> bool:
+        return max(size) <= min(self.MAX_ENTRY, self.sheet_size)
+
+    def get(self, key: str) -> pg.Surface | None:
+        return self._views.get(key)
+
+    def add(self, key: str, image: pg.Surface) -> pg.Surface | None:
+        """Copy image into a sheet and return its view, or None if it is too big to pack."""
+        if key in self._views:
+            return self._views[key]
+        w, h = image.get_size()
+        if not self.fits((w, h)):
+            return None
+
+        for index, sheet in enumerate(self._sheets):
+            rect = sheet.place(w, h)
+            if rect is not None:
+                break
+        else:
+            self._sheets.append(_Sheet(self.sheet_size))
+            index = len(self._sheets) - 1
+            rect = self._sheets[index].place(w, h)
+
+        sheet = self._sheets[index].surface
+        # The target area is fully transparent, so MAX copies the pixels
+        # (alpha included) instead of blending them onto black
+        sheet.blit(image, rect, special_flags=pg.BLEND_RGBA_MAX)
+        self._entries[key] = (index, rect)
+        self._views[key] = sheet.subsurface(rect)
+        return self._views[key]
+
+    @classmethod
+    def build(cls, folders: list[str], sheet_size: int = SHEET_SIZE) -> TextureAtlas:
+        """Pack every .png directly inside the given folders (relative to assets/images)."""
+        atlas = cls(sheet_size)
+        images: list[tuple[str, pg.Surface]] = []
+        for folder in folders:
+            for file in sorted((ASSETS_DIR / "images" / folder).glob("*.png")):
+                images.append((f"{folder}/{file.name}", load_img(f"{folder}/{file.name}")))
+
+        # Tallest first keeps the shelves tight
+        images.sort(key=lambda item: (item[1].get_height(), item[1].get_width()), reverse=True)
+        for key, image in images:
+            atlas.add(key, image)
+        Logger.info(f"Built texture atlas: {len(atlas)} images in {len(atlas._sheets)} sheet(s)")
+        return atlas
+
+    def save(self, index_path: str) -> None:
+        """Write the sheets as <name>_<n>.png and the index as <name>.json (relative to assets/images)."""
+        index_file = ASSETS_DIR / "images" / index_path
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        sheets = []
+        for i, sheet in enumerate(self._sheets):
+            name = f"{index_file.stem}_{i}.png"
+            pg.image.save(sheet.surface, str(index_file.parent / name))
+            sheets.append(name)
+
+        data = {
+            "sheet_size": self.sheet_size,
+            "sheets": sheets,
+            "entries": {key: [i, *rect] for key, (i, rect) in self._entries.items()},
+        }
+        with open(index_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    @classmethod
+    def load(cls, index_path: str) -> TextureAtlas:
+        """Load sheets written by save(). New entries can still be added afterwards."""
+        index_file = ASSETS_DIR / "images" / index_path
+        with open(index_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        atlas = cls(data["sheet_size"])
+        folder = Path(index_path).parent.as_posix()
+        for name in data["sheets"]:
+            atlas._sheets.append(_Sheet(atlas.sheet_size, load_img(f"{folder}/{name}")))
+        for key, (i, x, y, w, h) in data["entries"].items():
+            rect = pg.Rect(x, y, w, h)
+            atlas._entries[key] = (i, rect)
+            atlas._views[key] = atlas._sheets[i].surface.subsurface(rect)
+
+        # Saved sheets are full as far as the packer knows; later entries go to new sheets
+        for sheet in atlas._sheets:
+            sheet.next_y = sheet.size
+        return atlas
+
+    def stats(self) -> dict[str, int]:
+        used = sum(sheet.used for sheet in self._sheets)
+        return {
+            "entries": len(self._entries),
+            "sheets": len(self._sheets),
+            "bytes": sum(sheet.surface.get_pitch() * sheet.surface.get_height() for sheet in self._sheets),
+            "used_pixels": used,
+        }
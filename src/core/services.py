@@ -1,6 +1,8 @@
-from .managers import InputManager, ResourceManager, SceneManager, SoundManager
+from .managers import InputManager, ResourceManager, SceneManager, SoundManager, TextRenderCache, Profiler
 
 input_manager = InputManager()
 resource_manager = ResourceManager()
 scene_manager = SceneManager()
 sound_manager = SoundManager()
+text_cache = TextRenderCache()
+profiler = Profiler()
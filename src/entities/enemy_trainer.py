@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import override
 
 from .entity import Entity
-from src.sprites import Sprite
+from src.sprites import Sprite, RenderQueue
 from src.core import GameManager
 from src.core.services import input_manager, scene_manager
 from src.utils import GameSettings, Direction, Position, PositionCamera
@@ -13,6 +13,7 @@ from src.utils import GameSettings, Direction, Position, PositionCamera
 
 class EnemyTrainerClassification(Enum):
     STATIONARY = "stationary"
+    ROAMING = "roaming"       # walks its patrol route; moved by RoamingCrowd
 
 @dataclass
 class IdleMovement:
@@ -20,12 +21,16 @@ class IdleMovement:
         return
 
 class EnemyTrainer(Entity):
+    VIEW_TILES = 3      # 玩家距離多少格會被看到（牆後面看不到，見 TrainerTable）
+
     classification: EnemyTrainerClassification
     max_tiles: int | None
+    patrol: list[tuple[int, int]]
     _movement: IdleMovement
     warning_sign: Sprite
-    detected: bool
+    detected: bool                  # set by the map's TrainerTable
     los_direction: Direction
+    los_tiles: list[tuple[int, int]]
 
     @override
     def __init__(
@@ -36,6 +41,7 @@ class EnemyTrainer(Entity):
         classification: EnemyTrainerClassification = EnemyTrainerClassification.STATIONARY,
         max_tiles: int | None = 2,
         facing: Direction | None = None,
+        patrol: list[tuple[int, int]] | None = None,
     ) -> None:
         super().__init__(x, y, game_manager)
         self.monster = {
@@ -47,34 +53,53 @@ class EnemyTrainer(Entity):
         }
         self.classification = classification
         self.max_tiles = max_tiles
+        self.patrol = list(patrol) if patrol else []
         if classification == EnemyTrainerClassification.STATIONARY:
             self._movement = IdleMovement()
             if facing is None:
                 raise ValueError("Idle EnemyTrainer requires a 'facing' Direction at instantiation")
             self._set_direction(facing)
+        elif classification == EnemyTrainerClassification.ROAMING:
+            # 不自己走：整張地圖的 roaming trainer 由 RoamingCrowd 一次批次移動
+            self._movement = IdleMovement()
+            if not self.patrol:
+                raise ValueError("Roaming EnemyTrainer requires a 'patrol' route at instantiation")
+            self._set_direction(facing or Direction.DOWN)
         else:
             raise ValueError("Invalid classification")
         self.warning_sign = Sprite("exclamation.png", (GameSettings.TILE_SIZE // 2, GameSettings.TILE_SIZE // 2))
         self.warning_sign.update_pos(Position(x + GameSettings.TILE_SIZE // 4, y - GameSettings.TILE_SIZE // 2))
         self.detected = False
+        self.los_tiles = []
 
     @override
     def update(self, dt: float) -> None:
         self._movement.update(self, dt)
-        self._has_los_to_player()
         if self.detected and input_manager.key_pressed(pygame.K_SPACE):
             pass
         self.animation.update_pos(self.position)
+        if self.detected and self.classification == EnemyTrainerClassification.ROAMING:
+            tile = GameSettings.TILE_SIZE
+            self.warning_sign.update_pos(Position(self.position.x + tile // 4, self.position.y - tile // 2))
 
     @override
     def draw(self, screen: pygame.Surface, camera: PositionCamera) -> None:
         super().draw(screen, camera)
         if self.detected:
             self.warning_sign.draw(screen, camera)
-        if GameSettings.DRAW_HITBOXES:
-            los_rect = self._get_los_rect()
-            if los_rect is not None:
-                pygame.draw.rect(screen, (255, 255, 0), camera.transform_rect(los_rect), 1)
+
+    @override
+    def queue_draw(self, queue: RenderQueue, alpha: float = 1.0) -> None:
+        super().queue_draw(queue, alpha)
+        if self.detected:
+            queue.submit(self.warning_sign.image, self.warning_sign.rect.topleft, RenderQueue.LAYER_OVERLAY)
+
+    @override
+    def draw_debug(self, screen: pygame.Surface, camera: PositionCamera) -> None:
+        super().draw_debug(screen, camera)
+        tile = GameSettings.TILE_SIZE
+        for x, y in self.los_tiles:
+            pygame.draw.rect(screen, (255, 255, 0), camera.transform_rect(pygame.Rect(x * tile, y * tile, tile, tile)), 1)
 
     def _set_direction(self, direction: Direction) -> None:
         self.direction = direction
@@ -88,60 +113,6 @@ class EnemyTrainer(Entity):
             self.animation.switch("up")
         self.los_direction = self.direction
 
-    def _get_los_rect(self) -> pygame.Rect | None:
-        '''
-        TODO: Create hitbox to detect line of sight of the enemies towards the player
-        '''
-        tile = GameSettings.TILE_SIZE
-        view_tiles = 3    # 玩家距離多少格會被看到
-
-        x, y = self.position.x, self.position.y
-
-        if self.los_direction == Direction.RIGHT:
-            return pygame.Rect(x + tile, y, tile * view_tiles, tile)
-
-        if self.los_direction == Direction.LEFT:
-            return pygame.Rect(x - tile * view_tiles, y, tile * view_tiles, tile)
-
-        if self.los_direction == Direction.DOWN:
-            return pygame.Rect(x, y + tile, tile, tile * view_tiles)
-
-        if self.los_direction == Direction.UP:
-            return pygame.Rect(x, y - tile * view_tiles, tile, tile * view_tiles)
-
-        return None
-
-    def _has_los_to_player(self) -> None:
-        player = self.game_manager.player
-        if player is None:
-            self.detected = False
-            return
-        los_rect = self._get_los_rect()
-        if los_rect is None:
-            self.detected = False
-            return
-        '''
-        TODO: Implement line of sight detection
-        If it's detected, set self.detected to True
-        '''
-        player = self.game_manager.player
-        if player is None:
-            self.detected = False
-            return
-
-        los_rect = self._get_los_rect()
-        if los_rect is None:
-            self.detected = False
-            return
-
-        # 玩家 hitbox
-        px, py = player.position.x, player.position.y
-        tile = GameSettings.TILE_SIZE
-        player_rect = pygame.Rect(px, py, tile, tile)
-
-        # 只要撞到視線範圍就是 detected
-        self.detected = los_rect.colliderect(player_rect)
-
     @classmethod
     @override
     def from_dict(cls, data: dict, game_manager: GameManager) -> "EnemyTrainer":
@@ -156,6 +127,7 @@ class EnemyTrainer(Entity):
                 facing = facing_val
         if facing is None and classification == EnemyTrainerClassification.STATIONARY:
             facing = Direction.DOWN
+        patrol = [(int(p["x"]), int(p["y"])) for p in data.get("patrol", [])]
         return cls(
             data["x"] * GameSettings.TILE_SIZE,
             data["y"] * GameSettings.TILE_SIZE,
@@ -163,6 +135,7 @@ class EnemyTrainer(Entity):
             classification,
             max_tiles,
             facing,
+            patrol,
         )
 
     @override
@@ -171,4 +144,6 @@ class EnemyTrainer(Entity):
         base["classification"] = self.classification.value
         base["facing"] = self.direction.name
         base["max_tiles"] = self.max_tiles
+        if self.patrol:
+            base["patrol"] = [{"x": x, "y": y} for x, y in self.patrol]
         return base
\ No newline at end of file
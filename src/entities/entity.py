@@ -1,7 +1,7 @@
 from __future__ import annotations
 import pygame as pg
 from typing import override
-from src.sprites import Animation
+from src.sprites import Animation, RenderQueue
 from src.utils import Position, PositionCamera, Direction, GameSettings
 from src.core import GameManager
 
@@ -10,6 +10,7 @@ class Entity:
     animation: Animation
     direction: Direction
     position: Position
+    _prev_position: Position    # position at the start of the last fixed update
     game_manager: GameManager
     
     def __init__(self, x: float, y: float, game_manager: GameManager) -> None:
@@ -20,6 +21,7 @@ class Entity:
         )
         
         self.position = Position(x, y)
+        self._prev_position = Position(x, y)
         self.direction = Direction.DOWN
         self.animation.update_pos(self.position)
         self.game_manager = game_manager
@@ -31,7 +33,26 @@ class Entity:
     def draw(self, screen: pg.Surface, camera: PositionCamera) -> None:
         self.animation.draw(screen, camera)
         if GameSettings.DRAW_HITBOXES:
-            self.animation.draw_hitbox(screen, camera)
+            self.draw_debug(screen, camera)
+
+    def snapshot(self) -> None:
+        """Remember the current position; call before each fixed update step."""
+        self._prev_position = Position(self.position.x, self.position.y)
+
+    def render_position(self, alpha: float = 1.0) -> Position:
+        """Position blended between the last two updates for drawing."""
+        prev, cur = self._prev_position, self.position
+        # Teleports and map switches jump, don't slide across the map
+        if abs(cur.x - prev.x) > GameSettings.TILE_SIZE or abs(cur.y - prev.y) > GameSettings.TILE_SIZE:
+            return cur
+        return Position(prev.x + (cur.x - prev.x) * alpha, prev.y + (cur.y - prev.y) * alpha)
+
+    def queue_draw(self, queue: RenderQueue, alpha: float = 1.0) -> None:
+        pos = self.render_position(alpha)
+        queue.submit(self.animation.current_frame(), (round(pos.x), round(pos.y)), RenderQueue.LAYER_ENTITIES)
+
+    def draw_debug(self, screen: pg.Surface, camera: PositionCamera) -> None:
+        self.animation.draw_hitbox(screen, camera)
         
     @staticmethod
     def _snap_to_grid(value: float) -> int:
@@ -43,8 +64,14 @@ class Entity:
         [TODO HACKATHON 3]
         Implement the correct algorithm of player camera
         '''
-        cam_x = int(self.position.x - GameSettings.SCREEN_WIDTH // 2)
-        cam_y = int(self.position.y - GameSettings.SCREEN_HEIGHT // 2)
+        return self._camera_at(self.position)
+
+    def render_camera(self, alpha: float = 1.0) -> PositionCamera:
+        return self._camera_at(self.render_position(alpha))
+
+    def _camera_at(self, position: Position) -> PositionCamera:
+        cam_x = int(position.x - GameSettings.SCREEN_WIDTH // 2)
+        cam_y = int(position.y - GameSettings.SCREEN_HEIGHT // 2)
 
         # 地圖實際像素大小
         map_surface = self.game_manager.current_map._surface
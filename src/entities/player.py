@@ -96,46 +96,53 @@ class Player(Entity):
             self.position.y = self._snap_to_grid(self.position.y)
         
         
-        # Teleportation (ONLY here)
+        # Teleportation
+        self.try_teleport()
+
+        super().update(dt)
+        # print(
+        #     "Player tile:",
+        #     int(self.position.x // GameSettings.TILE_SIZE),
+        #     int(self.position.y // GameSettings.TILE_SIZE)
+        # )
+
+    def try_teleport(self) -> bool:
+        """
+        Switch map if the player stands on a teleporter. Called from update()
+        and by the auto navigation follower, which moves the player itself.
+        """
         # Use game_manager.teleport_cooldown to avoid double-trigger / instant bounce
         if not hasattr(self.game_manager, "teleport_cooldown"):
             self.game_manager.teleport_cooldown = 0.0
 
-        if self.game_manager.teleport_cooldown <= 0:
-            tp = self.game_manager.current_map.check_teleport(self.position)
-            if tp:
-                self.game_manager.teleport_cooldown = 0.6  # 先用大一點，穩定後再調回 0.35
-
-                print("[TP] before switch:", self.game_manager.current_map.path_name, "->", tp.destination)
+        if self.game_manager.teleport_cooldown > 0:
+            return False
+        tp = self.game_manager.current_map.check_teleport(self.position)
+        if not tp:
+            return False
 
-                # 告訴 game_manager 要切去哪
-                self.game_manager.switch_map(tp.destination)
+        self.game_manager.teleport_cooldown = 0.6  # 先用大一點，穩定後再調回 0.35
 
-                # 真正執行切圖
-                self.game_manager.try_switch_map()
+        print("[TP] before switch:", self.game_manager.current_map.path_name, "->", tp.destination)
 
-                print("[TP] after switch:", self.game_manager.current_map.path_name)
+        # 告訴 game_manager 要切去哪
+        self.game_manager.switch_map(tp.destination)
 
-                # 落點（dest_pos 或 spawn）
-                if getattr(tp, "dest_pos", None) is not None:
-                    self.position = tp.dest_pos.copy()
-                else:
-                    self.position = self.game_manager.current_map.spawn.copy()
+        # 真正執行切圖
+        self.game_manager.try_switch_map()
 
-                # snap
-                self.position.x = self._snap_to_grid(self.position.x)
-                self.position.y = self._snap_to_grid(self.position.y)
+        print("[TP] after switch:", self.game_manager.current_map.path_name)
 
-                super().update(dt)
-                return
+        # 落點（dest_pos 或 spawn）
+        if getattr(tp, "dest_pos", None) is not None:
+            self.position = tp.dest_pos.copy()
+        else:
+            self.position = self.game_manager.current_map.spawn.copy()
 
-                
-        super().update(dt)
-        # print(
-        #     "Player tile:",
-        #     int(self.position.x // GameSettings.TILE_SIZE),
-        #     int(self.position.y // GameSettings.TILE_SIZE)
-        # )
+        # snap
+        self.position.x = self._snap_to_grid(self.position.x)
+        self.position.y = self._snap_to_grid(self.position.y)
+        return True
 
 
     @override
@@ -0,0 +1,197 @@
+from __future__ import annotations
+from array import array
+from typing import TYPE_CHECKING, Iterable
+
+from src.navigation import DistanceFieldCache, FlowField
+from src.navigation.flow_field import STAY, UP, DOWN, LEFT, RIGHT, STEP_X, STEP_Y
+from src.utils import Direction, GameSettings, SpatialGrid
+from .enemy_trainer import EnemyTrainer, EnemyTrainerClassification
+from .trainer_table import TrainerTable
+
+if TYPE_CHECKING:
+    from src.maps.map import Map
+    from src.entities.player import Player
+
+_FACING = {UP: Direction.UP, DOWN: Direction.DOWN, LEFT: Direction.LEFT, RIGHT: Direction.RIGHT}
+
+
+class RoamingCrowd:
+    """
+    Moves every roaming trainer of one map in a single batched pass.
+
+    Positions, the tile each trainer is walking to and its current step
+    live in flat arrays. Trainers walk tile to tile; on reaching a tile
+    they read the next step from the FlowField of their current patrol
+    point. A frame costs one lookup per trainer however many there are, and
+    trainers heading for the same point share one field.
+
+    The crowd also keeps every trainer of the map in the walkable grid's
+    obstacle overlay: stationary ones on their tile for as long as the crowd
+    exists (release() takes them off), roaming ones on the tile they stand
+    on plus the tile they are walking into. Roaming trainers wait for
+    whatever occupies the next tile (each other, the shop NPC, the player)
+    instead of overlapping; one that waits too long moves on to its next
+    patrol point. Stationary trainers and teleporters are also routed around.
+
+    With a TrainerTable, a trainer's line of sight is moved to the tile it
+    steps towards (and turned) when it starts each step.
+    """
+    SPEED = 2.0 * GameSettings.TILE_SIZE    # px/s，玩家是 4 格/秒
+    MAX_WAIT = 2.0                          # 卡住幾秒就換下一個巡邏點
+    MAX_ELAPSED = 0.25                      # 一次 update 最多算幾秒（排程器降頻時）
+
+    trainers: list[EnemyTrainer]
+    fields: DistanceFieldCache
+    xs: array
+    ys: array
+    tile_x: array               # tile being walked to (or stood on)
+    tile_y: array
+    stepping: bytearray         # step code while between tiles, STAY when on one
+    goal_index: array           # index into the trainer's patrol
+    waited: array
+
+    def __init__(self, game_map: Map, trainers: list[EnemyTrainer], table: TrainerTable | None = None):
+        tile = GameSettings.TILE_SIZE
+        self.game_map = game_map
+        self.table = table
+        self.grid = game_map.walkable_grid
+        self.trainers = [t for t in trainers if t.classification == EnemyTrainerClassification.ROAMING]
+        self._row = {trainer: i for i, trainer in enumerate(self.trainers)}
+        self.fields = DistanceFieldCache(field_type=FlowField)
+
+        index = game_map.tile_index
+        self._stationary = self.grid.blocked_indices(
+            (int(t.position.x // tile), int(t.position.y // tile))
+            for t in trainers if t.classification != EnemyTrainerClassification.ROAMING
+        )
+        self._avoid = frozenset(self.grid.blocked_indices(index.tiles(index.TELEPORT)) | self._stationary)
+
+        n = len(self.trainers)
+        self.xs = array("d", (t.position.x for t in self.trainers))
+        self.ys = array("d", (t.position.y for t in self.trainers))
+        self.tile_x = array("i", (round(t.position.x / tile) for t in self.trainers))
+        self.tile_y = array("i", (round(t.position.y / tile) for t in self.trainers))
+        self.stepping = bytearray(n)
+        self.goal_index = array("H", [0]) * n
+        self.waited = array("d", [0.0]) * n
+        self._field: list[FlowField | None] = [None] * n
+        w = self.grid.width
+        self.grid.add_obstacle(self._stationary)
+        self.grid.add_obstacle(ty * w + tx for tx, ty in zip(self.tile_x, self.tile_y))
+
+    def __len__(self) -> int:
+        return len(self.trainers)
+
+    def release(self) -> None:
+        """Take every trainer of the crowd off the grid's overlay (when the crowd is replaced)."""
+        w = self.grid.width
+        tiles = list(self._stationary)
+        for i, code in enumerate(self.stepping):
+            tx, ty = self.tile_x[i], self.tile_y[i]
+            tiles.append(ty * w + tx)
+            if code:
+                tiles.append((ty - STEP_Y[code]) * w + tx - STEP_X[code])
+        self.grid.remove_obstacle(tiles)
+        self._stationary = set()
+        self.trainers = []
+        self._row = {}
+
+    def update(
+        self, dt: float, player: Player | None = None, spatial: SpatialGrid | None = None,
+        due: Iterable[tuple[EnemyTrainer, float]] | None = None,
+    ) -> None:
+        """
+        One step for every roaming trainer; snapshots them first, like the
+        player. With `due` ((trainer, elapsed) pairs from an EntityScheduler)
+        only those trainers move, each by its own elapsed time.
+        """
+        tile = GameSettings.TILE_SIZE
+        w = self.grid.width
+        if due is None:
+            steps = [(i, trainer, dt) for i, trainer in enumerate(self.trainers)]
+        else:
+            row = self._row
+            steps = [(row[trainer], trainer, elapsed) for trainer, elapsed in due if trainer in row]
+        px, py = (player.position.x, player.position.y) if player is not None else (-1e9, -1e9)
+        xs, ys = self.xs, self.ys
+        tile_x, tile_y = self.tile_x, self.tile_y
+        stepping, grid = self.stepping, self.grid
+        occupied = grid.occupied
+
+        for i, trainer, dt in steps:
+            trainer.snapshot()
+            # 看到玩家就停下來等對戰
+            if trainer.detected:
+                continue
+            # 中距離的 trainer 一次拿到好幾個 frame 的時間：封頂，免得一口氣跳過整段等待
+            dt = min(dt, self.MAX_ELAPSED)
+            x, y = xs[i], ys[i]
+            budget = self.SPEED * dt
+
+            # 走到一格後剩下的距離接著走下一格（降頻更新時才不會比較慢）
+            while budget > 0:
+                tx, ty = tile_x[i], tile_y[i]
+                if not stepping[i]:
+                    # 站在 tile 上：查 flow field 決定下一步
+                    code = self._field_of(i).flow[ty * w + tx]
+                    if code == STAY:
+                        self._next_patrol_point(i)
+                        break
+                    nx, ny = tx + STEP_X[code], ty + STEP_Y[code]
+                    n = ny * w + nx
+                    if occupied[n] or (abs(nx * tile - px) < tile and abs(ny * tile - py) < tile):
+                        self.waited[i] += dt
+                        if self.waited[i] > self.MAX_WAIT:
+                            self._next_patrol_point(i)
+                        break
+                    self.waited[i] = 0.0
+                    grid.add_obstacle((n,))
+                    stepping[i] = code
+                    tile_x[i], tile_y[i] = tx, ty = nx, ny
+                    facing = _FACING[code]
+                    if trainer.direction is not facing:
+                        trainer._set_direction(facing)
+                    if self.table is not None:
+                        self.table.refresh(trainer, (nx, ny))
+
+                # 往目標 tile 走（一次只動一個軸）
+                gx, gy = tx * tile, ty * tile
+                left = abs(gx - x) + abs(gy - y)
+                if budget >= left:
+                    nx, ny = gx, gy
+                else:
+                    nx = x + (budget if gx > x else -budget if gx < x else 0)
+                    ny = y + (budget if gy > y else -budget if gy < y else 0)
+                if abs(nx - px) < tile and abs(ny - py) < tile:
+                    break
+                x, y = nx, ny
+                if budget < left:
+                    break
+                budget -= left
+                # 到了：放掉走出來的那格
+                code = stepping[i]
+                grid.remove_obstacle(((ty - STEP_Y[code]) * w + tx - STEP_X[code],))
+                stepping[i] = STAY
+
+            if x == xs[i] and y == ys[i]:
+                continue
+            xs[i], ys[i] = x, y
+            pos = trainer.position
+            pos.x, pos.y = x, y
+            trainer.animation.update_pos(pos)
+            trainer.animation.update(dt)
+            if spatial is not None:
+                spatial.move(trainer, x, y)
+
+    def _field_of(self, i: int) -> FlowField:
+        field = self._field[i]
+        if field is None or field.stale:
+            goal = self.trainers[i].patrol[self.goal_index[i]]
+            field = self.fields.get(goal, self.grid, goal, self._avoid)
+            self._field[i] = field
+        return field
+
+    def _next_patrol_point(self, i: int) -> None:
+        self.goal_index[i] = (self.goal_index[i] + 1) % len(self.trainers[i].patrol)
+        self._field[i] = None
+        self.waited[i] = 0.0
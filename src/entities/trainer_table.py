@@ -0,0 +1,115 @@
+from __future__ import annotations
+from array import array
+from math import ceil, floor
+from typing import TYPE_CHECKING
+
+from src.maps.tile_index import TileIndex
+from src.utils import Direction, GameSettings
+from .enemy_trainer import EnemyTrainer
+
+if TYPE_CHECKING:
+    from src.maps.map import Map
+    from src.entities.player import Player
+
+_STEP = {Direction.UP: (0, -1), Direction.DOWN: (0, 1), Direction.LEFT: (-1, 0), Direction.RIGHT: (1, 0)}
+
+
+class TrainerTable:
+    """
+    Every trainer of one map in flat arrays (tile, facing, view range), with
+    their line of sight precomputed as tiles.
+
+    A trainer sees up to its view range straight ahead and no further than
+    the first wall, so nobody sees through buildings. Sight tiles go into an
+    inverted tile -> trainers index: finding who sees the player is a lookup
+    of the (at most four) tiles the player overlaps, however many trainers
+    the map has. A trainer's sight is only redone when it moves or turns
+    (refresh()).
+    """
+    trainers: list[EnemyTrainer]
+    tile_x: array
+    tile_y: array
+    facing: list[Direction]
+    view_range: array
+    _sight: list[tuple[int, ...]]           # flat tiles each trainer sees
+    _seen_by: dict[int, list[int]]          # flat tile -> trainers seeing it
+    _detected: list[int]
+
+    def __init__(self, game_map: Map, trainers: list[EnemyTrainer]):
+        tile = GameSettings.TILE_SIZE
+        self.index = game_map.tile_index
+        self.trainers = list(trainers)
+        self._row = {trainer: i for i, trainer in enumerate(self.trainers)}
+        self.tile_x = array("i", (round(t.position.x / tile) for t in self.trainers))
+        self.tile_y = array("i", (round(t.position.y / tile) for t in self.trainers))
+        self.facing = [t.los_direction for t in self.trainers]
+        self.view_range = array("B", (t.VIEW_TILES for t in self.trainers))
+        self._sight = [()] * len(self.trainers)
+        self._seen_by = {}
+        self._detected = []
+        for i in range(len(self.trainers)):
+            self._look(i)
+
+    def __len__(self) -> int:
+        return len(self.trainers)
+
+    def refresh(self, trainer: EnemyTrainer, tile: tuple[int, int] | None = None) -> None:
+        """Redo a trainer's sight after it moved (to tile, default: nearest to its position) or turned."""
+        i = self._row[trainer]
+        if tile is None:
+            size = GameSettings.TILE_SIZE
+            tile = (round(trainer.position.x / size), round(trainer.position.y / size))
+        if (self.tile_x[i], self.tile_y[i]) == tile and self.facing[i] is trainer.los_direction:
+            return
+        self.tile_x[i], self.tile_y[i] = tile
+        self.facing[i] = trainer.los_direction
+        self._look(i)
+
+    def update(self, player: Player | None) -> EnemyTrainer | None:
+        """Set `detected` on the trainers that see the player; returns the first of them."""
+        trainers = self.trainers
+        for i in self._detected:
+            trainers[i].detected = False
+        self._detected = []
+        if player is None:
+            return None
+
+        # 玩家 hitbox 蓋到的 tile（最多四格）
+        tile = GameSettings.TILE_SIZE
+        index = self.index
+        px, py = player.position.x, player.position.y
+        seen: set[int] = set()
+        for ty in range(floor(py / tile), ceil((py + tile) / tile)):
+            for tx in range(floor(px / tile), ceil((px + tile) / tile)):
+                if index.in_bounds(tx, ty):
+                    seen.update(self._seen_by.get(ty * index.width + tx, ()))
+        if not seen:
+            return None
+        self._detected = sorted(seen)
+        for i in self._detected:
+            trainers[i].detected = True
+        return trainers[self._detected[0]]
+
+    def _look(self, i: int) -> None:
+        seen_by = self._seen_by
+        for t in self._sight[i]:
+            rows = seen_by[t]
+            rows.remove(i)
+            if not rows:
+                del seen_by[t]
+
+        index = self.index
+        dx, dy = _STEP[self.facing[i]]
+        x, y = self.tile_x[i], self.tile_y[i]
+        tiles = []
+        for _ in range(self.view_range[i]):
+            x += dx
+            y += dy
+            if not index.in_bounds(x, y) or index.has(x, y, TileIndex.WALL):
+                break
+            t = y * index.width + x
+            tiles.append(t)
+            seen_by.setdefault(t, []).append(i)
+        self._sight[i] = tuple(tiles)
+        # 給 draw_debug 畫視線用
+        self.trainers[i].los_tiles = [(t % index.width, t // index.width) for t in tiles]
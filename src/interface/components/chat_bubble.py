@@ -0,0 +1,69 @@
+from __future__ import annotations
+import pygame as pg
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BubbleStyle:
+    font_name: str = "Arial"
+    font_size: int = 16
+    text_color: tuple[int, int, int] = (0, 0, 0)
+    bg_color: tuple[int, int, int, int] = (255, 255, 255, 220)   # 白底＋透明度
+    border_color: tuple[int, int, int] = (0, 0, 0)
+    border: int = 2
+    padding: int = 6
+
+
+class ChatBubbleCache:
+    """
+    Rendered chat bubbles keyed by (text, style).
+
+    A bubble is rendered once when its message arrives and evicted when the
+    bubble expires, so drawing a visible bubble is a single blit per frame.
+    """
+    DEFAULT_STYLE = BubbleStyle()
+
+    _sprites: dict[tuple[str, BubbleStyle], pg.Surface]
+    _fonts: dict[tuple[str, int], pg.font.Font]
+
+    def __init__(self) -> None:
+        self._sprites = {}
+        self._fonts = {}
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def get(self, text: str, style: BubbleStyle = DEFAULT_STYLE) -> pg.Surface:
+        key = (text, style)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._render(text, style)
+            self._sprites[key] = sprite
+        return sprite
+
+    def evict(self, text: str, style: BubbleStyle = DEFAULT_STYLE) -> None:
+        self._sprites.pop((text, style), None)
+
+    def clear(self) -> None:
+        self._sprites.clear()
+
+    def _font(self, style: BubbleStyle) -> pg.font.Font:
+        key = (style.font_name, style.font_size)
+        if key not in self._fonts:
+            # SysFont is a slow system lookup, only do it once per style
+            self._fonts[key] = pg.font.SysFont(style.font_name, style.font_size)
+        return self._fonts[key]
+
+    def _render(self, text: str, style: BubbleStyle) -> pg.Surface:
+        text_surf = self._font(style).render(text, True, style.text_color)
+        tw, th = text_surf.get_size()
+
+        box_w = tw + style.padding * 2
+        box_h = th + style.padding * 2
+
+        # 背景方塊 + 外框 + 文字合成一張
+        bubble = pg.Surface((box_w, box_h), pg.SRCALPHA)
+        bubble.fill(style.bg_color)
+        pg.draw.rect(bubble, style.border_color, bubble.get_rect(), style.border)
+        bubble.blit(text_surf, (box_w // 2 - tw // 2, style.padding))
+        return bubble
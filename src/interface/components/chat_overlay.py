@@ -4,7 +4,6 @@ from typing import Optional, Callable, List, Dict
 from .component import UIComponent
 from src.core.services import input_manager, scene_manager
 from src.utils import Logger
-import time
 
 
 class ChatOverlay(UIComponent):
@@ -132,7 +131,7 @@ class ChatOverlay(UIComponent):
                 game_scene = scene_manager._scenes.get("game")
                 if game_scene and game_scene.online_manager:
                     pid = game_scene.online_manager.player_id
-                    game_scene._chat_bubbles[pid] = (txt, time.monotonic() + 2.5)
+                    game_scene.show_chat_bubble(pid, txt, 2.5)
 
     def update(self, dt: float) -> None:
         if not self.is_open:
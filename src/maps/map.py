@@ -2,6 +2,9 @@ import pygame as pg
 import pytmx
 
 from src.utils import load_tmx, Position, GameSettings, PositionCamera, Teleport
+from src.maps.tile_index import TileIndex
+from src.navigation import WalkableGrid
+from src.sprites import RenderQueue
 
 class Map:
     # Map Properties
@@ -13,6 +16,11 @@ class Map:
     # Rendering Properties
     _surface: pg.Surface
     _collision_map: list[pg.Rect]
+    _minimaps: dict[tuple[int, int], pg.Surface]
+    # Derived tile facts shared by movement, navigation and encounters
+    tile_index: TileIndex
+    walkable_grid: WalkableGrid
+    _teleport_at: dict[tuple[int, int], Teleport]
 
     def __init__(self, path: str, tp: list[Teleport], spawn: Position):
         self.path_name = path
@@ -26,8 +34,22 @@ class Map:
         # Prebake the map
         self._surface = pg.Surface((pixel_w, pixel_h), pg.SRCALPHA)
         self._render_all_layers(self._surface)
+        # Classify every tile once; everything else queries this index
+        self._index_tiles(TileIndex.from_tmx(self.tmxdata, self.teleporters))
         # Prebake the collision map
         self._collision_map = self._create_collision_map()
+        # Prebake the minimap thumbnail (while we are still on the loader thread)
+        self._minimaps = {}
+        self.get_minimap()
+
+    def _index_tiles(self, tile_index: TileIndex) -> None:
+        """Tile lookups derived from the index (also used by the navigation benchmark's synthetic maps)."""
+        self.tile_index = tile_index
+        self.walkable_grid = WalkableGrid.from_tile_index(tile_index)
+        self._teleport_at = {}
+        for tp in self.teleporters:
+            key = (int(tp.pos.x // GameSettings.TILE_SIZE), int(tp.pos.y // GameSettings.TILE_SIZE))
+            self._teleport_at.setdefault(key, tp)
 
     def update(self, dt: float):
         return
@@ -37,20 +59,30 @@ class Map:
         
         # Draw the hitboxes collision map
         if GameSettings.DRAW_HITBOXES:
-            for rect in self._collision_map:
-                pg.draw.rect(screen, (255, 0, 0), camera.transform_rect(rect), 1)
+            self.draw_hitboxes(screen, camera)
+
+    def queue_draw(self, queue: RenderQueue):
+        queue.submit(self._surface, (0, 0), RenderQueue.LAYER_MAP)
+
+    def draw_hitboxes(self, screen: pg.Surface, camera: PositionCamera):
+        for rect in self._collision_map:
+            pg.draw.rect(screen, (255, 0, 0), camera.transform_rect(rect), 1)
         
+    def get_minimap(self, size: tuple[int, int] | None = None) -> pg.Surface:
+        if size is None:
+            size = (GameSettings.MINIMAP_WIDTH, GameSettings.MINIMAP_HEIGHT)
+        if size not in self._minimaps:
+            self._minimaps[size] = pg.transform.smoothscale(self._surface, size)
+        return self._minimaps[size]
+
     def check_collision(self, pos: Position) -> bool: #rect: pg.Rect
         '''
         [TODO HACKATHON 4]
         Return True if collide if rect param collide with self._collision_map
         Hint: use API colliderect and iterate each rectangle to check
         '''
-        rect = pg.Rect(pos.x, pos.y, GameSettings.TILE_SIZE, GameSettings.TILE_SIZE)
-        for collision_rect in self._collision_map:
-            if rect.colliderect(collision_rect):
-                return True
-        return False
+        tile = GameSettings.TILE_SIZE
+        return self.tile_index.any_in_box(pos.x, pos.y, tile, tile, TileIndex.WALL)
         
     def check_teleport(self, pos: Position) -> Teleport | None:
         '''[TODO HACKATHON 6] 
@@ -59,9 +91,9 @@ class Map:
         '''
         player_rect = pg.Rect(int(pos.x), int(pos.y), GameSettings.TILE_SIZE, GameSettings.TILE_SIZE)
 
-        for tp in self.teleporters:
-            area = pg.Rect(int(tp.pos.x), int(tp.pos.y), GameSettings.TILE_SIZE, GameSettings.TILE_SIZE)
-            if player_rect.colliderect(area):
+        for tile in self.tile_index.tiles_in_rect(player_rect):
+            tp = self._teleport_at.get(tile)
+            if tp is not None:
                 return tp
         return None
 
@@ -84,21 +116,8 @@ class Map:
             target.blit(image, (x * GameSettings.TILE_SIZE, y * GameSettings.TILE_SIZE))
     
     def _create_collision_map(self) -> list[pg.Rect]:
-        rects = []
-        for layer in self.tmxdata.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer) and ("collision" in layer.name.lower() or "house" in layer.name.lower()):
-                for x, y, gid in layer:
-                    if gid != 0:
-                        '''
-                        [TODO HACKATHON 4]
-                        rects.append(pg.Rect(...))
-                        Append the collision rectangle to the rects[] array
-                        Remember scale the rectangle with the TILE_SIZE from settings
-                        '''
-                        pixel_x = x * GameSettings.TILE_SIZE
-                        pixel_y = y * GameSettings.TILE_SIZE
-                        rects.append(pg.Rect(pixel_x, pixel_y, GameSettings.TILE_SIZE, GameSettings.TILE_SIZE))
-        return rects
+        # Only used to draw hitboxes; collision checks go through tile_index
+        return self.tile_index.rects(TileIndex.WALL)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Map":
@@ -117,13 +136,8 @@ class Map:
         }
     
 
-    def get_bush_tiles(self):
-        bush_tiles = []
-        for layer in self.tmxdata.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer) and layer.name == "PokemonBush":
-                for x, y, gid in layer:
-                    if gid != 0:  # 有 tile 是草叢
-                        px = x * GameSettings.TILE_SIZE
-                        py = y * GameSettings.TILE_SIZE
-                        bush_tiles.append(pg.Rect(px, py, GameSettings.TILE_SIZE, GameSettings.TILE_SIZE))
-        return bush_tiles
+    def get_bush_tiles(self) -> list[pg.Rect]:
+        return self.tile_index.rects(TileIndex.BUSH)
+
+    def get_flower_tiles(self) -> list[pg.Rect]:
+        return self.tile_index.rects(TileIndex.FLOWER)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator
+
+from src.utils import Logger
+
+if TYPE_CHECKING:
+    from src.maps.map import Map
+
+
+def _failed(future: Future) -> bool:
+    # Cancelled counts as failed: cancelled prefetches are dropped by shutdown()
+    return future.cancelled() or future.exception() is not None
+
+
+class MapLoader:
+    """
+    Builds Map objects on demand from their save entries.
+
+    Only the map that is asked for is parsed and baked. Teleporter
+    destinations of a map can be prefetched on a background worker, so a
+    teleport only ever waits for a map that is still being baked instead of
+    loading the whole world up front.
+
+    A map that fails to load is not remembered: the error goes to whoever
+    was waiting for it and the next get() tries again.
+    """
+    _entries: dict[str, dict]
+    _futures: dict[str, Future[Map]]
+    _lock: threading.Lock
+    _executor: ThreadPoolExecutor
+    _closed: bool
+
+    def __init__(self, entries: dict[str, dict]):
+        self._entries = entries
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MapLoader")
+        self._closed = False
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: str) -> Map:
+        return self.get(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def keys(self) -> list[str]:
+        return list(self._entries)
+
+    def entry(self, key: str) -> dict:
+        return self._entries[key]
+
+    def is_loaded(self, key: str) -> bool:
+        future = self._futures.get(key)
+        return future is not None and future.done() and not _failed(future)
+
+    def loaded(self) -> dict[str, Map]:
+        return {key: self._futures[key].result() for key in self._entries if self.is_loaded(key)}
+
+    def get(self, key: str) -> Map:
+        # Fast path: already baked (dict lookups are atomic, no lock needed)
+        future = self._futures.get(key)
+        if future is not None and future.done():
+            if not _failed(future):
+                return future.result()
+            # A failed prefetch: forget it and load again below
+            self._evict(key, future)
+
+        owner = False
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                # Nobody is loading it yet: load on the calling thread
+                future = Future()
+                future.set_running_or_notify_cancel()
+                self._futures[key] = future
+                owner = True
+
+        if owner:
+            try:
+                future.set_result(self._load(key))
+            except BaseException as e:
+                self._evict(key, future)
+                future.set_exception(e)
+                raise
+        elif not future.done():
+            Logger.info(f"Waiting for map '{key}' to finish prefetching")
+        return future.result()
+
+    def prefetch(self, key: str) -> None:
+        if key not in self._entries:
+            Logger.warning(f"Cannot prefetch unknown map '{key}'")
+            return
+        with self._lock:
+            if self._closed or key in self._futures:
+                return
+            future = self._executor.submit(self._load, key)
+            self._futures[key] = future
+        future.add_done_callback(lambda f: _failed(f) and self._evict(key, f))
+
+    def prefetch_neighbours(self, key: str) -> None:
+        for tp in self.get(key).teleporters:
+            self.prefetch(tp.destination)
+
+    def shutdown(self) -> None:
+        """Stop the prefetch worker (the loader is being replaced); get() still loads on the caller."""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _evict(self, key: str, future: Future[Map]) -> None:
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def _load(self, key: str) -> Map:
+        from src.maps.map import Map
+        Logger.info(f"Loading map '{key}'")
+        return Map.from_dict(self._entries[key])
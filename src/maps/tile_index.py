@@ -0,0 +1,137 @@
+from __future__ import annotations
+import pygame as pg
+import pytmx
+from typing import Iterator
+
+from src.utils import GameSettings, Teleport
+
+
+class TileIndex:
+    """
+    Per-map classification of every tile, built once when the map is loaded.
+
+    Each tile stores a bit mask in a flat bytearray (index = y * width + x),
+    so movement (collision, teleports), navigation, bush encounters and
+    trainer line of sight all query the same data instead of walking the
+    pytmx layers again.
+    """
+    FREE = 0
+    WALL = 1
+    BUSH = 2
+    FLOWER = 4
+    TELEPORT = 8
+    # Tiles the auto navigation must route around
+    BLOCKED = WALL | BUSH | FLOWER
+
+    width: int
+    height: int
+    flags: bytearray
+
+    def __init__(self, width: int, height: int, flags: bytearray | None = None):
+        self.width = width
+        self.height = height
+        self.flags = flags if flags is not None else bytearray(width * height)
+
+    @classmethod
+    def from_tmx(cls, tmxdata: pytmx.TiledMap, teleporters: list[Teleport]) -> "TileIndex":
+        index = cls(tmxdata.width, tmxdata.height)
+        for layer in tmxdata.visible_layers:
+            if not isinstance(layer, pytmx.TiledTileLayer):
+                continue
+            layer_flag = cls._layer_flag(layer.name)
+            for y, row in enumerate(layer.data):
+                for x, gid in enumerate(row):
+                    if gid == 0:
+                        continue
+                    flag = layer_flag | cls._tile_flag(tmxdata, gid)
+                    if flag:
+                        index.mark(x, y, flag)
+
+        tile = GameSettings.TILE_SIZE
+        for tp in teleporters:
+            index.mark(int(tp.pos.x // tile), int(tp.pos.y // tile), cls.TELEPORT)
+        return index
+
+    @classmethod
+    def _layer_flag(cls, layer_name: str | None) -> int:
+        name = (layer_name or "").strip().lower()
+        flag = cls.FREE
+        if "collision" in name or "house" in name:
+            flag |= cls.WALL
+        if layer_name == "PokemonBush":
+            flag |= cls.BUSH
+        # 花層：layer 名包含 flower / plant / decor
+        if "flower" in name or "plant" in name or "decor" in name:
+            flag |= cls.FLOWER
+        return flag
+
+    @classmethod
+    def _tile_flag(cls, tmxdata: pytmx.TiledMap, gid: int) -> int:
+        # tile 本身有 properties（type=flower / collide=true / blocked=true）也算花
+        props = tmxdata.get_tile_properties_by_gid(gid)
+        if not props:
+            return cls.FREE
+        typ = str(props.get("type", props.get("class", props.get("name", "")))).lower()
+        if "flower" in typ or "plant" in typ:
+            return cls.FLOWER
+        for k in ("collide", "collision", "blocked", "block", "solid"):
+            if props.get(k, False) in (True, 1, "1", "true", "True", "yes", "Yes"):
+                return cls.FLOWER
+        return cls.FREE
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def mark(self, x: int, y: int, flag: int) -> None:
+        if self.in_bounds(x, y):
+            self.flags[y * self.width + x] |= flag
+
+    def get(self, x: int, y: int) -> int:
+        if not self.in_bounds(x, y):
+            return self.FREE
+        return self.flags[y * self.width + x]
+
+    def has(self, x: int, y: int, flag: int) -> bool:
+        return bool(self.get(x, y) & flag)
+
+    def tiles(self, flag: int) -> Iterator[tuple[int, int]]:
+        w = self.width
+        for i, f in enumerate(self.flags):
+            if f & flag:
+                yield i % w, i // w
+
+    def rects(self, flag: int) -> list[pg.Rect]:
+        tile = GameSettings.TILE_SIZE
+        return [pg.Rect(x * tile, y * tile, tile, tile) for x, y in self.tiles(flag)]
+
+    def tiles_in_rect(self, rect: pg.Rect) -> Iterator[tuple[int, int]]:
+        """Tiles overlapped by a world-space rect, clipped to the map."""
+        tile = GameSettings.TILE_SIZE
+        left = max(0, rect.left // tile)
+        right = min(self.width - 1, (rect.right - 1) // tile)
+        top = max(0, rect.top // tile)
+        bottom = min(self.height - 1, (rect.bottom - 1) // tile)
+        for ty in range(top, bottom + 1):
+            for tx in range(left, right + 1):
+                yield tx, ty
+
+    def any_in_rect(self, rect: pg.Rect, flag: int) -> bool:
+        return self.any_in_box(rect.x, rect.y, rect.width, rect.height, flag)
+
+    def any_in_box(self, left: float, top: float, width: int, height: int, flag: int) -> bool:
+        """any_in_rect for a box in world pixels, without building a Rect (per-frame movement checks)."""
+        tile = GameSettings.TILE_SIZE
+        left = int(left)
+        top = int(top)
+        x0 = max(0, left // tile)
+        x1 = min(self.width - 1, (left + width - 1) // tile)
+        y0 = max(0, top // tile)
+        y1 = min(self.height - 1, (top + height - 1) // tile)
+        flags = self.flags
+        w = self.width
+        for ty in range(y0, y1 + 1):
+            row = ty * w
+            for tx in range(x0, x1 + 1):
+                if flags[row + tx] & flag:
+                    return True
+        return False
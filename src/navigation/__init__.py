@@ -0,0 +1,24 @@
+from .grid import WalkableGrid
+from .astar import PathResult, astar
+from .distance_field import UNREACHABLE, DistanceField, DistanceFieldCache
+from .flow_field import FlowField
+from .smoothing import compress_path, line_of_sight, smooth_path
+from .world import NavLeg, WorldPlan, WorldNavigator
+from .service import PathService
+
+__all__ = [
+    "WalkableGrid",
+    "PathResult",
+    "astar",
+    "UNREACHABLE",
+    "DistanceField",
+    "DistanceFieldCache",
+    "FlowField",
+    "compress_path",
+    "line_of_sight",
+    "smooth_path",
+    "NavLeg",
+    "WorldPlan",
+    "WorldNavigator",
+    "PathService",
+]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+import heapq
+from array import array
+from dataclasses import dataclass, field
+
+from .grid import WalkableGrid
+
+# Integer step costs keep the heap comparisons cheap; 14 ~ 10 * sqrt(2)
+STRAIGHT = 10
+DIAGONAL = 14
+
+
+@dataclass
+class PathResult:
+    """Tiles from start to goal (both included); empty when there is no path."""
+    path: list[tuple[int, int]] = field(default_factory=list)
+    expanded: int = 0           # nodes popped from the open list
+
+    @property
+    def found(self) -> bool:
+        return bool(self.path)
+
+    def __bool__(self) -> bool:
+        return self.found
+
+
+def manhattan(dx: int, dy: int) -> int:
+    return STRAIGHT * (dx + dy)
+
+
+def octile(dx: int, dy: int) -> int:
+    return STRAIGHT * (dx + dy) + (DIAGONAL - 2 * STRAIGHT) * min(dx, dy)
+
+
+def astar(
+    grid: WalkableGrid,
+    start: tuple[int, int],
+    goal: tuple[int, int],
+    blocked: frozenset[int] | set[int] = frozenset(),
+    diagonal: bool = False,
+    max_expanded: int | None = None,
+    dynamic: bool = True,
+) -> PathResult:
+    """
+    A* over a WalkableGrid with a binary heap and flat per-node arrays.
+
+    `blocked` holds extra flat indices to avoid. With dynamic=True tiles
+    occupied in the grid's overlay (NPCs, trainers) are avoided too, except
+    the goal, so a search can still end next to whoever stands on it. The
+    start tile itself is never checked, so a search can leave a tile the
+    player is standing on even if it is marked blocked. With diagonal=True
+    corners are not cut. Gives up (no path) after max_expanded nodes if given.
+    """
+    sx, sy = start
+    gx, gy = goal
+    if not grid.in_bounds(sx, sy) or not grid.is_walkable(gx, gy):
+        return PathResult()
+
+    w = grid.width
+    s = sy * w + sx
+    g = gy * w + gx
+    if g in blocked:
+        return PathResult()
+    if s == g:
+        return PathResult([start], 0)
+
+    walkable = grid.walkable
+    occupied = grid.occupied if dynamic else bytearray(len(walkable))
+    n = len(walkable)
+    heuristic = octile if diagonal else manhattan
+    steps = [(0, -1, STRAIGHT), (0, 1, STRAIGHT), (-1, 0, STRAIGHT), (1, 0, STRAIGHT)]
+    if diagonal:
+        steps += [(-1, -1, DIAGONAL), (1, -1, DIAGONAL), (-1, 1, DIAGONAL), (1, 1, DIAGONAL)]
+
+    INF = 1 << 30
+    cost = array("i", [INF]) * n
+    parent = array("i", [-1]) * n
+    closed = bytearray(n)
+
+    def passable(x: int, y: int) -> bool:
+        if 0 <= x < w and 0 <= y < grid.height:
+            i = y * w + x
+            return bool(walkable[i]) and i not in blocked and (not occupied[i] or i == g)
+        return False
+
+    cost[s] = 0
+    h0 = heuristic(abs(sx - gx), abs(sy - gy))
+    # (f, h, index): ties go to the node closer to the goal
+    open_heap = [(h0, h0, s)]
+    expanded = 0
+
+    while open_heap:
+        _, _, cur = heapq.heappop(open_heap)
+        if closed[cur]:
+            continue
+        closed[cur] = 1
+        expanded += 1
+        if cur == g:
+            break
+        if max_expanded is not None and expanded >= max_expanded:
+            return PathResult([], expanded)
+
+        cx, cy = cur % w, cur // w
+        base = cost[cur]
+        for dx, dy, step in steps:
+            nx, ny = cx + dx, cy + dy
+            if not passable(nx, ny):
+                continue
+            if dx and dy and not (passable(cx + dx, cy) and passable(cx, cy + dy)):
+                continue
+            nxt = ny * w + nx
+            if closed[nxt]:
+                continue
+            new_cost = base + step
+            if new_cost < cost[nxt]:
+                cost[nxt] = new_cost
+                parent[nxt] = cur
+                h = heuristic(abs(nx - gx), abs(ny - gy))
+                heapq.heappush(open_heap, (new_cost + h, h, nxt))
+    else:
+        return PathResult([], expanded)
+
+    path = []
+    cur = g
+    while cur != -1:
+        path.append((cur % w, cur // w))
+        cur = parent[cur]
+    path.reverse()
+    return PathResult(path, expanded)
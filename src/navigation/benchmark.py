@@ -0,0 +1,289 @@
+"""
+Pathfinding and collision benchmarks on synthetic maps.
+
+Builds TileIndex grids the way a TMX map would come out of
+TileIndex.from_tmx, in three kinds and any size:
+
+    maze    one-tile corridors (long, winding paths)
+    open    open field with scattered bushes
+    dense   30% random walls plus bushes
+
+and times, for each one: building the walkable grid, the old tile BFS
+against A*, distance fields and waypoint smoothing, Map.check_collision,
+Map.check_teleport and the bush lookup. Results are written as JSON so a
+later run can be compared against a saved baseline:
+
+    python -m src.navigation.benchmark --out nav_baseline.json
+    python -m src.navigation.benchmark --sizes 64 256 --compare nav_baseline.json
+
+Each metric is the best of several runs (fast ones are repeated for at
+least MIN_TIME seconds). The maps are seeded, so runs are comparable.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import Any, Callable
+
+KINDS = ("maze", "open", "dense")
+DEFAULT_SIZES = (64, 128, 256, 512, 1024)
+SEED = 1
+MIN_TIME = 0.25         # s spent repeating a fast metric
+MAX_RUNS = 20
+QUERIES = 20000         # random positions for the collision / teleport queries
+TELEPORTERS = 8
+
+
+def legacy_bfs(grid: list[list[bool]], start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+    """The tile BFS GameScene used before A* (kept here as the baseline to beat)."""
+    q = deque([start])
+    came_from = {start: None}
+
+    while q:
+        x, y = q.popleft()
+        if (x, y) == goal:
+            break
+
+        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+            nx, ny = x + dx, y + dy
+            if (nx, ny) in came_from:
+                continue
+            if not grid[ny][nx]:
+                continue
+
+            came_from[(nx, ny)] = (x, y)
+            q.append((nx, ny))
+
+    path = []
+    cur = goal
+    while cur:
+        path.append(cur)
+        cur = came_from.get(cur)
+    path.reverse()
+    return path
+
+
+def make_index(kind: str, size: int, rng: random.Random):
+    """Synthetic TileIndex of size x size tiles, walled in on every side."""
+    from src.maps.tile_index import TileIndex
+
+    index = TileIndex(size, size)
+    flags = index.flags
+    if kind == "maze":
+        # Iterative backtracker over the odd tiles; everything else is wall
+        flags[:] = bytes([TileIndex.WALL]) * (size * size)
+        cells = (size - 1) // 2
+        seen = bytearray(cells * cells)
+        stack = [(0, 0)]
+        seen[0] = 1
+        flags[1 * size + 1] = TileIndex.FREE
+        while stack:
+            cx, cy = stack[-1]
+            options = [(cx + dx, cy + dy, dx, dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                       if 0 <= cx + dx < cells and 0 <= cy + dy < cells and not seen[(cy + dy) * cells + cx + dx]]
+            if not options:
+                stack.pop()
+                continue
+            nx, ny, dx, dy = rng.choice(options)
+            seen[ny * cells + nx] = 1
+            flags[(2 * cy + 1 + dy) * size + 2 * cx + 1 + dx] = TileIndex.FREE
+            flags[(2 * ny + 1) * size + 2 * nx + 1] = TileIndex.FREE
+            stack.append((nx, ny))
+    else:
+        wall_rate = 0.3 if kind == "dense" else 0.0
+        for i in range(size * size):
+            r = rng.random()
+            if r < wall_rate:
+                flags[i] = TileIndex.WALL
+            elif r < wall_rate + 0.05:
+                flags[i] = TileIndex.BUSH
+        for i in range(size):
+            flags[i] = flags[(size - 1) * size + i] = TileIndex.WALL
+            flags[i * size] = flags[i * size + size - 1] = TileIndex.WALL
+    return index
+
+
+def make_map(index, rng: random.Random):
+    """
+    Map with the tile lookups of a real one but no TMX behind it, which is
+    all check_collision / check_teleport / BushInteraction touch.
+    """
+    from src.maps.map import Map
+    from src.maps.tile_index import TileIndex
+    from src.utils import GameSettings, Teleport
+
+    tile = GameSettings.TILE_SIZE
+    free = [i for i, f in enumerate(index.flags) if not f & TileIndex.BLOCKED]
+    teleporters = []
+    for i in rng.sample(free, min(TELEPORTERS, len(free))):
+        x, y = i % index.width, i // index.width
+        index.mark(x, y, TileIndex.TELEPORT)
+        teleporters.append(Teleport(x * tile, y * tile, "synthetic.tmx"))
+
+    game_map = Map.__new__(Map)
+    game_map.path_name = "synthetic.tmx"
+    game_map.teleporters = teleporters
+    game_map._index_tiles(index)
+    return game_map
+
+
+def endpoints(grid) -> tuple[tuple[int, int], tuple[int, int]]:
+    """First walkable tile, and the walkable tile farthest from it (the longest query the map has)."""
+    from .distance_field import UNREACHABLE, DistanceField
+
+    start_i = next(i for i, ok in enumerate(grid.walkable) if ok)
+    start = grid.coords(start_i)
+    field = DistanceField(grid, start)
+    goal_i = max(range(len(field.dist)), key=lambda i: -1 if field.dist[i] == UNREACHABLE else field.dist[i])
+    return start, grid.coords(goal_i)
+
+
+def best_of(fn: Callable[[], Any]) -> tuple[float, int, Any]:
+    """(best ms, runs, last result); slow calls run once, fast ones repeat for MIN_TIME."""
+    best = float("inf")
+    runs = 0
+    spent = 0.0
+    result = None
+    while runs < MAX_RUNS and (runs == 0 or spent < MIN_TIME):
+        t = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t
+        best = min(best, elapsed)
+        spent += elapsed
+        runs += 1
+    return best * 1000, runs, result
+
+
+def bench_map(kind: str, size: int, log: Callable[[str], None] = print) -> list[dict[str, Any]]:
+    from src.maps.tile_index import TileIndex
+    from src.scenes.bush_interaction import BushInteraction
+    from src.utils import GameSettings, Position
+    from .astar import astar
+    from .distance_field import DistanceField
+    from .grid import WalkableGrid
+    from .smoothing import smooth_path
+
+    rng = random.Random(f"{SEED}-{kind}-{size}")
+    index = make_index(kind, size, rng)
+    game_map = make_map(index, rng)
+    grid = game_map.walkable_grid
+    start, goal = endpoints(grid)
+    tile = GameSettings.TILE_SIZE
+    results: list[dict[str, Any]] = []
+
+    def record(metric: str, fn: Callable[[], Any], **extra: Callable[[Any], Any]) -> Any:
+        ms, runs, result = best_of(fn)
+        row = {"kind": kind, "size": size, "metric": metric, "ms": round(ms, 4), "runs": runs}
+        row.update({key: get(result) for key, get in extra.items()})
+        results.append(row)
+        log(f"{kind:5s} {size:5d} {metric:22s} {ms:10.3f} ms")
+        return result
+
+    # Grid build: the old list-of-rows grid against the flat bytearray
+    legacy_grid = record("grid_build_legacy", lambda: [
+        [not index.has(x, y, TileIndex.BLOCKED) for x in range(size)] for y in range(size)
+    ])
+    record("grid_build", lambda: WalkableGrid.from_tile_index(index))
+
+    # Planners, all on the longest query the map has
+    record("bfs_legacy", lambda: legacy_bfs(legacy_grid, start, goal), path=len)
+    path = record("astar", lambda: astar(grid, start, goal),
+                  path=lambda r: len(r.path), expanded=lambda r: r.expanded).path
+    field = record("distance_field_build", lambda: DistanceField(grid, goal))
+    record("distance_field_path", lambda: field.path_from(start), path=len)
+    record("smooth_path", lambda: smooth_path(grid, path), waypoints=len)
+
+    # Per-frame queries at random pixel positions, reported per call
+    limit = size * tile - tile
+    points = [Position(rng.uniform(0, limit), rng.uniform(0, limit)) for _ in range(QUERIES)]
+
+    def per_call(metric: str, fn: Callable[[], Any], calls: int) -> None:
+        ms, runs, _ = best_of(fn)
+        results.append({"kind": kind, "size": size, "metric": metric, "ms": round(ms, 4), "runs": runs,
+                        "calls": calls, "us_per_call": round(ms * 1000 / calls, 4)})
+        log(f"{kind:5s} {size:5d} {metric:22s} {ms * 1000 / calls:10.3f} us/call")
+
+    per_call("check_collision", lambda: [game_map.check_collision(p) for p in points], len(points))
+    per_call("check_teleport", lambda: [game_map.check_teleport(p) for p in points], len(points))
+
+    # Bush lookup: a player walking the A* path, four frames per tile
+    steps = []
+    for (ax, ay), (bx, by) in zip(path, path[1:]):
+        for k in range(4):
+            steps.append(((ax + (bx - ax) * k / 4) * tile, (ay + (by - ay) * k / 4) * tile))
+    steps = steps[:QUERIES] or [(start[0] * tile, start[1] * tile)]
+    player = SimpleNamespace(position=Position(*steps[0]))
+    bushes = BushInteraction(game_map, player)
+
+    def walk() -> None:
+        pos = player.position
+        for x, y in steps:
+            pos.x, pos.y = x, y
+            bushes.update()
+
+    per_call("bush_lookup", walk, len(steps))
+    return results
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> None:
+    old = {(r["kind"], r["size"], r["metric"]): r["ms"] for r in baseline["results"]}
+    rows = [r for r in current["results"] if (r["kind"], r["size"], r["metric"]) in old]
+    if not rows:
+        print("No metrics in common with the baseline (different sizes or kinds?)")
+        return
+    print(f"{'kind':5s} {'size':>5s} {'metric':22s} {'baseline ms':>12s} {'now ms':>10s} {'ratio':>7s}")
+    for r in rows:
+        before = old[(r["kind"], r["size"], r["metric"])]
+        ratio = r["ms"] / before if before else float("inf")
+        print(f"{r['kind']:5s} {r['size']:5d} {r['metric']:22s} {before:12.3f} {r['ms']:10.3f} {ratio:7.2f}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Pathfinding and collision benchmarks on synthetic maps")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="map sizes in tiles (square)")
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=list(KINDS))
+    parser.add_argument("--out", default=None, help="write the results to this JSON file (default: stdout)")
+    parser.add_argument("--compare", default=None, help="baseline JSON file to compare the results against")
+    args = parser.parse_args(argv)
+
+    # Importing the map code starts the game services; keep them off any real device
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame as pg
+
+    log = (lambda line: print(line, file=sys.stderr)) if args.out is None else print
+    report: dict[str, Any] = {
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pg.version.ver,
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "seed": SEED,
+        "results": [],
+    }
+    for size in args.sizes:
+        for kind in args.kinds:
+            report["results"].extend(bench_map(kind, size, log))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
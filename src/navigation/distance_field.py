@@ -0,0 +1,157 @@
+from __future__ import annotations
+from array import array
+from collections import OrderedDict, deque
+from typing import Hashable
+
+from .grid import WalkableGrid
+
+Tile = tuple[int, int]
+
+# Stored distance for tiles that cannot reach the goal (uint16, so fields
+# only make sense on maps where no route is longer than 65534 steps)
+UNREACHABLE = 0xFFFF
+
+
+class DistanceField:
+    """
+    Steps from every tile of a map to one goal, as a flat uint16 array.
+
+    Computed once with a Dijkstra from the goal (every step costs the same,
+    so that is a plain BFS). After that any number of followers can walk
+    to the goal by stepping to a neighbour with a smaller distance, with no
+    search of their own. Tiles in `terminal` (teleporters) get a distance
+    but are never walked through or stepped on, unless they are the goal.
+
+    Distances only see the grid's static base, so NPCs and trainers
+    moving around never invalidate a field: the overlay is read while
+    descending (next_step / path_from) and occupied tiles are stepped
+    around. A field is tied to the base version it was computed from;
+    `stale` turns true if the base changes and the cache recomputes it.
+    """
+    grid: WalkableGrid
+    goal: Tile
+    version: int
+    dist: array
+
+    def __init__(self, grid: WalkableGrid, goal: Tile, terminal: frozenset[int] = frozenset()):
+        self.grid = grid
+        self.goal = goal
+        self.terminal = terminal
+        self.version = grid.version
+        self.dist = array("H", [UNREACHABLE]) * (grid.width * grid.height)
+
+        gx, gy = goal
+        if not grid.is_walkable(gx, gy):
+            return
+        g = grid.index(gx, gy)
+        dist = self.dist
+        dist[g] = 0
+        queue = deque([g])
+        while queue:
+            cur = queue.popleft()
+            if cur != g and cur in terminal:
+                continue
+            d = dist[cur] + 1
+            if d >= UNREACHABLE:
+                continue
+            for nxt in grid.neighbors(cur):
+                if dist[nxt] == UNREACHABLE:
+                    dist[nxt] = d
+                    queue.append(nxt)
+
+    @property
+    def stale(self) -> bool:
+        return self.version != self.grid.version
+
+    def distance(self, x: int, y: int) -> int | None:
+        grid = self.grid
+        if not grid.in_bounds(x, y):
+            return None
+        i = y * grid.width + x
+        d = self.dist[i]
+        if d == UNREACHABLE and not grid.walkable[i]:
+            # Standing on a tile the search avoids (e.g. a bush): step off it first
+            d = min((self.dist[n] for n in grid.neighbors(i)), default=UNREACHABLE)
+            d = UNREACHABLE if d == UNREACHABLE else d + 1
+        return None if d == UNREACHABLE else d
+
+    def next_step(self, x: int, y: int, blocked: frozenset[int] | set[int] = frozenset()) -> Tile | None:
+        """
+        Neighbour one step closer to the goal, or None at the goal / when
+        stuck. Occupied tiles in the grid's overlay are not stepped on.
+        """
+        grid = self.grid
+        if not grid.in_bounds(x, y):
+            return None
+        w = grid.width
+        i = y * w + x
+        dist = self.dist
+        best = dist[i]
+        if best == 0:
+            return None
+
+        g = grid.index(*self.goal)
+        step = None
+        for n in grid.neighbors(i, blocked, dynamic=True):
+            if dist[n] < best and (n == g or n not in self.terminal):
+                best = dist[n]
+                step = n
+        return None if step is None else (step % w, step // w)
+
+    def path_from(self, start: Tile, blocked: frozenset[int] | set[int] = frozenset()) -> list[Tile] | None:
+        """
+        Tiles from start to the goal (both included) by greedy descent.
+        None if the goal is unreachable or a blocked or occupied tile cuts
+        every way down.
+        """
+        if self.distance(*start) is None:
+            return None
+        path = [start]
+        x, y = start
+        while (x, y) != self.goal:
+            step = self.next_step(x, y, blocked)
+            if step is None:
+                return None
+            path.append(step)
+            x, y = step
+        return path
+
+
+class DistanceFieldCache:
+    """
+    Distance fields by key (usually (map, goal)), least recently used dropped
+    first. A field whose grid changed since it was computed is recomputed on
+    the next get(). field_type picks the class built (e.g. FlowField).
+    """
+    DEFAULT_SIZE = 64
+
+    _fields: OrderedDict[Hashable, DistanceField]
+
+    def __init__(self, max_fields: int = DEFAULT_SIZE, field_type: type[DistanceField] = DistanceField) -> None:
+        self.max_fields = max_fields
+        self.field_type = field_type
+        self._fields = OrderedDict()
+        self.computed = 0
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def get(
+        self, key: Hashable, grid: WalkableGrid, goal: Tile,
+        terminal: frozenset[int] = frozenset()
+    ) -> DistanceField:
+        field = self._fields.get(key)
+        if field is None or field.stale or field.grid is not grid:
+            field = self.field_type(grid, goal, terminal)
+            self.computed += 1
+            self._fields[key] = field
+            while len(self._fields) > self.max_fields:
+                self._fields.popitem(last=False)
+        self._fields.move_to_end(key)
+        return field
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        if key is None:
+            self._fields.clear()
+        else:
+            self._fields.pop(key, None)
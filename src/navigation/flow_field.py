@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from .distance_field import UNREACHABLE, DistanceField
+from .grid import WalkableGrid
+
+Tile = tuple[int, int]
+
+# Step codes stored per tile, indices into STEP_X / STEP_Y
+STAY, UP, DOWN, LEFT, RIGHT = range(5)
+STEP_X = (0, 0, 0, -1, 1)
+STEP_Y = (0, -1, 1, 0, 0)
+
+
+class FlowField(DistanceField):
+    """
+    DistanceField plus, for every tile, which way to step to get one tile
+    closer to the goal (one byte per tile, STAY at the goal and where the
+    goal can't be reached).
+
+    Steering an agent is then a single lookup, so any number of agents
+    heading for the same goal share one field and never search on their own.
+    """
+    flow: bytearray
+
+    def __init__(self, grid: WalkableGrid, goal: Tile, terminal: frozenset[int] = frozenset()):
+        super().__init__(grid, goal, terminal)
+        w = grid.width
+        size = len(self.dist)
+        dist = self.dist
+        flow = bytearray(size)
+        g = grid.index(*goal) if grid.in_bounds(*goal) else -1
+
+        for i in range(size):
+            best = dist[i]
+            if best == 0 or best == UNREACHABLE:
+                continue
+            x = i % w
+            code = STAY
+            # Same order as DistanceField.next_step, so both pick the same way down
+            for n, ok, c in ((i - w, i >= w, UP), (i + w, i + w < size, DOWN),
+                             (i - 1, x > 0, LEFT), (i + 1, x < w - 1, RIGHT)):
+                if ok and dist[n] < best and (n == g or n not in terminal):
+                    best = dist[n]
+                    code = c
+            flow[i] = code
+        self.flow = flow
+
+    def step(self, x: int, y: int) -> int:
+        """Step code at a tile (STAY outside the map)."""
+        if not self.grid.in_bounds(x, y):
+            return STAY
+        return self.flow[y * self.grid.width + x]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+from typing import Iterable, Iterator
+
+
+class WalkableGrid:
+    """
+    Tile walkability of one map, stored flat (index = y * width + x), in
+    two layers:
+
+    - `walkable`, the static base, built once per map from its TileIndex
+      (walls, bushes, flowers). Nothing changes it while the game runs; if
+      set_walkable() does, `version` goes up and caches built from the base
+      (distance fields, portal costs) are recomputed.
+    - `occupied`, the dynamic overlay: how many moving obstacles (NPCs,
+      trainers) stand on each tile. Entities update it in O(tiles touched)
+      as they move. Nothing is cached from it, so nothing has to be told:
+      the searches read it when they run.
+    """
+    width: int
+    height: int
+    walkable: bytearray     # 1 = walkable, 0 = blocked
+    occupied: bytearray     # obstacles standing on each tile
+    version: int
+
+    def __init__(self, width: int, height: int, walkable: bytearray | None = None):
+        self.width = width
+        self.height = height
+        self.walkable = walkable if walkable is not None else bytearray(b"\x01") * (width * height)
+        self.occupied = bytearray(width * height)
+        self.version = 0
+
+    @classmethod
+    def from_tile_index(cls, index, blocked_mask: int | None = None) -> WalkableGrid:
+        """blocked_mask defaults to index.BLOCKED (walls, bushes, flowers)."""
+        mask = index.BLOCKED if blocked_mask is None else blocked_mask
+        walkable = bytearray(0 if f & mask else 1 for f in index.flags)
+        return cls(index.width, index.height, walkable)
+
+    @classmethod
+    def from_rows(cls, rows: list[str], blocked: str = "#") -> WalkableGrid:
+        """Grid from ASCII art, e.g. ["....", ".##.", "...."] (handy for tests and benchmarks)."""
+        height = len(rows)
+        width = len(rows[0]) if rows else 0
+        walkable = bytearray(0 if ch in blocked else 1 for row in rows for ch in row)
+        return cls(width, height, walkable)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def coords(self, i: int) -> tuple[int, int]:
+        return i % self.width, i // self.width
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        return self.in_bounds(x, y) and bool(self.walkable[y * self.width + x])
+
+    def is_free(self, x: int, y: int) -> bool:
+        """Walkable and nothing standing on it."""
+        if not self.in_bounds(x, y):
+            return False
+        i = y * self.width + x
+        return bool(self.walkable[i]) and not self.occupied[i]
+
+    def set_walkable(self, x: int, y: int, walkable: bool) -> None:
+        if not self.in_bounds(x, y):
+            return
+        i = y * self.width + x
+        value = 1 if walkable else 0
+        if self.walkable[i] != value:
+            self.walkable[i] = value
+            self.version += 1
+
+    def add_obstacle(self, indices: Iterable[int]) -> None:
+        occupied = self.occupied
+        for i in indices:
+            if occupied[i] < 255:
+                occupied[i] += 1
+
+    def remove_obstacle(self, indices: Iterable[int]) -> None:
+        occupied = self.occupied
+        for i in indices:
+            if occupied[i]:
+                occupied[i] -= 1
+
+    def blocked_indices(self, tiles: Iterable[tuple[int, int]]) -> set[int]:
+        """Flat indices of the in-bounds tiles, for the searches' `blocked` argument."""
+        w = self.width
+        return {y * w + x for x, y in tiles if self.in_bounds(x, y)}
+
+    def neighbors(
+        self, i: int, blocked: frozenset[int] | set[int] = frozenset(), dynamic: bool = False
+    ) -> Iterator[int]:
+        """4-connected walkable neighbours of a flat index (dynamic=True also skips occupied tiles)."""
+        w = self.width
+        x = i % w
+        walkable = self.walkable
+        occupied = self.occupied
+        for n, ok in ((i - w, i >= w), (i + w, i + w < len(walkable)), (i - 1, x > 0), (i + 1, x < w - 1)):
+            if ok and walkable[n] and n not in blocked and not (dynamic and occupied[n]):
+                yield n
@@ -0,0 +1,80 @@
+from __future__ import annotations
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from src.utils import Logger
+
+
+class PathService:
+    """
+    Runs path searches on a background worker so the frame thread never
+    waits for one.
+
+    Only the newest request matters: submitting a new one cancels the
+    previous request if it hasn't started yet, and drops its result if it
+    has. The game calls poll() once per frame and picks up the result
+    when it's ready, and can keep updating (and the player keep walking)
+    in the meantime.
+
+    A single worker also serialises every search, so the navigator's
+    caches are only ever touched by one search at a time.
+    """
+    _executor: ThreadPoolExecutor
+    _lock: threading.Lock
+    _future: Future | None
+    _generation: int
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PathService")
+        self._lock = threading.Lock()
+        self._future = None
+        self._generation = 0
+
+    @property
+    def pending(self) -> bool:
+        return self._future is not None
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue fn(*args, **kwargs), replacing whatever was asked for before."""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            if self._future is not None:
+                self._future.cancel()
+            self._future = self._executor.submit(self._run, generation, fn, args, kwargs)
+            return self._future
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._generation += 1
+            if self._future is not None:
+                self._future.cancel()
+            self._future = None
+
+    def poll(self) -> Any | None:
+        """Result of the newest request once it's done, else None (each result is returned once)."""
+        future = self._future
+        if future is None or not future.done():
+            return None
+        with self._lock:
+            if future is not self._future:
+                return None
+            self._future = None
+        try:
+            return future.result()
+        except CancelledError:
+            return None
+        except Exception as e:
+            Logger.warning(f"Path search failed: {e}")
+            return None
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, generation: int, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        # Superseded while it was waiting in the queue: don't bother searching
+        if generation != self._generation:
+            raise CancelledError()
+        return fn(*args, **kwargs)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from math import ceil, floor
+
+from .grid import WalkableGrid
+
+Tile = tuple[int, int]
+
+# Samples per tile along a segment; the box swept between two samples is
+# checked as a whole, so this only trades a few extra lookups for speed
+SAMPLES = 4
+
+
+def line_of_sight(
+    grid: WalkableGrid,
+    a: Tile,
+    b: Tile,
+    blocked: frozenset[int] | set[int] = frozenset(),
+) -> bool:
+    """
+    True if a one-tile box (the player) can slide in a straight line from
+    tile a to tile b touching only walkable tiles that are neither blocked
+    nor occupied in the grid's overlay. The tiles of a and b themselves are
+    not checked, so a path may start on a bush.
+    """
+    ax, ay = a
+    bx, by = b
+    dx = bx - ax
+    dy = by - ay
+    steps = max(abs(dx), abs(dy)) * SAMPLES
+    if steps == 0:
+        return True
+
+    w = grid.width
+    walkable = grid.walkable
+    occupied = grid.occupied
+    ends = (ay * w + ax, by * w + bx)
+    px, py = ax, ay
+    for k in range(1, steps + 1):
+        x = ax + dx * k / steps
+        y = ay + dy * k / steps
+        # Every tile the box can overlap while moving from the last sample to this one
+        x0, x1 = floor(min(px, x)), ceil(max(px, x) + 1) - 1
+        y0, y1 = floor(min(py, y)), ceil(max(py, y) + 1) - 1
+        for ty in range(y0, y1 + 1):
+            row = ty * w
+            for tx in range(x0, x1 + 1):
+                i = row + tx
+                if i in ends:
+                    continue
+                if not walkable[i] or occupied[i] or i in blocked:
+                    return False
+        px, py = x, y
+    return True
+
+
+def compress_path(path: list[Tile]) -> list[Tile]:
+    """Drop the tiles in the middle of straight runs, keeping start, corners and goal."""
+    if len(path) <= 2:
+        return list(path)
+    out = [path[0]]
+    for prev, cur, nxt in zip(path, path[1:], path[2:]):
+        if (cur[0] - prev[0], cur[1] - prev[1]) != (nxt[0] - cur[0], nxt[1] - cur[1]):
+            out.append(cur)
+    out.append(path[-1])
+    return out
+
+
+def smooth_path(
+    grid: WalkableGrid,
+    path: list[Tile],
+    blocked: frozenset[int] | set[int] = frozenset(),
+) -> list[Tile]:
+    """
+    Any-angle waypoints for a tile path (Theta*-style post-smoothing).
+
+    The path is first cut down to its corners, then every corner that the
+    previous kept waypoint can see past is dropped. Consecutive waypoints
+    are always connected by a straight line the player fits along.
+    """
+    corners = compress_path(path)
+    if len(corners) <= 2:
+        return corners
+    out = [corners[0]]
+    anchor = corners[0]
+    for cur, nxt in zip(corners[1:], corners[2:]):
+        if not line_of_sight(grid, anchor, nxt, blocked):
+            out.append(cur)
+            anchor = cur
+    out.append(corners[-1])
+    return out
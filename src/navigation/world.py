@@ -0,0 +1,217 @@
+from __future__ import annotations
+import heapq
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.utils import GameSettings, Teleport
+from .astar import PathResult, astar
+from .distance_field import DistanceField, DistanceFieldCache
+from .smoothing import smooth_path
+
+if TYPE_CHECKING:
+    from src.maps.map_loader import MapLoader
+
+Tile = tuple[int, int]
+Node = tuple[str, Tile]         # (map key, tile)
+
+# Cost of going through a teleporter, in steps
+TELEPORT_COST = 1
+
+
+@dataclass
+class NavLeg:
+    """Walk on one map from start to goal; every leg but the last ends on a teleporter."""
+    map_key: str
+    start: Tile
+    goal: Tile
+
+
+@dataclass
+class WorldPlan:
+    legs: list[NavLeg] = field(default_factory=list)
+    cost: int = 0               # steps, teleports included
+    expanded: int = 0           # high-level nodes expanded
+
+    @property
+    def found(self) -> bool:
+        return bool(self.legs)
+
+    def __bool__(self) -> bool:
+        return self.found
+
+
+@dataclass
+class _Portal:
+    exit: Tile                  # teleporter tile on this map
+    destination: str
+    arrival: Tile               # where the teleporter puts the player
+
+
+class WorldNavigator:
+    """
+    Hierarchical (HPA*-style) planner across maps connected by teleporters.
+
+    Every map is abstracted to its portal tiles: teleporters leaving it
+    (exits) and tiles other maps' teleporters drop the player on (arrivals).
+    Every exit and every destination gets a DistanceField, computed once
+    and cached, so walking costs between portals, from the start and to the
+    goal are all array lookups.
+
+    A query is a Dijkstra over the small portal graph. Legs are refined into
+    tiles by descending the field of their goal around the NPCs and trainers
+    in the grid's overlay, only falling back to A* when they block every way
+    down, and the tiles are then smoothed into any-angle waypoints. The
+    first leg is refined right away, the others with refine() once the
+    player arrives on their map.
+
+    The portal graph comes from the save entries, so only maps a query
+    actually walks through are loaded.
+    """
+    maps: MapLoader
+    _portals: dict[str, list[_Portal]]
+    _arrivals: dict[str, set[Tile]]
+    _links: dict[str, tuple[int, dict[Tile, dict[Tile, int]]]]
+    _teleport_tiles: dict[str, frozenset[int]]
+    fields: DistanceFieldCache
+
+    def __init__(self, maps: MapLoader):
+        self.maps = maps
+        self._portals = {}
+        self._arrivals = {key: set() for key in maps}
+        self._links = {}
+        self._teleport_tiles = {}
+        self.fields = DistanceFieldCache()
+
+        tile = GameSettings.TILE_SIZE
+        for key in maps:
+            entry = maps.entry(key)
+            portals = []
+            for data in entry.get("teleport", []):
+                tp = Teleport.from_dict(data)
+                if tp.destination not in maps:
+                    continue
+                if tp.dest_pos is not None:
+                    arrival = (int(tp.dest_pos.x // tile), int(tp.dest_pos.y // tile))
+                else:
+                    spawn = maps.entry(tp.destination)["player"]
+                    arrival = (int(spawn["x"]), int(spawn["y"]))
+                portals.append(_Portal((int(tp.pos.x // tile), int(tp.pos.y // tile)), tp.destination, arrival))
+                self._arrivals[tp.destination].add(arrival)
+            self._portals[key] = portals
+
+    def plan(self, start_key: str, start: Tile, goal_key: str, goal: Tile) -> WorldPlan:
+        if start_key not in self.maps or goal_key not in self.maps:
+            return WorldPlan()
+
+        goal_grid = self.maps.get(goal_key).walkable_grid
+        if not goal_grid.is_walkable(*goal):
+            return WorldPlan()
+        to_goal = self.field(goal_key, goal)
+
+        start_node: Node = (start_key, start)
+        best: dict[Node, int] = {start_node: 0}
+        parent: dict[Node | None, tuple[Node, NavLeg]] = {}
+        heap: list[tuple[int, int, Node]] = [(0, 0, start_node)]
+        counter = 1
+        expanded = 0
+        goal_cost = None
+
+        while heap:
+            cost, _, node = heapq.heappop(heap)
+            if cost > best.get(node, 1 << 30):
+                continue
+            if goal_cost is not None and cost >= goal_cost:
+                break
+            expanded += 1
+            key, tile = node
+
+            walk = to_goal.distance(*tile) if key == goal_key else None
+            if walk is not None:
+                total = cost + walk
+                if goal_cost is None or total < goal_cost:
+                    goal_cost = total
+                    parent[None] = (node, NavLeg(key, tile, goal))
+
+            if node == start_node:
+                exits = self._exit_costs(key, tile)
+            else:
+                exits = self._arrival_links(key).get(tile, {})
+
+            for portal in self._portals[key]:
+                walk = exits.get(portal.exit)
+                if walk is None:
+                    continue
+                nxt: Node = (portal.destination, portal.arrival)
+                new_cost = cost + walk + TELEPORT_COST
+                if new_cost < best.get(nxt, 1 << 30):
+                    best[nxt] = new_cost
+                    parent[nxt] = (node, NavLeg(key, tile, portal.exit))
+                    heapq.heappush(heap, (new_cost, counter, nxt))
+                    counter += 1
+
+        if goal_cost is None:
+            return WorldPlan([], 0, expanded)
+
+        legs = []
+        cur: Node | None = None
+        while cur != start_node:
+            prev, leg = parent[cur]
+            legs.append(leg)
+            cur = prev
+        legs.reverse()
+        return WorldPlan(legs, goal_cost, expanded)
+
+    def field(self, key: str, goal: Tile) -> DistanceField:
+        """Distance field to goal on map key (teleporters are not walked through)."""
+        grid = self.maps.get(key).walkable_grid
+        return self.fields.get((key, goal), grid, goal, self._teleports(key))
+
+    def refine(self, leg: NavLeg, blocked: set[int] | None = None) -> PathResult:
+        """
+        Waypoints for one leg, from start to goal, with a straight walkable
+        line between each pair. Other teleporters on the way are avoided so
+        the player doesn't get sent to another map halfway through.
+        """
+        grid = self.maps.get(leg.map_key).walkable_grid
+        avoid = set(self._teleports(leg.map_key))
+        if blocked:
+            avoid |= blocked
+        avoid.discard(grid.index(*leg.goal))
+        avoid.discard(grid.index(*leg.start))
+
+        path = self.field(leg.map_key, leg.goal).path_from(leg.start, blocked or frozenset())
+        if path is not None:
+            result = PathResult(path, 0)
+        else:
+            # NPCs or trainers block every way down the field: search around them
+            result = astar(grid, leg.start, leg.goal, avoid)
+        if result:
+            result.path = smooth_path(grid, result.path, avoid)
+        return result
+
+    def _exit_costs(self, key: str, origin: Tile) -> dict[Tile, int]:
+        costs = {}
+        for portal in self._portals[key]:
+            walk = self.field(key, portal.exit).distance(*origin)
+            if walk is not None:
+                costs[portal.exit] = walk
+        return costs
+
+    def _arrival_links(self, key: str) -> dict[Tile, dict[Tile, int]]:
+        # Walking cost from each arrival to each exit, redone when the map's walls change
+        # (NPCs and trainers don't count: refine() walks around them)
+        version = self.maps.get(key).walkable_grid.version
+        cached = self._links.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, {arrival: self._exit_costs(key, arrival) for arrival in self._arrivals[key]})
+            self._links[key] = cached
+        return cached[1]
+
+    def _teleports(self, key: str) -> frozenset[int]:
+        tiles = self._teleport_tiles.get(key)
+        if tiles is None:
+            game_map = self.maps.get(key)
+            index = game_map.tile_index
+            tiles = frozenset(game_map.walkable_grid.blocked_indices(index.tiles(index.TELEPORT)))
+            self._teleport_tiles[key] = tiles
+        return tiles
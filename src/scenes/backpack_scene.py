@@ -1,58 +1,29 @@
 import pygame as pg
-from src.scenes.scene import Scene
-from src.core.services import sound_manager, scene_manager, input_manager
+from src.scenes.overlay_scene import OverlayScene, DirtyRegion
+from src.core.services import sound_manager, scene_manager, input_manager, resource_manager, text_cache
 from src.sprites import Sprite
 from src.interface.components import Button
 from typing import override
 
-class BackpackScene(Scene):
+class BackpackScene(OverlayScene):
 
     def __init__(self):
         super().__init__()
 
-        self.font_title = pg.font.Font("assets/fonts/Minecraft.ttf", 32)
-        self.font_label = pg.font.Font("assets/fonts/Minecraft.ttf", 18)
-        self.font_small = pg.font.Font("assets/fonts/Minecraft.ttf", 16)
-
-        # self.img_potion = pg.transform.scale(
-        #     pg.image.load("assets/images/ingame_ui/potion.png").convert_alpha(),
-        #     (30, 30)
-        # )
-        self.img_heal_potion = pg.transform.scale(
-            pg.image.load("assets/images/ingame_ui/heal_potion.png").convert_alpha(),
-            (30, 30)
-        )
-        self.img_strength_potion = pg.transform.scale(
-            pg.image.load("assets/images/ingame_ui/strength_potion.png").convert_alpha(),
-            (30, 30)
-        )
-        self.img_defense_potion = pg.transform.scale(
-            pg.image.load("assets/images/ingame_ui/defense_potion.png").convert_alpha(),
-            (30, 30)
-        )
-        self.img_coin = pg.transform.scale(
-            pg.image.load("assets/images/ingame_ui/coin.png").convert_alpha(),
-            (30, 30)
-        )
-        self.img_pokeball = pg.transform.scale(
-            pg.image.load("assets/images/ingame_ui/ball.png").convert_alpha(),
-            (30, 30)
-        )
+        self.font_title = text_cache.font("Minecraft.ttf", 32)
+        self.font_label = text_cache.font("Minecraft.ttf", 18)
+        self.font_small = text_cache.font("Minecraft.ttf", 16)
 
-        self.img_pokemon = pg.transform.scale(
-            pg.image.load("assets/images/menu_sprites/menusprite2.png").convert_alpha(),
-            (60, 60)
-        )
+        self.img_heal_potion = resource_manager.get_image("ingame_ui/heal_potion.png", (30, 30))
+        self.img_strength_potion = resource_manager.get_image("ingame_ui/strength_potion.png", (30, 30))
+        self.img_defense_potion = resource_manager.get_image("ingame_ui/defense_potion.png", (30, 30))
+        self.img_coin = resource_manager.get_image("ingame_ui/coin.png", (30, 30))
+        self.img_pokeball = resource_manager.get_image("ingame_ui/ball.png", (30, 30))
 
-        # 半透明背景
-        self.overlay = pg.Surface(
-            (1280, 720), pg.SRCALPHA
-        )  # 根據遊戲的實際 resolution 調整
-        self.overlay.fill((0, 0, 0, 160))
+        self.img_pokemon = resource_manager.get_image("menu_sprites/menusprite2.png", (60, 60))
 
         # UI 主視窗
-        self.window_img = pg.image.load("assets/images/backgrounds/backpack.png").convert_alpha()
-        self.window_img = pg.transform.scale(self.window_img, (700, 480))
+        self.window_img = resource_manager.get_image("backgrounds/backpack.png", (700, 480))
         self.window_rect = self.window_img.get_rect(center=(640, 360))
 
         # Back 按鈕
@@ -98,37 +69,27 @@ class BackpackScene(Scene):
         self.VISIBLE_ROWS = 3
         self.scroll_index = 0
 
+        # 怪物清單可見範圍（裁切區域）/ 右邊道具列表範圍
+        self.list_rect = pg.Rect(
+            self.window_rect.left + 40,
+            self.window_rect.top + 80,
+            360,     # 左側怪物清單寬度
+            360      # 高度
+        )
+        self.items_rect = pg.Rect(
+            self.window_rect.left + 420,
+            self.window_rect.top + 100,
+            self.window_rect.width - 420 - 40,
+            self.window_rect.height - 100 - 20
+        )
+
         
         
 
     @override
     def enter(self) -> None:
         print("[SettingsScene] Enter")
-        screen = pg.display.get_surface()
-        self.background_capture = screen.copy()
-        # 預載圖片
-        self.cached_mon_images = {}
-        self.cached_item_images = {}
-
-        game_scene = scene_manager._scenes["game"]
-        bag = game_scene.game_manager.bag
-
-        # 預載怪獸圖片
-        for mon in bag.monsters:
-            path = mon["sprite_path"]
-            if path not in self.cached_mon_images:
-                img = pg.image.load(path).convert_alpha()
-                img = pg.transform.scale(img, (60, 60))
-                self.cached_mon_images[path] = img
-
-        # 預載道具圖片
-        for item in bag.items:
-            full_path = "assets/images/" + item["sprite_path"]
-            if full_path not in self.cached_item_images:
-                img = pg.image.load(full_path).convert_alpha()
-                img = pg.transform.scale(img, (30, 30))
-                self.cached_item_images[full_path] = img
-
+        super().enter()
 
     @override
     def exit(self) -> None:
@@ -153,52 +114,60 @@ class BackpackScene(Scene):
 
 
     @override
-    def draw(self, screen: pg.Surface):
-        VISIBLE_ROWS = 3
-        BOX_H = 95
-        # 先畫剛剛截到的 GameScene
-        screen.blit(self.background_capture, (0, 0))
-
-        # 半透明覆蓋
-        screen.blit(self.overlay, (0, 0))
-        
+    def draw_static(self, surface: pg.Surface):
         # 視窗
-        screen.blit(self.window_img, self.window_rect)
+        surface.blit(self.window_img, self.window_rect)
 
         # BAG 標題
         title = self.font_title.render("BAG", True, (255, 255, 255))
-        screen.blit(title, (self.window_rect.left + 35, self.window_rect.top + 30))
-        
-        self.btn_x.draw(screen)
+        surface.blit(title, (self.window_rect.left + 35, self.window_rect.top + 30))
 
-        # 製作裁切區域（怪物清單可見範圍
-        clip_rect = pg.Rect(
-            self.window_rect.left + 40,
-            self.window_rect.top + 80,
-            360,     # 左側怪物清單寬度
-            360      # 高度
+    @override
+    def build_regions(self) -> list[DirtyRegion]:
+        return [
+            DirtyRegion.for_button(self.btn_x),
+            DirtyRegion(self.list_rect, self._monster_list_state, self._draw_monster_list),
+            DirtyRegion(self.items_rect, self._item_list_state, self._draw_item_list),
+            DirtyRegion.for_button(self.btn_up),
+            DirtyRegion.for_button(self.btn_down),
+        ]
+
+    def _visible_monsters(self) -> list[dict]:
+        bag = scene_manager._scenes["game"].game_manager.bag
+        start_index = self.scroll_index
+        end_index = min(start_index + self.VISIBLE_ROWS, len(bag.monsters))
+        return bag.monsters[start_index:end_index]
+
+    def _monster_list_state(self):
+        return tuple(
+            (mon["name"], mon.get("level", 5), mon["hp"], mon["max_hp"], mon["sprite_path"])
+            for mon in self._visible_monsters()
         )
-        screen.set_clip(clip_rect)
+
+    def _item_list_state(self):
+        bag = scene_manager._scenes["game"].game_manager.bag
+        return tuple((item["name"], item["count"], item["sprite_path"]) for item in bag.items)
+
+    def _draw_monster_list(self, screen: pg.Surface):
+        BOX_H = 95
+        # 製作裁切區域（怪物清單可見範圍
+        clip_rect = self.list_rect
+        old_clip = screen.get_clip()
+        screen.set_clip(clip_rect.clip(old_clip))
 
         # 頭像
         game_scene = scene_manager._scenes["game"]
         bag = game_scene.game_manager.bag
 
         list_x = self.window_rect.left + 50
-        list_y = self.window_rect.top + 90 + self.scroll_offset
         gap_y  = 110
 
-        start_index = self.scroll_index
-        end_index = min(start_index + VISIBLE_ROWS, len(bag.monsters))
-
         self.max_scroll = max(
             0,
-            (len(bag.monsters) - VISIBLE_ROWS) * gap_y
+            (len(bag.monsters) - self.VISIBLE_ROWS) * gap_y
         )
 
-        for row, i in enumerate(range(start_index, end_index)):
-            mon = bag.monsters[i]
-
+        for row, mon in enumerate(self._visible_monsters()):
             box_x = list_x
             box_y = self.window_rect.top + 90 + row * gap_y
             box_w = 330
@@ -207,7 +176,7 @@ class BackpackScene(Scene):
             pg.draw.rect(screen, (255,255,255), (box_x, box_y, box_w, box_h))
             pg.draw.rect(screen, (0,0,0), (box_x, box_y, box_w, box_h), 3)
 
-            sprite = self.cached_mon_images[mon["sprite_path"]]
+            sprite = resource_manager.get_image(mon["sprite_path"], (60, 60))
             screen.blit(sprite, (box_x + 10, box_y + 15))
 
             name_txt = self.font_label.render(mon["name"], True, (0, 0, 0))
@@ -232,18 +201,17 @@ class BackpackScene(Scene):
             screen.blit(hp_txt, (bar_x, bar_y + 12))
 
         # 取消裁切
-        screen.set_clip(None)
+        screen.set_clip(old_clip)
 
+    def _draw_item_list(self, screen: pg.Surface):
         # 右邊：道具列表
-        item_x = self.window_rect.left + 420
-        item_y = self.window_rect.top + 100
-
-        items = bag.items
-        y = item_y
+        bag = scene_manager._scenes["game"].game_manager.bag
+        item_x = self.items_rect.left
+        y = self.items_rect.top
 
-        for item in items:
+        for item in bag.items:
             # 圖片
-            icon = self.cached_item_images["assets/images/" + item["sprite_path"]]
+            icon = resource_manager.get_image(item["sprite_path"], (30, 30))
 
             screen.blit(icon, (item_x, y))
 
@@ -259,10 +227,6 @@ class BackpackScene(Scene):
 
             y += 70
 
-        self.btn_up.draw(screen)
-        self.btn_down.draw(screen)
-    
-            
     def scroll_up(self):
         self.scroll_index = max(0, self.scroll_index - 1)
 
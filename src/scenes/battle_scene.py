@@ -1,7 +1,8 @@
 import pygame as pg
 from src.scenes.scene import Scene
 from typing import override
-from src.core.services import scene_manager, input_manager
+from src.core.services import scene_manager, input_manager, resource_manager, text_cache
+from src.utils import GameSettings
 import random
 import copy
 
@@ -34,48 +35,52 @@ class BattleScene(Scene):
         self.end_timer = 0.0
 
         # UI fonts
-        self.font_big = pg.font.Font("assets/fonts/Minecraft.ttf", 32)
-        self.font_mid = pg.font.Font("assets/fonts/Minecraft.ttf", 24)
-        self.font_small = pg.font.Font("assets/fonts/Minecraft.ttf", 18)
-
-        # background
-        self.bg = pg.image.load("assets/images/backgrounds/background1.png").convert()
+        self.font_big = text_cache.font("Minecraft.ttf", 32)
+        self.font_mid = text_cache.font("Minecraft.ttf", 24)
+        self.font_small = text_cache.font("Minecraft.ttf", 18)
+
+        # background (scaled once, not every frame)
+        self.bg = pg.transform.scale(
+            pg.image.load("assets/images/backgrounds/background1.png").convert(),
+            (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT)
+        )
 
         # element icon (top-left)
-        self.element_icon = pg.image.load(
-            "assets/images/sprites/element.png"
-        ).convert_alpha()
-
-        self.element_icon = pg.transform.scale(self.element_icon, (90, 90))
+        self.element_icon = resource_manager.get_image("sprites/element.png", (90, 90))
 
 
         # fallback sprites (before start_battle)
-        self.player_sprite = pg.transform.scale(
-            pg.transform.flip(
-                pg.image.load("assets/images/menu_sprites/menusprite2.png").convert_alpha(),
-                True, False
-            ),
-            (160, 160)
+        self.player_sprite = pg.transform.flip(
+            resource_manager.get_image("menu_sprites/menusprite2.png", (160, 160)), True, False
         )
-        enemy_img = pg.image.load("assets/images/menu_sprites/menusprite3.png").convert_alpha()
-        self.enemy_sprite = pg.transform.scale(enemy_img, (160, 160))
+        self.enemy_sprite = resource_manager.get_image("menu_sprites/menusprite3.png", (160, 160))
 
-        # main buttons (bottom)
+        # main buttons (bottom row, under the prompt)
         self.buttons = {
-            "fight": pg.Rect(180, 550, 140, 40),
-            "item":  pg.Rect(330, 550, 140, 40),
-            "switch": pg.Rect(480, 550, 140, 40),
-            "run":   pg.Rect(630, 550, 140, 40),
+            "fight": pg.Rect(180, 620, 140, 40),
+            "item":  pg.Rect(380, 620, 140, 40),
+            "switch": pg.Rect(580, 620, 140, 40),
+            "run":   pg.Rect(780, 620, 140, 40),
         }
 
         # item menu buttons (reuse bottom area when in item_menu)
         self.item_buttons = {
-            "heal": pg.Rect(180, 550, 200, 40),
-            "strength": pg.Rect(400, 550, 260, 40),
-            "defense": pg.Rect(690, 550, 240, 40),
-            "back": pg.Rect(180, 610, 140, 40),
+            "heal": pg.Rect(120, 610, 200, 40),
+            "strength": pg.Rect(390, 610, 260, 40),
+            "defense": pg.Rect(720, 610, 240, 40),
+            "back": pg.Rect(120, 660, 140, 40),
+        }
+        self.item_labels = {
+            "heal": "Heal Potion",
+            "strength": "Strength Potion",
+            "defense": "Defense Potion",
+            "back": "Back",
         }
 
+        # Whole battle frame, redrawn only when _hud_signature() changes
+        self._hud = pg.Surface((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT)).convert()
+        self._hud_key: tuple | None = None
+
         self.pending_enemy_action = False
 
         # placeholders (set in start_battle)
@@ -236,9 +241,8 @@ class BattleScene(Scene):
 
         # reload player sprite immediately
         try:
-            self.player_sprite = pg.transform.scale(
-                pg.transform.flip(pg.image.load(mon["sprite_path"]).convert_alpha(), True, False),
-                (160, 160)
+            self.player_sprite = pg.transform.flip(
+                resource_manager.get_image(mon["sprite_path"], (160, 160)), True, False
             )
         except Exception:
             # if asset missing, at least don't crash
@@ -261,12 +265,10 @@ class BattleScene(Scene):
         self._ensure_stats(self.enemy_mon, is_enemy=True)
 
         # sprites
-        self.player_sprite = pg.transform.scale(
-            pg.transform.flip(pg.image.load(self.player_mon["sprite_path"]).convert_alpha(), True, False),
-            (160, 160)
+        self.player_sprite = pg.transform.flip(
+            resource_manager.get_image(self.player_mon["sprite_path"], (160, 160)), True, False
         )
-        enemy_img = pg.image.load(self.enemy_mon["sprite_path"]).convert_alpha()
-        self.enemy_sprite = pg.transform.scale(enemy_img, (160, 160))
+        self.enemy_sprite = resource_manager.get_image(self.enemy_mon["sprite_path"], (160, 160))
 
         self.pending_enemy_action = False
         self.state = "player_turn"
@@ -408,11 +410,30 @@ class BattleScene(Scene):
         pg.draw.rect(screen, (40, 40, 40), (x, y, bar_w, bar_h))
         pg.draw.rect(screen, (0, 200, 0), (x, y, int(bar_w * ratio), bar_h))
 
+    def _hud_signature(self) -> tuple:
+        # Everything the battle frame depends on; nothing in it animates
+        p, e = self.player_mon, self.enemy_mon
+        return (
+            self.state, self.message,
+            e["name"], e["level"], e.get("element", "Normal"), e["hp"], e["max_hp"],
+            p["name"], p["level"], p.get("element", "Normal"), p["hp"], p["max_hp"],
+            int(p.get("atk_buff", 0)), int(p.get("def_buff", 0)),
+            # The surfaces themselves, not id(): Surface has no __eq__, so they
+            # compare by identity, and holding them keeps an id from being reused
+            self.player_sprite, self.enemy_sprite,
+        )
+
     @override
     def draw(self, screen: pg.Surface):
+        key = self._hud_signature()
+        if key != self._hud_key:
+            self._hud_key = key
+            self._draw_hud(self._hud)
+        screen.blit(self._hud, (0, 0))
+
+    def _draw_hud(self, screen: pg.Surface):
         # background
-        bg_scaled = pg.transform.scale(self.bg, (1280, 720))
-        screen.blit(bg_scaled, (0, 0))
+        screen.blit(self.bg, (0, 0))
 
         # element icon (top-left)
         screen.blit(self.element_icon, (20, 20))
@@ -480,37 +501,17 @@ class BattleScene(Scene):
         screen.blit(prompt, (50, 550))
 
         # draw buttons
-        base_y = 620
-        button_gap = 200
-        start_x = 180
-
         if self.state != "item_menu":
             # main 4 buttons
-            for i, (name, rect) in enumerate(self.buttons.items()):
-                rect.x = start_x + i * button_gap
-                rect.y = base_y
+            for name, rect in self.buttons.items():
                 pg.draw.rect(screen, (240, 240, 240), rect)
                 pg.draw.rect(screen, (0, 0, 0), rect, 2)
                 text = self.font_mid.render(name.capitalize(), True, (0, 0, 0))
                 screen.blit(text, (rect.x + 18, rect.y + 5))
         else:
             # item menu buttons
-            # place them nicely
-            self.item_buttons["heal"].x, self.item_buttons["heal"].y = 120, 610
-            self.item_buttons["strength"].x, self.item_buttons["strength"].y = 390, 610
-            self.item_buttons["defense"].x, self.item_buttons["defense"].y = 720, 610
-            self.item_buttons["back"].x, self.item_buttons["back"].y = 120, 660
-
-            labels = {
-                "heal": "Heal Potion",
-                "strength": "Strength Potion",
-                "defense": "Defense Potion",
-                "back": "Back",
-            }
-
             for key, rect in self.item_buttons.items():
                 pg.draw.rect(screen, (240, 240, 240), rect)
                 pg.draw.rect(screen, (0, 0, 0), rect, 2)
-                text = self.font_small.render(labels[key], True, (0, 0, 0))
+                text = self.font_small.render(self.item_labels[key], True, (0, 0, 0))
                 screen.blit(text, (rect.x + 10, rect.y + 10))
-
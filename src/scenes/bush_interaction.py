@@ -1,36 +1,49 @@
 import pygame as pg
-import math
-from src.utils import Position, GameSettings
+from src.utils import GameSettings
+from src.maps.tile_index import TileIndex
 
 class BushInteraction:
-    def __init__(self, bush_rect: pg.Rect, player):
-        self.rect = bush_rect   # 草叢範圍（世界座標）
+    """
+    草叢遇敵判定：直接查玩家佔到的 tile 在不在 map 的 bush tile 裡（O(1)），
+    只有「踏進新的草叢 tile」那一刻 near 才會是 True，待在草叢裡不會每幀觸發
+    """
+    def __init__(self, game_map, player):
         self.player = player
         self.near = False
+        self.set_map(game_map)
 
-    def update(self):
-        # px = self.player.position.x
-        # py = self.player.position.y
-        # # 這邊用玩家的 position 和 bush_rect 碰撞檢查
-        # '''if self.rect.collidepoint(px, py):
-        #     self.near = True
-        # else:
-        #     self.near = False'''
-        # player_rect = pg.Rect(px, py, GameSettings.TILE_SIZE, GameSettings.TILE_SIZE)
+    def set_map(self, game_map):
+        self.index: TileIndex = game_map.tile_index
+        self._span = None
+        self._occupied: frozenset[tuple[int, int]] = frozenset()
+        # 出生/回到地圖時本來就站在草叢上，不算踏進去
+        self._refresh()
+        self.near = False
 
-        # self.near = player_rect.colliderect(self.rect)
+    def _refresh(self) -> bool:
         size = GameSettings.TILE_SIZE
+        px = int(self.player.position.x)
+        py = int(self.player.position.y)
+        # 玩家 hitbox 佔到的 tile 範圍
+        span = (px // size, py // size, (px + size - 1) // size, (py + size - 1) // size)
+        if span == self._span:
+            return False
+        self._span = span
 
-        # 玩家世界座標 rect
-        player_rect = pg.Rect(
-            self.player.position.x,
-            self.player.position.y,
-            size,
-            size
+        x0, y0, x1, y1 = span
+        index = self.index
+        occupied = frozenset(
+            (tx, ty)
+            for ty in range(y0, y1 + 1)
+            for tx in range(x0, x1 + 1)
+            if index.has(tx, ty, TileIndex.BUSH)
         )
+        entered = not occupied <= self._occupied
+        self._occupied = occupied
+        return entered
 
-        # 只要站在草叢上（有重疊）就觸發
-        self.near = player_rect.colliderect(self.rect)
+    def update(self):
+        self.near = self._refresh()
 
     def draw(self, screen: pg.Surface, camera):
-        pass
\ No newline at end of file
+        pass
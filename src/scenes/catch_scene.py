@@ -1,6 +1,6 @@
 import pygame as pg
 from src.scenes.scene import Scene
-from src.core.services import scene_manager
+from src.core.services import scene_manager, resource_manager
 import random
 import copy
 
@@ -53,10 +53,7 @@ class CatchScene(Scene):
 
         self.mon = base
 
-        self.sprite = pg.transform.scale(
-            pg.image.load(self.mon["sprite_path"]).convert_alpha(),
-            (180, 180)
-        )
+        self.sprite = resource_manager.get_image(self.mon["sprite_path"], (180, 180))
 
     def update(self, dt):
         keys = pg.key.get_pressed()
@@ -1,191 +1,42 @@
+import math
 import pygame as pg
 import threading
 import time
 
 from src.scenes.scene import Scene
 from src.core import GameManager, OnlineManager
-from src.utils import Logger, PositionCamera, GameSettings, Position
-from src.core.services import sound_manager, scene_manager, input_manager
-from src.sprites import Sprite
+from src.utils import Logger, PositionCamera, GameSettings, Position, SpatialGrid, EntityScheduler
+from src.maps.tile_index import TileIndex
+from src.core.services import sound_manager, scene_manager, input_manager, resource_manager, profiler
+from src.sprites import Sprite, RenderQueue
 from typing import override
 from src.interface.components import Button
 from src.scenes.bush_interaction import BushInteraction
 from src.interface.components.chat_overlay import ChatOverlay
+from src.interface.components.chat_bubble import ChatBubbleCache
 from src.sprites import Animation # 用你的動畫系統
 from src.scenes.navigation_scene import NavigationScene
-from collections import deque
+from src.navigation import PathService, WorldNavigator, line_of_sight
+from src.entities.roaming_crowd import RoamingCrowd
+from src.entities.trainer_table import TrainerTable
 
 
-NAV_PLACES = {
-    "Start": (16, 30),   # tile 座標
-    "Gym":   (24, 25),
-}
+def _plan_route(navigator: WorldNavigator, start_map, start, goal_map, goal):
+    """在 PathService 的 worker 上跑：跨地圖規劃 + 展開第一段"""
+    plan = navigator.plan(start_map, start, goal_map, goal)
+    if not plan:
+        Logger.warning(f"No route to {goal_map} {goal} from {start} ({plan.expanded} nodes expanded)")
+        return start_map, start, None, []
+    leg, *rest = plan.legs
+    return _refine_leg(navigator, leg, rest)
 
-def bfs(grid, start, goal):
-    q = deque([start])
-    came_from = {start: None}
-
-    while q:
-        x, y = q.popleft()
-        if (x, y) == goal:
-            break
-
-        for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
-            nx, ny = x + dx, y + dy
-            if (nx, ny) in came_from:
-                continue
-            if not grid[ny][nx]:
-                continue
-
-            came_from[(nx, ny)] = (x, y)
-            q.append((nx, ny))
-
-    path = []
-    cur = goal
-    while cur:
-        path.append(cur)
-        cur = came_from.get(cur)
-    path.reverse()
-    return path
-    
-def try_get_flower_rects_from_tmx(game_map) -> list[pg.Rect]:
-    """
-    不靠 layer 名完全匹配。
-    -layer 名只要包含 flower / plant / decor 就視為可能花層
-    - 或者 tile 本身有 properties（例如 type=flower / collide=true / blocked=true）也會被擋
-    """
-    TILE = GameSettings.TILE_SIZE
-    rects: list[pg.Rect] = []
-
-    tmx = getattr(game_map, "tmxdata", None)
-    if tmx is None:
-        return rects
-
-    layers = getattr(tmx, "visible_layers", None)
-    if not layers:
-        return rects
-
-    def is_flower_layer(layer_name: str) -> bool:
-        n = (layer_name or "").strip().lower()
-        return ("flower" in n) or ("plant" in n) or ("decor" in n)
-
-    def is_blocking_tile(gid: int) -> bool:
-        # pytmx：用 gid 取 tile properties
-        props = None
-        if hasattr(tmx, "get_tile_properties_by_gid"):
-            props = tmx.get_tile_properties_by_gid(gid)
-        if not props:
-            return False
-
-        # 常見命名：type / class / name / collide / collision / blocked / block
-        typ = str(props.get("type", props.get("class", props.get("name", "")))).lower()
-        if "flower" in typ or "plant" in typ:
-            return True
-
-        for k in ["collide", "collision", "blocked", "block", "solid"]:
-            v = props.get(k, False)
-            if v in (True, 1, "1", "true", "True", "yes", "Yes"):
-                return True
-
-        return False
-
-    for layer in layers:
-        name = getattr(layer, "name", "")
-        layer_hint = is_flower_layer(name)
-
-        if hasattr(layer, "tiles"):
-            for x, y, gid in layer.tiles():
-                if not gid:
-                    continue
-
-                # 兩種命中：花層（名稱包含關鍵字） or tile 自己標記是 blocking/flower
-                if layer_hint or is_blocking_tile(gid):
-                    rects.append(pg.Rect(x * TILE, y * TILE, TILE, TILE))
-
-    return rects
-
-def iter_obstacle_rects(game_scene):
-    game_map = game_scene.game_manager.current_map
-
-    # 牆
-    for r in getattr(game_map, "_collision_map", []):
-        yield r
-
-    # 草叢（不可走，保留）
-    if hasattr(game_map, "get_bush_tiles"):
-        for r in game_map.get_bush_tiles():
-            yield r
-
-    # 花 若已經有 try_get_flower_rects_from_tmx 直接用
-    if "try_get_flower_rects_from_tmx" in globals():
-        for r in try_get_flower_rects_from_tmx(game_map):
-            yield r
-
-    # 商店 NPC
-    npc_rect = getattr(game_scene.game_manager, "npc_collision_rect", None)
-    if npc_rect:
-        yield npc_rect
-
-    # 其他 trainer/NPC
-    for enemy in getattr(game_scene.game_manager, "current_enemy_trainers", []):
-        r = getattr(getattr(enemy, "animation", None), "rect", None) or getattr(enemy, "rect", None)
-        if r:
-            yield r
-
-
-def build_walkable_grid(game_scene):
-    """
-    game_scene: GameScene（不是 game_map）
-    可以同時拿到：
-    - game_scene.game_manager.current_map._collision_map
-    - game_scene.game_manager.npc_collision_rect
-    - game_scene.bush_list
-    """
-    game_map = game_scene.game_manager.current_map
-    TILE = GameSettings.TILE_SIZE
-
-    w = game_map.tmxdata.width
-    h = game_map.tmxdata.height
-    grid = [[True for _ in range(w)] for _ in range(h)]
-
-    def block_rect(rect: pg.Rect):
-        # 把一個 rect 覆蓋到所有 tile（支援 rect 跨多格）
-        left = max(0, rect.left // TILE)
-        right = min(w - 1, (rect.right - 1) // TILE)
-        top = max(0, rect.top // TILE)
-        bottom = min(h - 1, (rect.bottom - 1) // TILE)
-        for ty in range(top, bottom + 1):
-            for tx in range(left, right + 1):
-                grid[ty][tx] = False
-
-    # 牆（collision map）
-    for r in iter_obstacle_rects(game_scene):
-        block_rect(r)
-    #for rect in game_map._collision_map:
-    #    block_rect(rect)
-
-    # NPC
-    npc_rect = getattr(game_scene.game_manager, "npc_collision_rect", None)
-    if npc_rect is not None:
-        block_rect(npc_rect)
-
-    # 草叢（導航避開草叢）
-    #bush_list = getattr(game_scene, "bush_list", None)
-    for rect in game_map.get_bush_tiles():
-        block_rect(rect)
-
-    # 其他障礙 enemy trainers / NPC
-    for enemy in getattr(game_scene.game_manager, "current_enemy_trainers", []):
-        r = getattr(getattr(enemy, "animation", None), "rect", None)
-        if r:
-            block_rect(r)
-        else:
-            r2 = getattr(enemy, "rect", None)
-            if r2:
-                block_rect(r2)
-
-
-    return grid
+def _refine_leg(navigator: WorldNavigator, leg, rest):
+    # NPC / trainer 不用另外傳：搜尋直接看 walkable_grid 的 overlay
+    result = navigator.refine(leg)
+    if not result:
+        Logger.warning(f"No path on {leg.map_key} from {leg.start} to {leg.goal}")
+        return leg.map_key, leg.start, None, []
+    return leg.map_key, leg.start, result.path, rest
 
 
 class OnlinePlayerVisual:
@@ -230,10 +81,21 @@ class OnlinePlayerVisual:
         self.anim.update_pos(Position(self.x, self.y))
         self.anim.draw(screen, camera)
 
+    def queue_draw(self, queue: RenderQueue):
+        self.anim.update_pos(Position(self.x, self.y))
+        queue.submit(self.anim.current_frame(), self.anim.rect.topleft, RenderQueue.LAYER_ENTITIES)
+
 class GameScene(Scene):
     game_manager: GameManager
     online_manager: OnlineManager | None
     sprite_online: Sprite
+
+    CULL_CELL = 8 * GameSettings.TILE_SIZE      # 粗格子一格 8x8 tiles
+    UPDATE_MARGIN = 4 * GameSettings.TILE_SIZE  # 比 trainer 視線 (3 格) 再多一格
+    # 離玩家（和線上其他玩家）多遠還要 update：近的每 frame，中距離每 MID_INTERVAL frame，再遠就睡
+    NEAR_RANGE = max(GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT) // 2 + UPDATE_MARGIN
+    MID_RANGE = NEAR_RANGE + 16 * GameSettings.TILE_SIZE
+    MID_INTERVAL = 4
     
     def __init__(self):
         super().__init__()
@@ -246,6 +108,21 @@ class GameScene(Scene):
             Logger.error("Failed to load game manager")
             exit(1)
         self.game_manager = manager
+
+        # 自動導航：目前這段的 tile 路徑 + 之後幾段（跨地圖）
+        self.nav_path = []
+        self.nav_index = 0
+        self.nav_legs = []
+        self._navigator = None
+        # 搜尋在背景 worker 上跑，每個 frame poll 一次結果
+        self.path_service = PathService()
+        self._nav_goal = None
+        # 會走動的 trainer：每張地圖一個 crowd，進出選單也保留巡邏進度
+        self._crowds: dict[str, tuple[list, RoamingCrowd]] = {}
+        # trainer 的視線 tile 表（每張地圖一個，crowd 移動 trainer 時會更新）
+        self._trainer_tables: dict[str, tuple[list, TrainerTable]] = {}
+        # 商店 NPC 目前登記在哪張地圖的 overlay 上
+        self._npc_obstacle: tuple | None = None
         if not hasattr(self.game_manager, "teleport_cooldown"):
             self.game_manager.teleport_cooldown = 0.0
         
@@ -272,7 +149,7 @@ class GameScene(Scene):
             lambda: scene_manager.change_scene("navigation")  # 你要切的 scene
         )
         # 載入 NPC spritesheet
-        self.npc_sheet = pg.image.load("assets/images/character/ow10.png").convert_alpha()
+        self.npc_sheet = resource_manager.get_image("character/ow10.png")
 
         NPC_FRAME = 32  # 每格大小
 
@@ -308,18 +185,23 @@ class GameScene(Scene):
         )
         self._last_chat_id_seen = 0
         self._chat_bubbles = {}  # pid → (text, expire_time)
+        self._bubble_cache = ChatBubbleCache()
 
         self.online_visuals = {}
+        self.render_queue = RenderQueue()
+        self._nav_arrows: dict[tuple, pg.Surface] = {}
+        self._minimap_frames: dict[str, pg.Surface] = {}
+        # 畫面外的東西不 update / draw：用粗格子找出鏡頭附近的候選
+        self._trainer_grids: dict[str, tuple[list, SpatialGrid]] = {}
+        self._schedulers: dict[str, EntityScheduler] = {}
+        self._online_grid: SpatialGrid[int] = SpatialGrid(self.CULL_CELL)
         sound_manager.play_bgm("RBY 103 Pallet Town.ogg")
 
         if self.online_manager:
             self.online_manager.enter()
 
         # 初始化草叢互動
-        self.bush_list = [
-            BushInteraction(rect, self.game_manager.player)
-            for rect in self.game_manager.current_map.get_bush_tiles()
-        ]
+        self.bush_interaction = BushInteraction(self.game_manager.current_map, self.game_manager.player)
         self.game_manager.npc_collision_rect = self.shop_npc_rect
         self._last_map_name = self.game_manager.current_map.path_name
 
@@ -334,71 +216,94 @@ class GameScene(Scene):
 
     @override
     def update(self, dt: float):
-        # AUTO NAVIGATION
-        if hasattr(self, "nav_path") and self.nav_path:
+        # 記下這一步開始前的位置，draw() 用 scene_manager.alpha 在兩步之間插值
+        if self.game_manager.player:
+            self.game_manager.player.snapshot()
+
+        # TELEPORT COOLDOWN UPDATE（導航中也要倒數）
+        if not hasattr(self.game_manager, "teleport_cooldown"):
+            self.game_manager.teleport_cooldown = 0.0
+        if self.game_manager.teleport_cooldown > 0:
+            self.game_manager.teleport_cooldown -= dt
+
+        # 背景的路徑搜尋好了就換上（搜尋時玩家照常移動）
+        route = self.path_service.poll()
+        if route is not None:
+            self._apply_route(*route)
+
+        # 會動的障礙物先更新 walkable_grid 的 overlay（導航中 trainer 也要繼續走）
+        self._sync_npc_obstacle()
+        # 依距離排程：只碰玩家附近的格子，地圖上再多 trainer 也一樣快
+        due = self._entity_scheduler().tick(dt, self._update_anchors())
+        crowd = self._roaming_crowd()
+        if crowd:
+            crowd.update(dt, self.game_manager.player, self._trainer_grid(), due)
+        for enemy, elapsed in due:
+            enemy.update(elapsed)
+
+        # AUTO NAVIGATION（nav_path 是 waypoint，相鄰兩點之間可以直線走）
+        if self.nav_index < len(self.nav_path):
             player = self.game_manager.player
             TILE = GameSettings.TILE_SIZE
             speed = player.speed * dt
 
-            tx, ty = self.nav_path[0]
-            target_x = tx * TILE
-            target_y = ty * TILE
-
-            dx = target_x - player.position.x
-            dy = target_y - player.position.y
-
-            move_x = 0
-            move_y = 0
-
-            # 一次只走一個方向
-            if abs(dx) > abs(dy):
-                if dx > 0:
-                    player.direction = player.direction.RIGHT
-                    player.animation.switch("right")
-                    move_x = min(speed, dx)
+            tx, ty = self.nav_path[self.nav_index]
+            dx = tx * TILE - player.position.x
+            dy = ty * TILE - player.position.y
+            dist = math.hypot(dx, dy)
+
+            # 沿著線段走，面向主要的移動方向
+            if dist > 0:
+                if abs(dx) > abs(dy):
+                    if dx > 0:
+                        player.direction = player.direction.RIGHT
+                        player.animation.switch("right")
+                    else:
+                        player.direction = player.direction.LEFT
+                        player.animation.switch("left")
                 else:
-                    player.direction = player.direction.LEFT
-                    player.animation.switch("left")
-                    move_x = max(-speed, dx)
+                    if dy > 0:
+                        player.direction = player.direction.DOWN
+                        player.animation.switch("down")
+                    else:
+                        player.direction = player.direction.UP
+                        player.animation.switch("up")
+            arrived = dist <= speed
+            if arrived:
+                move_x, move_y = dx, dy
             else:
-                if dy > 0:
-                    player.direction = player.direction.DOWN
-                    player.animation.switch("down")
-                    move_y = min(speed, dy)
-                else:
-                    player.direction = player.direction.UP
-                    player.animation.switch("up")
-                    move_y = max(-speed, dy)
-            # 碰撞檢查
-            next_rect = pg.Rect(
-                player.position.x + move_x,
-                player.position.y + move_y,
-                TILE,
-                TILE
-            )
-
-            for wall in self.game_manager.current_map._collision_map:
-                if next_rect.colliderect(wall):
-                    del self.nav_path
-                    return
+                move_x, move_y = dx * speed / dist, dy * speed / dist
+
+            # 碰撞檢查：直接查 tile bitmap
+            if self.game_manager.current_map.tile_index.any_in_box(
+                player.position.x + move_x, player.position.y + move_y, TILE, TILE, TileIndex.WALL
+            ):
+                self._clear_nav()
+                self._nav_goal = None
+                return
 
             player.position.x += move_x
             player.position.y += move_y
             player.animation.update_pos(player.position)
             player.animation.update(dt)
 
-            # 到達這個 tile  換下一個
-            if abs(dx) < 2 and abs(dy) < 2:
-                self.nav_path.pop(0)
-                if not self.nav_path:
-                    del self.nav_path
+            # 走進傳送點：換完地圖接著走下一段
+            if player.try_teleport():
+                self._on_map_changed()
+                self._next_nav_leg()
+                return
+
+            # 到達這個 waypoint 換下一個
+            # （最後一格是傳送點的話就站著，等冷卻結束自動傳送）
+            if arrived and (self.nav_index < len(self.nav_path) - 1 or not self.nav_legs):
+                self.nav_index += 1
+                if self.nav_index == len(self.nav_path):
+                    self._clear_nav(keep_legs=True)
+                    if not self.nav_legs:
+                        # 到終點了：之後的舊搜尋結果不要再把玩家拉回去
+                        self._nav_goal = None
 
             return
-        # TELEPORT COOLDOWN UPDATE
-        if not hasattr(self.game_manager, "teleport_cooldown"):
-            self.game_manager.teleport_cooldown = 0.0
-        if self.game_manager.teleport_cooldown > 0:
-            self.game_manager.teleport_cooldown -= dt
         # CHAT OPEN / TYPING
         if self._chat_overlay:
             # 按 Enter 打開聊天
@@ -439,19 +344,11 @@ class GameScene(Scene):
 
         new_map = self.game_manager.current_map.path_name
         if new_map != old_map:
-            # 地圖真的換了，重建草叢判定
-            self.bush_list = [
-                BushInteraction(rect, self.game_manager.player)
-                for rect in self.game_manager.current_map.get_bush_tiles()
-            ]
-            self.bush_cooldown = 0
+            self._on_map_changed()
             return
 
-        detected_enemy = None   # 目前有看到玩家的敵人（選第一個）
-        for enemy in self.game_manager.current_enemy_trainers:
-            enemy.update(dt)
-            if enemy.detected and detected_enemy is None:
-                detected_enemy = enemy
+        # 視線檢查：查玩家所在的 tile 被誰看到（跟 trainer 數量無關）
+        detected_enemy = self._trainer_table().update(self.game_manager.player)
 
         # NPC 視線 + 戰鬥觸發
         can_enter_battle = detected_enemy is not None
@@ -466,13 +363,12 @@ class GameScene(Scene):
             scene_manager.change_scene("battle")
             return
 
-        # 草叢互動更新
-        for bush in self.bush_list:
-            bush.update()
-            if bush.near and self.bush_cooldown <= 0:
-                self.bush_cooldown = 2  # 2秒冷卻時間
-                scene_manager.change_scene("catch")
-                return
+        # 草叢互動更新（只在踏進新的草叢 tile 時觸發）
+        self.bush_interaction.update()
+        if self.bush_interaction.near and self.bush_cooldown <= 0:
+            self.bush_cooldown = 2  # 2秒冷卻時間
+            scene_manager.change_scene("catch")
+            return
         
         # 背包更新
         self.game_manager.bag.update(dt)
@@ -487,6 +383,7 @@ class GameScene(Scene):
         # Update chat bubbles from recent messages
 
         # This part's for the chatting feature, we've made it for you.
+        profiler.begin("online")
         if self.online_manager:
             try:
                 msgs = self.online_manager.get_recent_chat(50)
@@ -499,7 +396,7 @@ class GameScene(Scene):
                     sender = int(m.get("from", -1))
                     text = str(m.get("text", ""))
                     if sender >= 0 and text:
-                        self._chat_bubbles[sender] = (text, now + 2.0)
+                        self.show_chat_bubble(sender, text, 2.0, now)
                     if mid > max_id:
                         max_id = mid
                 self._last_chat_id_seen = max_id
@@ -531,6 +428,7 @@ class GameScene(Scene):
                 player.direction.name.lower(),
                 moving
             )
+        profiler.end("online")
 
         # UI 更新
         self.setting_button.update(dt)
@@ -548,37 +446,49 @@ class GameScene(Scene):
 
         current_map = self.game_manager.current_map
 
-        # 這裡用 Map.prebake 好的整張地圖 surface
-        full_map_surface: pg.Surface = current_map._surface  # 如果名字不一樣就改這行
-
         # 小地圖大小 & 位置
-        MINIMAP_W, MINIMAP_H = 180, 120
+        MINIMAP_W, MINIMAP_H = GameSettings.MINIMAP_WIDTH, GameSettings.MINIMAP_HEIGHT
         MINIMAP_X, MINIMAP_Y = 10, 10
 
-        # 把整張地圖縮小成小地圖
-        minimap_surf = pg.transform.smoothscale(
-            full_map_surface, (MINIMAP_W, MINIMAP_H)
-        )
-
-        # 畫一個外框背景（黑框 + 內圖）
-        frame_rect = pg.Rect(MINIMAP_X - 3, MINIMAP_Y - 3,
-                             MINIMAP_W + 6, MINIMAP_H + 6)
-        pg.draw.rect(screen, (0, 0, 0), frame_rect)          # 外面的黑底
-        screen.blit(minimap_surf, (MINIMAP_X, MINIMAP_Y))    # 貼上縮小地圖
-
-        # 畫玩家點點
-        map_w, map_h = full_map_surface.get_width(), full_map_surface.get_height()
-        scale_x = MINIMAP_W / map_w
-        scale_y = MINIMAP_H / map_h
+        # 外框 + 縮圖每張地圖只做一次（縮圖是 Map 載入時 prebake 好的）
+        framed = self._minimap_frames.get(current_map.path_name)
+        if framed is None:
+            framed = pg.Surface((MINIMAP_W + 6, MINIMAP_H + 6))
+            framed.fill((0, 0, 0))                                   # 外面的黑底
+            framed.blit(current_map.get_minimap((MINIMAP_W, MINIMAP_H)), (3, 3))
+            self._minimap_frames[current_map.path_name] = framed
+        screen.blit(framed, (MINIMAP_X - 3, MINIMAP_Y - 3))
+
+        # 以下每幀只畫小標記
+        TILE = GameSettings.TILE_SIZE
+        scale_x = MINIMAP_W / (current_map.tile_index.width * TILE)
+        scale_y = MINIMAP_H / (current_map.tile_index.height * TILE)
+
+        def to_mini(x: float, y: float) -> tuple[int, int]:
+            # 用 tile 中心點標在小地圖上
+            return (int(MINIMAP_X + (x + TILE / 2) * scale_x), int(MINIMAP_Y + (y + TILE / 2) * scale_y))
+
+        # 導航路線
+        if self.nav_index < len(self.nav_path):
+            player = self.game_manager.player
+            points = [to_mini(player.position.x, player.position.y)]
+            points += [to_mini(tx * TILE, ty * TILE) for tx, ty in self.nav_path[self.nav_index:]]
+            pg.draw.lines(screen, (0, 120, 255), False, points, 1)
 
-        px = self.game_manager.player.position.x
-        py = self.game_manager.player.position.y
+        # 敵人 trainer：紅點
+        for enemy in self.game_manager.current_enemy_trainers:
+            pg.draw.circle(screen, (220, 0, 0), to_mini(enemy.position.x, enemy.position.y), 2)
 
-        mini_px = MINIMAP_X + px * scale_x
-        mini_py = MINIMAP_Y + py * scale_y
+        # 同地圖的線上玩家：黃點
+        if self.online_manager:
+            map_name = current_map.path_name
+            for p in self.online_manager.get_list_players():
+                if p["map"] == map_name:
+                    pg.draw.circle(screen, (255, 200, 0), to_mini(p["x"], p["y"]), 2)
 
         # 玩家在 minimap 上的藍色小圓點
-        pg.draw.circle(screen, (0, 0, 255), (int(mini_px), int(mini_py)), 3)
+        player = self.game_manager.player
+        pg.draw.circle(screen, (0, 0, 255), to_mini(player.position.x, player.position.y), 3)
 
 
     @override
@@ -586,6 +496,7 @@ class GameScene(Scene):
         current_time = pg.time.get_ticks()
         dt = (current_time - getattr(self, "_last_time", current_time)) / 1000.0
         self._last_time = current_time 
+        alpha = scene_manager.alpha
      
         if self.game_manager.player:
             '''
@@ -594,30 +505,39 @@ class GameScene(Scene):
             Right now it's hard coded, you need to follow the player's positions
             you may use the below example, but the function still incorrect, you may trace the entity.py
             '''
-            camera = self.game_manager.player.camera
-            
-            self.game_manager.current_map.draw(screen, camera)
-            self.game_manager.player.draw(screen, camera)
+            camera = self.game_manager.player.render_camera(alpha)
         else:
             camera = PositionCamera(0, 0)
-            self.game_manager.current_map.draw(screen, camera)
-        for enemy in self.game_manager.current_enemy_trainers:
-            enemy.draw(screen, camera)
-
-        self.game_manager.bag.draw(screen)
 
-        
+        # 世界物件全部丟進 render queue，最後一次 blits（依 layer + y 排序）
+        queue = self.render_queue
+        view = self._view_rect(GameSettings.TILE_SIZE, camera)
+        self.game_manager.current_map.queue_draw(queue)
+        if self.game_manager.player:
+            self.game_manager.player.queue_draw(queue, alpha)
+        for enemy in self._trainer_grid().query(view):
+            if view.collidepoint(enemy.position.x, enemy.position.y):
+                enemy.queue_draw(queue, alpha)
 
-        # 畫商店 NPC
-        cam = self.game_manager.player.camera
-        npc_screen_pos = cam.transform_position_as_position(self.shop_npc_pos)
-        screen.blit(self.npc_surface, (npc_screen_pos.x, npc_screen_pos.y))
+        # 商店 NPC
+        queue.submit(self.npc_surface, (self.shop_npc_pos.x, self.shop_npc_pos.y), RenderQueue.LAYER_ENTITIES)
 
-        
+        profiler.begin("online")
         if self.online_manager and self.game_manager.player:
-            list_online = self.online_manager.get_list_players()
-            for p in list_online:
-                pid = p["id"]
+            # 只看同地圖的人，丟進格子後只處理鏡頭附近的
+            map_name = self.game_manager.current_map.path_name
+            grid = self._online_grid
+            grid.clear()
+            same_map = {}
+            for p in self.online_manager.get_list_players():
+                if p["map"] == map_name:
+                    same_map[p["id"]] = p
+                    grid.insert(p["id"], p["x"], p["y"])
+
+            for pid in grid.query(view):
+                p = same_map[pid]
+                if not view.collidepoint(p["x"], p["y"]):
+                    continue
 
                 # 如果沒有 visual，建立一個
                 if pid not in self.online_visuals:
@@ -632,47 +552,162 @@ class GameScene(Scene):
                 )
 
                 vis.update(dt)
-
-                # 只畫同地圖的人
-                if p["map"] == self.game_manager.current_map.path_name:
-                    vis.draw(screen, camera)
+                vis.queue_draw(queue)
+                profiler.count("online drawn")
         if self.online_manager:
-            self._draw_chat_bubbles(screen, camera)
-        
-        self.setting_button.draw(screen)
-        self.backpack_button.draw(screen)
-        self.navigation_button.draw(screen)
+            self._queue_chat_bubbles(queue)
+        profiler.end("online")
 
-        self.draw_minimap(screen)
+        if self.nav_index < len(self.nav_path):
+            self._queue_nav_arrows(queue)
 
-        if hasattr(self, "nav_path") and self.nav_path:
-            TILE = GameSettings.TILE_SIZE
+        queue.flush(screen, camera)
 
-            for i, (tx, ty) in enumerate(self.nav_path):
-                wx = tx * TILE + TILE // 2
-                wy = ty * TILE + TILE // 2
-                pos = camera.transform_position_as_position(Position(wx, wy))
+        if GameSettings.DRAW_HITBOXES:
+            self.game_manager.current_map.draw_hitboxes(screen, camera)
+            if self.game_manager.player:
+                self.game_manager.player.draw_debug(screen, camera)
+            for enemy in self.game_manager.current_enemy_trainers:
+                enemy.draw_debug(screen, camera)
 
-                # 決定三角形方向（看下一個節點）
-                if i < len(self.nav_path) - 1:
-                    nx, ny = self.nav_path[i + 1]
-                    dx = nx - tx
-                    dy = ny - ty
+        profiler.begin("ui")
+        self.game_manager.bag.draw(screen)
 
-                    if abs(dx) > abs(dy):
-                        direction = "right" if dx > 0 else "left"
-                    else:
-                        direction = "down" if dy > 0 else "up"
-                else:
-                    direction = "up"  # 終點箭頭朝上（你也可以改成 "down"）
+        # UI（螢幕座標，不進 queue）
+        self.setting_button.draw(screen)
+        self.backpack_button.draw(screen)
+        self.navigation_button.draw(screen)
 
-                self._draw_nav_triangle(screen, pos, direction)
+        self.draw_minimap(screen)
 
         if self._chat_overlay:
             self._chat_overlay.draw(screen)
+        profiler.end("ui")
+
+    def _view_rect(self, margin: int = 0, camera: PositionCamera | None = None) -> pg.Rect:
+        """World-space camera view, grown by margin on every side."""
+        if camera is None:
+            camera = self.game_manager.player.camera if self.game_manager.player else PositionCamera(0, 0)
+        view = pg.Rect(camera.x, camera.y, GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT)
+        # Entities are bucketed by their top-left corner, so reach one more tile up/left
+        tile = GameSettings.TILE_SIZE
+        return pg.Rect(view.x - margin - tile, view.y - margin - tile,
+                       view.width + 2 * margin + tile, view.height + 2 * margin + tile)
+
+    def _trainer_grid(self) -> SpatialGrid:
+        trainers = self.game_manager.current_enemy_trainers
+        cached = self._trainer_grids.get(self.game_manager.current_map_key)
+        # 讀檔後 game_manager 會換掉，list 不是同一個就重建
+        if cached is None or cached[0] is not trainers:
+            grid = SpatialGrid(self.CULL_CELL)
+            for enemy in trainers:
+                grid.insert(enemy, enemy.position.x, enemy.position.y)
+            cached = (trainers, grid)
+            self._trainer_grids[self.game_manager.current_map_key] = cached
+        return cached[1]
+
+    def _entity_scheduler(self) -> EntityScheduler:
+        grid = self._trainer_grid()
+        scheduler = self._schedulers.get(self.game_manager.current_map_key)
+        if scheduler is None or scheduler.grid is not grid:
+            scheduler = EntityScheduler(grid, self.NEAR_RANGE, self.MID_RANGE, self.MID_INTERVAL)
+            self._schedulers[self.game_manager.current_map_key] = scheduler
+        return scheduler
+
+    def _update_anchors(self) -> list[tuple[float, float]]:
+        # 玩家 + 同地圖的線上玩家：他們附近的 entity 才需要醒著
+        anchors = []
+        player = self.game_manager.player
+        if player:
+            anchors.append((player.position.x, player.position.y))
+        if self.online_manager:
+            map_name = self.game_manager.current_map.path_name
+            anchors.extend((p["x"], p["y"]) for p in self.online_manager.get_list_players() if p["map"] == map_name)
+        return anchors
+
+    def _trainer_table(self) -> TrainerTable:
+        trainers = self.game_manager.current_enemy_trainers
+        cached = self._trainer_tables.get(self.game_manager.current_map_key)
+        if cached is None or cached[0] is not trainers:
+            cached = (trainers, TrainerTable(self.game_manager.current_map, trainers))
+            self._trainer_tables[self.game_manager.current_map_key] = cached
+        return cached[1]
+
+    def _roaming_crowd(self) -> RoamingCrowd:
+        trainers = self.game_manager.current_enemy_trainers
+        cached = self._crowds.get(self.game_manager.current_map_key)
+        if cached is None or cached[0] is not trainers:
+            if cached is not None:
+                # 讀檔換掉了 trainer：舊的先從 overlay 撤掉
+                cached[1].release()
+            cached = (trainers, RoamingCrowd(self.game_manager.current_map, trainers, self._trainer_table()))
+            self._crowds[self.game_manager.current_map_key] = cached
+        return cached[1]
+
+    def _on_map_changed(self) -> None:
+        """玩家換了地圖（自己走進傳送點或自動導航）：所有跟著地圖的狀態都在這裡換"""
+        # 換成新地圖的草叢判定
+        self.bush_interaction.set_map(self.game_manager.current_map)
+        self.bush_cooldown = 0
+        self._last_map_name = self.game_manager.current_map.path_name
 
-    def _draw_nav_triangle(self, screen, pos, direction, color=(0, 120, 255), size=6):
-        x, y = pos.x, pos.y
+    def _sync_npc_obstacle(self) -> None:
+        # 商店 NPC 每張地圖都會畫、都會擋：換地圖就把它搬到新地圖的 overlay
+        game_map = self.game_manager.current_map
+        grid = game_map.walkable_grid
+        if self._npc_obstacle is not None:
+            if self._npc_obstacle[0] is grid:
+                return
+            self._npc_obstacle[0].remove_obstacle(self._npc_obstacle[1])
+        tiles = grid.blocked_indices(game_map.tile_index.tiles_in_rect(self.shop_npc_rect))
+        grid.add_obstacle(tiles)
+        self._npc_obstacle = (grid, tiles)
+
+    def _queue_nav_arrows(self, queue: RenderQueue) -> None:
+        TILE = GameSettings.TILE_SIZE
+        player = self.game_manager.player
+
+        # 每段線段上每隔一格放一個箭頭（第一段從玩家目前的位置開始）
+        ax, ay = player.position.x, player.position.y
+        last = len(self.nav_path) - 1
+        for i in range(self.nav_index, last + 1):
+            tx, ty = self.nav_path[i]
+            bx, by = tx * TILE, ty * TILE
+            dx, dy = bx - ax, by - ay
+            length = math.hypot(dx, dy)
+            if length > 0:
+                if abs(dx) > abs(dy):
+                    direction = "right" if dx > 0 else "left"
+                else:
+                    direction = "down" if dy > 0 else "up"
+                arrow = self._nav_triangle_surface(direction)
+                half = arrow.get_width() // 2
+                ux, uy = dx / length, dy / length
+                # 轉角的 waypoint 也放一個，終點另外畫
+                step = TILE if i == last else 0
+                while step < length:
+                    # 從終點往回排，箭頭不會跟著玩家滑動
+                    wx = bx - ux * step + TILE // 2
+                    wy = by - uy * step + TILE // 2
+                    queue.submit(arrow, (int(wx) - half, int(wy) - half), RenderQueue.LAYER_GROUND)
+                    step += TILE
+            ax, ay = bx, by
+
+        # 終點箭頭朝上
+        tx, ty = self.nav_path[-1]
+        arrow = self._nav_triangle_surface("up")
+        half = arrow.get_width() // 2
+        queue.submit(arrow, (tx * TILE + TILE // 2 - half, ty * TILE + TILE // 2 - half), RenderQueue.LAYER_GROUND)
+
+    def _nav_triangle_surface(self, direction, color=(0, 120, 255), size=6) -> pg.Surface:
+        # 每個方向只畫一次，之後重複使用
+        key = (direction, color, size)
+        surf = self._nav_arrows.get(key)
+        if surf is not None:
+            return surf
+
+        surf = pg.Surface((size * 2 + 1, size * 2 + 1), pg.SRCALPHA)
+        x, y = size, size
 
         if direction == "right":
             points = [(x + size, y), (x - size, y - size), (x - size, y + size)]
@@ -683,10 +718,12 @@ class GameScene(Scene):
         else:  # "up"
             points = [(x, y - size), (x - size, y + size), (x + size, y + size)]
 
-        pg.draw.polygon(screen, color, points)
+        pg.draw.polygon(surf, color, points)
+        self._nav_arrows[key] = surf
+        return surf
 
 
-    def _draw_chat_bubbles(self, screen: pg.Surface, camera: PositionCamera) -> None:
+    def _queue_chat_bubbles(self, queue: RenderQueue) -> None:
         
         if not self.online_manager:
             return
@@ -694,22 +731,19 @@ class GameScene(Scene):
         now = time.monotonic()
         expired = [pid for pid, (_, ts) in self._chat_bubbles.items() if ts <= now]
         for pid in expired:
-            del self._chat_bubbles[pid]
+            text, _ = self._chat_bubbles.pop(pid)
+            self._release_bubble(text)
         if not self._chat_bubbles:
             return
-        
-        font = pg.font.SysFont("Arial", 16)
 
         # DRAW LOCAL PLAYER'S BUBBLE
         local_pid = self.online_manager.player_id if self.online_manager else -1
         if self.game_manager.player and local_pid in self._chat_bubbles:
             text, _ = self._chat_bubbles[local_pid]
-            self._draw_chat_bubble_for_pos(
-                screen,
-                camera,
-                self.game_manager.player.position,
-                text,
-                pg.font.SysFont("Arial", 16)
+            self._queue_chat_bubble_for_pos(
+                queue,
+                self.game_manager.player.render_position(scene_manager.alpha),
+                text
             )
 
         # DRAW OTHER PLAYERS' BUBBLES
@@ -733,12 +767,10 @@ class GameScene(Scene):
             text, _ = self._chat_bubbles[pid]
             world_pos = Position(p["x"], p["y"])
 
-            self._draw_chat_bubble_for_pos(
-                screen,
-                camera,
+            self._queue_chat_bubble_for_pos(
+                queue,
                 world_pos,
-                text,
-                font
+                text
             )
 
         
@@ -780,7 +812,7 @@ class GameScene(Scene):
         - For each player with a message, maybe you can call a helper to actually draw a single bubble?
         """
 
-    def _draw_chat_bubble_for_pos(self, screen: pg.Surface, camera: PositionCamera, world_pos: Position, text: str, font: pg.font.Font):
+    def _queue_chat_bubble_for_pos(self, queue: RenderQueue, world_pos: Position, text: str):
         
         """
         Steps:
@@ -794,45 +826,125 @@ class GameScene(Scene):
             3. Measure the rendered text to determine bubble size.
             Add padding around the text.
         """
-        # 世界座標轉螢幕座標
-        pos = camera.transform_position_as_position(world_pos)
-        px, py = pos.x, pos.y - 20 # 往上放泡泡
-
-        # 渲染文字
-        text_surf = font.render(text, True, (0, 0, 0))
-        tw, th = text_surf.get_size()
-
-        padding = 6
-        box_w = tw + padding * 2
-        box_h = th + padding * 2
-
-        # 背景方塊
-        bg = pg.Surface((box_w, box_h), pg.SRCALPHA)
-        bg.fill((255, 255, 255, 220))  # 白底＋透明度
-
-        screen.blit(bg, (px - box_w // 2, py - box_h))
-        pg.draw.rect(
-            screen,
-            (0, 0, 0),
-            pg.Rect(px - box_w // 2, py - box_h, box_w, box_h),
-            2
-        )
-        screen.blit(text_surf, (px - tw // 2, py - box_h + padding))
+        # 世界座標（render queue 會幫忙轉成螢幕座標）
+        px, py = int(world_pos.x), int(world_pos.y) - 20 # 往上放泡泡
+
+        # 泡泡（背景 + 外框 + 文字）在訊息進來時就畫好了，這裡只拿快取
+        bubble = self._bubble_cache.get(text)
+        box_w, box_h = bubble.get_size()
 
+        queue.submit(bubble, (px - box_w // 2, py - box_h), RenderQueue.LAYER_OVERLAY)
+
+
+    def show_chat_bubble(self, pid: int, text: str, seconds: float, now: float | None = None) -> None:
+        if now is None:
+            now = time.monotonic()
+        previous = self._chat_bubbles.get(pid)
+        self._chat_bubbles[pid] = (text, now + seconds)
+        if previous is not None and previous[0] != text:
+            self._release_bubble(previous[0])
+        # 訊息一進來就先畫好泡泡
+        self._bubble_cache.get(text)
+
+    def _release_bubble(self, text: str) -> None:
+        # 沒有其他人還在顯示同一句話，就把快取丟掉
+        if all(t != text for t, _ in self._chat_bubbles.values()):
+            self._bubble_cache.evict(text)
+
+    def nav_destinations(self) -> list[str]:
+        return list(self.game_manager.nav_destinations)
 
     def go_to(self, place_name):
         game_scene = scene_manager._scenes["game"]
+        goal_map, goal = game_scene.game_manager.nav_destinations[place_name]
+        game_scene._request_route(goal_map, goal)
+        scene_manager.change_scene("game")
+
+    def _player_tile(self) -> tuple[int, int]:
+        player = self.game_manager.player
+        return (
+            int(player.position.x // GameSettings.TILE_SIZE),
+            int(player.position.y // GameSettings.TILE_SIZE),
+        )
 
-        px = int(game_scene.game_manager.player.position.x // GameSettings.TILE_SIZE)
-        py = int(game_scene.game_manager.player.position.y // GameSettings.TILE_SIZE)
+    def _request_route(self, goal_map: str, goal: tuple[int, int]) -> None:
+        # 舊的路徑先繼續走，新的結果出來再換掉（較舊的請求會被取消）
+        self._nav_goal = (goal_map, goal)
+        self.path_service.submit(
+            _plan_route, self.world_navigator(), self.game_manager.current_map_key,
+            self._player_tile(), goal_map, goal
+        )
 
-        start = (px, py)
-        goal = NAV_PLACES[place_name]
+    def _clear_nav(self, keep_legs: bool = False) -> None:
+        self.nav_path = []
+        self.nav_index = 0
+        if not keep_legs:
+            self.nav_legs = []
 
-        grid = build_walkable_grid(game_scene)
-        path = bfs(grid, start, goal)
+    def _apply_route(self, map_key: str, start: tuple[int, int], path: list | None, legs: list) -> None:
+        if self._nav_goal is None:
+            # 導航已經結束（到了或撞牆放棄）：晚到的結果不用了
+            return
+        if path is None:
+            self._clear_nav()
+            self._nav_goal = None
+            return
 
-        game_scene.nav_path = path
-        scene_manager.change_scene("game")
+        # 搜尋期間玩家可能走動或傳送了：接得上就從目前的位置接著走，接不上就重算
+        if map_key == self.game_manager.current_map_key:
+            path = self._join_route(path)
+        else:
+            path = None
+        if path is None:
+            if self._nav_goal is not None:
+                self._request_route(*self._nav_goal)
+            return
+        self.nav_path = path
+        self.nav_index = 0
+        self.nav_legs = legs
+
+    def _join_route(self, path: list[tuple[int, int]]) -> list[tuple[int, int]] | None:
+        """
+        waypoint 很稀疏，玩家通常不會剛好站在某個點上：找離玩家最近的線段，
+        距離一格以內、而且直線走得到那段的終點，就從那個終點接著走；不然回傳 None
+        """
+        TILE = GameSettings.TILE_SIZE
+        player = self.game_manager.player
+        px, py = player.position.x / TILE, player.position.y / TILE
+        if len(path) == 1:
+            (bx, by), = path
+            return path if math.hypot(bx - px, by - py) <= 1 else None
+
+        best, nearest = None, 0
+        for k, ((ax, ay), (bx, by)) in enumerate(zip(path, path[1:])):
+            dx, dy = bx - ax, by - ay
+            t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / (dx * dx + dy * dy or 1)))
+            d = math.hypot(ax + dx * t - px, ay + dy * t - py)
+            if best is None or d < best:
+                best, nearest = d, k
+        rest = path[nearest + 1:]
+        if best > 1 or not line_of_sight(self.game_manager.current_map.walkable_grid, self._player_tile(), rest[0]):
+            return None
+        return rest
+
+    def world_navigator(self) -> WorldNavigator:
+        # 讀檔後 game_manager 會換掉，maps 不是同一個就重建
+        if self._navigator is None or self._navigator.maps is not self.game_manager.maps:
+            self._navigator = WorldNavigator(self.game_manager.maps)
+        return self._navigator
+
+    def _next_nav_leg(self) -> None:
+        """把下一段（要在目前這張地圖上）丟去背景展開成 waypoint"""
+        legs = self.nav_legs
+        self._clear_nav()
+        if self.path_service.pending:
+            # 有更新的請求在跑：結果出來時會從這裡重新規劃
+            return
+        if not legs or legs[0].map_key != self.game_manager.current_map_key:
+            # 傳送到計畫外的地方：放棄導航
+            self._nav_goal = None
+            return
 
-    
\ No newline at end of file
+        leg, *rest = legs
+        leg.start = self._player_tile()
+        self.path_service.submit(_refine_leg, self.world_navigator(), leg, rest)
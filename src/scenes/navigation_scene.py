@@ -1,26 +1,19 @@
 import pygame as pg
-from src.scenes.scene import Scene
-from src.core.services import scene_manager, input_manager
+from src.scenes.overlay_scene import OverlayScene, DirtyRegion
+from src.core.services import scene_manager, input_manager, resource_manager, text_cache
 from src.interface.components import Button
 from typing import override
 
-class NavigationScene(Scene):
+class NavigationScene(OverlayScene):
 
     def __init__(self, previous_scene: str):
         super().__init__()
         self.previous_scene = previous_scene
 
-        self.font_label = pg.font.Font("assets/fonts/Minecraft.ttf", 14)
-
-
-        # 半透明背景
-        self.overlay = pg.Surface((1280, 720), pg.SRCALPHA)
-        self.overlay.fill((0, 0, 0, 160))
+        self.font_label = text_cache.font("Minecraft.ttf", 14)
 
         # 背景圖
-        self.window_img = pg.image.load(
-            "assets/images/backgrounds/setting.png"
-        ).convert_alpha()
+        self.window_img = resource_manager.get_image("backgrounds/setting.png")
         self.window_rect = self.window_img.get_rect(center=(640, 360))
 
         # X 關閉按鈕
@@ -35,48 +28,43 @@ class NavigationScene(Scene):
             32,
             lambda: scene_manager.change_scene(self.previous_scene)
         )
-        btn_w, btn_h = 48, 48
-        btn_gap = 20
+        self.btn_w = 48
+        self.btn_h = 48
+        self.slot_w = 90        # 每個目的地佔的寬度（含下面的文字）
+        self.slot_h = 48 + 40
 
+        # 目的地按鈕：enter() 時依照 GameScene 的目的地清單產生
+        self.nav_buttons: list[tuple[str, Button]] = []
+
+    @override
+    def enter(self) -> None:
+        self._build_nav_buttons()
+        super().enter()
+
+    def _build_nav_buttons(self):
         # 視窗內 padding（控制按鈕位置）
         pad_x = 30
         pad_y = 40
         # 視窗左上角為基準
         base_x = self.window_rect.left + pad_x
         base_y = self.window_rect.top + pad_y
-
-        self.nav_start_button = Button(
-            "UI/button_nav_to.png",
-            "UI/button_nav_to_hover.png",
-            base_x,
-            base_y,
-            btn_w,
-            btn_h,
-            lambda: scene_manager._scenes["game"].go_to("Start")
-        )
-
-        self.nav_gym_button = Button(
-            "UI/button_nav_to.png",
-            "UI/button_nav_to_hover.png",
-            base_x + btn_w + btn_gap,
-            base_y,
-            btn_w,
-            btn_h,
-            lambda: scene_manager._scenes["game"].go_to("Gym")
-        )
-
-        self.nav_start_pos = (base_x, base_y)
-        self.nav_gym_pos = (base_x + btn_w + btn_gap, base_y)
-
-        self.btn_w = btn_w
-        self.btn_h = btn_h
-
-
-    @override
-    def enter(self) -> None:
-        # 擷取目前畫面當背景
-        screen = pg.display.get_surface()
-        self.background_capture = screen.copy()
+        per_row = max(1, (self.window_rect.width - pad_x - 60) // self.slot_w)
+
+        self.nav_buttons = []
+        for i, name in enumerate(scene_manager._scenes["game"].nav_destinations()):
+            row, col = divmod(i, per_row)
+            x = base_x + col * self.slot_w + (self.slot_w - self.btn_w) // 2
+            y = base_y + row * self.slot_h
+            button = Button(
+                "UI/button_nav_to.png",
+                "UI/button_nav_to_hover.png",
+                x,
+                y,
+                self.btn_w,
+                self.btn_h,
+                lambda name=name: scene_manager._scenes["game"].go_to(name)
+            )
+            self.nav_buttons.append((name, button))
 
     @override
     def update(self, dt: float):
@@ -86,47 +74,28 @@ class NavigationScene(Scene):
             return
 
         self.x_button.update(dt)
-        self.nav_start_button.update(dt)
-        self.nav_gym_button.update(dt)
+        for _, button in self.nav_buttons:
+            button.update(dt)
 
     @override
-    def draw(self, screen: pg.Surface):
-        # 原畫面
-        screen.blit(self.background_capture, (0, 0))
-
-        # 半透明遮罩
-        screen.blit(self.overlay, (0, 0))
-
+    def draw_static(self, surface: pg.Surface):
         # 中央視窗（背景）
-        screen.blit(self.window_img, self.window_rect)
-
-        # 按鈕
-        self.x_button.draw(screen)
-        self.nav_start_button.draw(screen)
-        self.nav_gym_button.draw(screen)
-
-        # 文字標籤
-        start_txt = self.font_label.render("Start", True, (255, 255, 255))
-        gym_txt   = self.font_label.render("Gym",   True, (255, 255, 255))
-
-        # Start 文字（置中在第一顆下面）
-        sx, sy = self.nav_start_pos
-        gx, gy = self.nav_gym_pos
-
-        # Start 文字
-        screen.blit(
-            start_txt,
-            (
-                sx + self.btn_w // 2 - start_txt.get_width() // 2,
-                sy + self.btn_h + 6
+        surface.blit(self.window_img, self.window_rect)
+
+        # 文字標籤（置中在按鈕下面）
+        for name, button in self.nav_buttons:
+            txt = self.font_label.render(name, True, (255, 255, 255))
+            surface.blit(
+                txt,
+                (
+                    button.hitbox.centerx - txt.get_width() // 2,
+                    button.hitbox.bottom + 6
+                )
             )
-        )
 
-        # Gym 文字
-        screen.blit(
-            gym_txt,
-            (
-                gx + self.btn_w // 2 - gym_txt.get_width() // 2,
-                gy + self.btn_h + 6
-            )
-        )
+    @override
+    def build_regions(self) -> list[DirtyRegion]:
+        # 按鈕（hover 時才重畫）
+        return [DirtyRegion.for_button(self.x_button)] + [
+            DirtyRegion.for_button(button) for _, button in self.nav_buttons
+        ]
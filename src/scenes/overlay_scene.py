@@ -0,0 +1,127 @@
+from __future__ import annotations
+import pygame as pg
+from dataclasses import dataclass
+from typing import Callable, Hashable, override
+
+from src.scenes.scene import Scene
+from src.interface.components import Button
+from src.utils import GameSettings
+
+
+@dataclass
+class DirtyRegion:
+    """A screen area that is redrawn only when state() returns something new."""
+    rect: pg.Rect
+    state: Callable[[], Hashable]
+    draw: Callable[[pg.Surface], None]
+
+    @classmethod
+    def for_button(cls, button: Button) -> DirtyRegion:
+        # Buttons only change by swapping between their default / hover sprite
+        return cls(button.hitbox, lambda: id(button.img_button), button.draw)
+
+
+class OverlayScene(Scene):
+    """
+    Menu window drawn over a screenshot of the previous scene.
+
+    On enter the captured background, the translucent overlay and everything
+    from draw_static() are composed into one surface. After the first frame
+    only regions whose state changed are restored from that composite and
+    redrawn, and Engine presents just those rects with pg.display.update().
+
+    Subclasses implement draw_static() and build_regions(), and call
+    invalidate() when the set of widgets changes (e.g. rebuilt buttons).
+    """
+    uses_dirty_rects = True
+
+    overlay: pg.Surface
+    background_capture: pg.Surface | None
+    _composite: pg.Surface | None
+    _regions: list[DirtyRegion]
+    _states: list[Hashable]
+    _dirty: list[pg.Rect]
+
+    def __init__(self) -> None:
+        super().__init__()
+        # 半透明背景
+        self.overlay = pg.Surface((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT), pg.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 160))
+        self.background_capture = None
+        self._composite = None
+        self._regions = []
+        self._states = []
+        self._dirty = []
+        self._rebuild = True
+        self._repaint = True
+
+    def draw_static(self, surface: pg.Surface) -> None:
+        """Draw everything that does not change while the scene is open."""
+        ...
+
+    def build_regions(self) -> list[DirtyRegion]:
+        """Widgets that change while the scene is open, in draw order."""
+        return []
+
+    def invalidate(self) -> None:
+        """Rebuild the composite and the region list on the next draw."""
+        self._rebuild = True
+
+    @override
+    def request_full_redraw(self) -> None:
+        self._repaint = True
+
+    @override
+    def dirty_rects(self) -> list[pg.Rect]:
+        rects, self._dirty = self._dirty, []
+        return rects
+
+    @override
+    def enter(self) -> None:
+        # 擷取目前畫面當背景
+        self.background_capture = pg.display.get_surface().copy()
+        self.invalidate()
+
+    @override
+    def draw(self, screen: pg.Surface) -> None:
+        if self._rebuild:
+            self._composite = self.background_capture.copy()
+            self._composite.blit(self.overlay, (0, 0))
+            self.draw_static(self._composite)
+            self._regions = self.build_regions()
+            self._rebuild = False
+            self._repaint = True
+
+        if self._repaint:
+            screen.blit(self._composite, (0, 0))
+            for region in self._regions:
+                region.draw(screen)
+            self._states = [region.state() for region in self._regions]
+            self._dirty = [screen.get_rect()]
+            self._repaint = False
+            return
+
+        changed: set[int] = set()
+        for i, region in enumerate(self._regions):
+            state = region.state()
+            if state != self._states[i]:
+                self._states[i] = state
+                changed.add(i)
+        if not changed:
+            return
+
+        # Restoring a region wipes whatever overlaps it, so redraw those too
+        for i, region in enumerate(self._regions):
+            if i not in changed and any(region.rect.colliderect(self._regions[j].rect) for j in changed):
+                changed.add(i)
+
+        order = sorted(changed)
+        for i in order:
+            rect = self._regions[i].rect
+            screen.blit(self._composite, rect, rect)
+        for i in order:
+            region = self._regions[i]
+            screen.set_clip(region.rect)
+            region.draw(screen)
+            screen.set_clip(None)
+        self._dirty = [self._regions[i].rect.copy() for i in order]
@@ -2,6 +2,9 @@ from __future__ import annotations
 import pygame as pg
 
 class Scene:
+    # Scenes that present only changed regions (see OverlayScene)
+    uses_dirty_rects: bool = False
+
     def __init__(self) -> None:
         ...
 
@@ -15,4 +18,11 @@ class Scene:
         ...
 
     def draw(self, screen: pg.Surface) -> None:
-        ...
\ No newline at end of file
+        ...
+
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        """Screen rects changed by the last draw(), or None for a full flip."""
+        return None
+
+    def request_full_redraw(self) -> None:
+        ...
@@ -1,29 +1,23 @@
 import pygame as pg
-from src.scenes.scene import Scene
-from src.core.services import sound_manager, scene_manager, input_manager
+from src.scenes.overlay_scene import OverlayScene, DirtyRegion
+from src.core.services import sound_manager, scene_manager, input_manager, resource_manager, text_cache
 from src.core.managers.game_manager import GameManager
 from src.sprites import Sprite
 from src.interface.components import Button
 from typing import override
 
-class SettingsScene(Scene):
+class SettingsScene(OverlayScene):
 
     def __init__(self, previous_scene:str):
         super().__init__()
 
-        self.font_title = pg.font.Font("assets/fonts/Minecraft.ttf", 32)
-        self.font_label = pg.font.Font("assets/fonts/Minecraft.ttf", 24)
-        self.font_small = pg.font.Font("assets/fonts/Minecraft.ttf", 18)
+        self.font_title = text_cache.font("Minecraft.ttf", 32)
+        self.font_label = text_cache.font("Minecraft.ttf", 24)
+        self.font_small = text_cache.font("Minecraft.ttf", 18)
         self.previous_scene = previous_scene
 
-        # 半透明背景
-        self.overlay = pg.Surface(
-            (1280, 720), pg.SRCALPHA
-        )  # 根據遊戲的實際 resolution 調整
-        self.overlay.fill((0, 0, 0, 160))
-
         # UI 主視窗
-        self.window_img = pg.image.load("assets/images/backgrounds/setting.png").convert_alpha()
+        self.window_img = resource_manager.get_image("backgrounds/setting.png")
         self.window_rect = self.window_img.get_rect(center=(640, 360))
 
         # Back 按鈕
@@ -71,10 +65,7 @@ class SettingsScene(Scene):
             self.slider_width,
             self.slider_height
         )
-        self.knob_img = pg.image.load(
-            "assets/images/UI/slider_knob.png"
-        ).convert_alpha()
-        self.knob_img = pg.transform.scale(self.knob_img, (24, 24))
+        self.knob_img = resource_manager.get_image("UI/slider_knob.png", (24, 24))
         self.knob_rect = self.knob_img.get_rect(
             center=(
                 self.slider_bar_rect.left + int(self.volume * self.slider_width),
@@ -86,6 +77,18 @@ class SettingsScene(Scene):
         self.volume = sound_manager.get_bgm_volume()
         self.slider_dragging = False
 
+        # 會變動的區域（最長的字先量好大小）
+        self.volume_text_rect = self.font_label.render("Volume: 100%", True, (0, 0, 0)).get_rect(
+            topleft=(self.window_rect.left + 35, self.window_rect.top + 80)
+        ).inflate(8, 0)
+        self.mute_state_rect = self.font_label.render("Off", True, (0, 0, 0)).get_rect(
+            topleft=(self.window_rect.left + 115, self.window_rect.top + 160)
+        ).inflate(8, 0)
+        # knob 可以超出 bar 左右各半顆
+        self.slider_rect = self.slider_bar_rect.inflate(self.knob_rect.width, 0).union(
+            self.knob_rect.move(0, self.slider_bar_rect.centery - self.knob_rect.centery)
+        )
+
         self._mouse_prev = False
     
     def toggle_mute(self):
@@ -129,6 +132,8 @@ class SettingsScene(Scene):
             print("[SETTING] ERROR: Failed to load save file!")
             return
 
+        # 舊的 manager 的 map prefetch worker 要關掉，不然每讀一次檔就多一條 thread
+        game_scene.game_manager.shutdown()
         game_scene.game_manager = new_manager
 
         # 重新綁 Camera
@@ -143,8 +148,7 @@ class SettingsScene(Scene):
     @override
     def enter(self) -> None:
         print("[SettingsScene] Enter")
-        screen = pg.display.get_surface()
-        self.background_capture = screen.copy()
+        super().enter()
 
     @override
     def exit(self) -> None:
@@ -192,50 +196,48 @@ class SettingsScene(Scene):
 
 
     @override
-    def draw(self, screen: pg.Surface):
-        # 半透明背景
-        # 先畫剛剛截到的 GameScene
-        screen.blit(self.background_capture, (0, 0))
-
-        # 半透明覆蓋
-        screen.blit(self.overlay, (0, 0))
-        
+    def draw_static(self, surface: pg.Surface):
         # 視窗
-        screen.blit(self.window_img, self.window_rect)
+        surface.blit(self.window_img, self.window_rect)
 
         # SETTINGS 標題
         title = self.font_title.render("SETTINGS", True, (255, 255, 255))
-        screen.blit(title, (self.window_rect.left + 35, self.window_rect.top + 32))
-        
+        surface.blit(title, (self.window_rect.left + 35, self.window_rect.top + 32))
+
+        # Mute文字
+        mute_txt = self.font_label.render("Mute:", True, (0, 0, 0))
+        surface.blit(mute_txt, (self.window_rect.left + 35, self.window_rect.top + 160))
+
+        # ESC
+        esc_txt = self.font_small.render("Press ESC to close", True, (0, 0, 0))
+        surface.blit(esc_txt, (self.window_rect.left + 35, self.window_rect.bottom - 60))
+
+    @override
+    def build_regions(self) -> list[DirtyRegion]:
+        return [
+            DirtyRegion(self.volume_text_rect, lambda: int(self.volume * 100), self._draw_volume_text),
+            DirtyRegion(self.slider_rect, lambda: self.knob_rect.centerx, self._draw_slider),
+            DirtyRegion.for_button(self.mute_button),
+            DirtyRegion(self.mute_state_rect, lambda: self.muted, self._draw_mute_state),
+            DirtyRegion.for_button(self.x_button),
+            DirtyRegion.for_button(self.back_button),
+            DirtyRegion.for_button(self.save_button),
+            DirtyRegion.for_button(self.load_button),
+        ]
+
+    def _draw_volume_text(self, screen: pg.Surface):
         # Volume 文字
         txt = self.font_label.render(f"Volume: {int(self.volume * 100)}%", True, (0, 0, 0))
         screen.blit(txt, (self.window_rect.left + 35, self.window_rect.top + 80))
-        
+
+    def _draw_slider(self, screen: pg.Surface):
         # SLIDER
         pg.draw.rect(screen, (220, 220, 220), self.slider_bar_rect, border_radius=3)
         self.knob_rect.centery = self.slider_bar_rect.centery
         screen.blit(self.knob_img, self.knob_rect)
 
-        # Mute文字
-        mute_txt = self.font_label.render("Mute:", True, (0, 0, 0))
-        screen.blit(mute_txt, (self.window_rect.left + 35, self.window_rect.top + 160))
-        # MUTE 按鈕-
-        self.mute_button.draw(screen)
+    def _draw_mute_state(self, screen: pg.Surface):
         #MUTE on/off
         mute_state = "On" if self.muted else "Off"
         mute_state_txt = self.font_label.render(f"{mute_state}", True, (0, 0, 0))
         screen.blit(mute_state_txt, (self.window_rect.left + 115, self.window_rect.top + 160))
-
-        # BACK 按鈕
-        self.x_button.draw(screen)
-        self.back_button.draw(screen)
-
-        # SAVE BUTTON
-        self.save_button.draw(screen)
-
-        # LOAD BUTTON
-        self.load_button.draw(screen)
-
-        # ESC
-        esc_txt = self.font_small.render("Press ESC to close", True, (0, 0, 0))
-        screen.blit(esc_txt, (self.window_rect.left + 35, self.window_rect.bottom - 60))
\ No newline at end of file
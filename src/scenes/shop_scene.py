@@ -1,7 +1,7 @@
 import pygame as pg
-from src.scenes.scene import Scene
+from src.scenes.overlay_scene import OverlayScene, DirtyRegion
 from src.utils import GameSettings
-from src.core.services import scene_manager
+from src.core.services import scene_manager, resource_manager, text_cache
 from src.interface.components import Button
 
 class ColorButton:
@@ -19,17 +19,11 @@ class ColorButton:
         pg.draw.rect(screen, color, self.rect)  # 實心白色按鈕
         pg.draw.rect(screen, (0,0,0), self.rect, 2)  # 黑框
 
-class ShopScene(Scene):
+class ShopScene(OverlayScene):
     def __init__(self, game_manager):
         super().__init__()
         self.game_manager = game_manager
 
-        self.captured = False
-
-        # 截取背景（GameScene 畫面）
-        screen = pg.display.get_surface()
-        self.background_capture = screen.copy()
-
         # Buy / Sell tab
         self.mode = "buy"   # or "sell"
 
@@ -44,16 +38,10 @@ class ShopScene(Scene):
         self.selected = 0
 
         # 字體
-        self.font = pg.font.SysFont("Arial", 22)
+        self.font = text_cache.font("Arial", 22)
 
         self.cart_buttons = []   # ← 購物車按鈕列表
 
-        # 半透明背景
-        self.overlay = pg.Surface(
-            (1280, 720), pg.SRCALPHA
-        )  # 根據遊戲的實際 resolution 調整
-        self.overlay.fill((0, 0, 0, 160))
-
         # 視窗圖片 or 顏色替代
         WINDOW_W = 600
         WINDOW_H = 400
@@ -72,8 +60,9 @@ class ShopScene(Scene):
         self.sell_start_index = 0
         self.VISIBLE_ROWS = 4
 
-
-        
+        # Buy / Sell tab 與商品列表的範圍
+        self.tabs_rect = pg.Rect(self.window_rect.x + 40, self.window_rect.y + 15, 140, 30)
+        self.list_rect = pg.Rect(self.window_rect.x + 25, self.window_rect.y + 110, 450, 4 * 72)
 
     def get_sell_list(self):
         """Sell 模式 → 顯示可以賣的怪獸"""
@@ -92,11 +81,11 @@ class ShopScene(Scene):
         return sell_list
     
     def enter(self):
-        # 只有第一次 enter() 時截圖背景
-        if not getattr(self, "captured", False):
-            screen = pg.display.get_surface()
-            self.background_capture = screen.copy()
-            self.captured = True
+        # 每次進來都重新截圖背景
+        super().enter()
+        self._rebuild_buttons()
+
+    def _rebuild_buttons(self):
         self.cart_buttons.clear()
 
         # 上下按鈕（SELL 模式用）
@@ -169,11 +158,12 @@ class ShopScene(Scene):
             32, 32,
             lambda: scene_manager.change_scene("game")
         )
+        self.invalidate()
 
     def _switch_mode(self, mode):
         if self.mode != mode:
             self.mode = mode
-            self.enter()  # 重新產生購物車按鈕
+            self._rebuild_buttons()  # 重新產生購物車按鈕
 
 
     def _on_click_item(self, item):
@@ -234,7 +224,7 @@ class ShopScene(Scene):
                 break
 
         # 重建 UI
-        self.enter()
+        self._rebuild_buttons()
 
     def update(self, dt):
         keys = pg.key.get_pressed()
@@ -258,16 +248,36 @@ class ShopScene(Scene):
     
 
     # 畫圖
-    def draw(self, screen):
-        # 畫背景截圖
-        screen.blit(self.background_capture, (0, 0))
+    def draw_static(self, surface):
+        # 視窗框
+        surface.blit(self.window_img, self.window_rect)
 
-        # 半透明蓋上
-        screen.blit(self.overlay, (0, 0))
+    def build_regions(self):
+        regions = [
+            DirtyRegion(self.tabs_rect, lambda: self.mode, self._draw_tabs),
+            DirtyRegion(self.list_rect, self._list_state, self._draw_list),
+        ]
+        regions += [DirtyRegion.for_button(btn) for btn in self.cart_buttons]
+        regions.append(DirtyRegion.for_button(self.x_button))
+        # SELL 模式才需要上下按鈕
+        if self.mode == "sell":
+            regions.append(DirtyRegion.for_button(self.btn_up))
+            regions.append(DirtyRegion.for_button(self.btn_down))
+        return regions
 
-        # 視窗框
-        screen.blit(self.window_img, self.window_rect)
+    def _display_list(self):
+        if self.mode == "buy":
+            return self.items_for_sale
+        sell_list = self.get_sell_list()
+        start = self.sell_start_index
+        end = min(start + self.VISIBLE_ROWS, len(sell_list))
+        return sell_list[start:end]
 
+    def _list_state(self):
+        key = "icon" if self.mode == "buy" else "sprite_path"
+        return self.mode, tuple((item["name"], item["price"], item[key]) for item in self._display_list())
+
+    def _draw_tabs(self, screen):
         # Buy / Sell tab
         X = self.window_rect.x
         Y = self.window_rect.y
@@ -289,21 +299,14 @@ class ShopScene(Scene):
         screen.blit(buy_txt, (X + 55, Y + 20))
         screen.blit(sell_txt, (X + 135, Y + 20))
 
-
+    def _draw_list(self, screen):
         # 商品列表
-        if self.mode == "buy":
-            display_list = self.items_for_sale
-        else:
-            sell_list = self.get_sell_list()
-            start = self.sell_start_index
-            end = min(start + self.VISIBLE_ROWS, len(sell_list))
-            display_list = sell_list[start:end]
-        start_y = Y + 110
+        X = self.window_rect.x
+        start_y = self.list_rect.top
         box_h = 60
         gap = 12
 
-
-        for row, item in enumerate(display_list):
+        for row, item in enumerate(self._display_list()):
             box_y = start_y + row * (box_h + gap)
 
             # 白框
@@ -318,8 +321,7 @@ class ShopScene(Scene):
                 # SELL 模式：怪獸 icon 在 sprite_path
                 icon_path = item["sprite_path"]
 
-            icon = pg.image.load(icon_path).convert_alpha()
-            icon = pg.transform.scale(icon, (32, 32))
+            icon = resource_manager.get_image(icon_path, (32, 32))
             screen.blit(icon, (X+35, box_y + 14))
 
 
@@ -334,21 +336,13 @@ class ShopScene(Scene):
             # 價錢（右側）
             price_txt = self.font.render(f"${item['price']}", True, (0,0,0))
             screen.blit(price_txt, (X + 330, box_y + 18))
-        # 畫購物車按鈕
-        for btn in self.cart_buttons:
-            btn.draw(screen)
-
-        self.x_button.draw(screen)
-        if self.mode == "sell":
-            self.btn_up.draw(screen)
-            self.btn_down.draw(screen)
 
     def scroll_up(self):
         self.sell_start_index = max(0, self.sell_start_index - 1)
-        self.enter()  # 重建購物車按鈕
+        self._rebuild_buttons()  # 重建購物車按鈕
 
     def scroll_down(self):
         sell_list = self.get_sell_list()
         max_start = max(0, len(sell_list) - self.VISIBLE_ROWS)
         self.sell_start_index = min(max_start, self.sell_start_index + 1)
-        self.enter()
+        self._rebuild_buttons()
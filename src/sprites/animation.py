@@ -1,12 +1,13 @@
 import pygame as pg
 
 from .sprite import Sprite
+from src.core.services import resource_manager
 from src.utils import GameSettings, Logger, PositionCamera
 from typing import Optional
 
 class Animation(Sprite):
-    # Animations
-    animations: dict[str, list[pg.Surface]]
+    # Animations (shared between every animation cut from the same sheet)
+    animations: dict[str, tuple[pg.Surface, ...]]
     cur_row: str
     # Time information for selections
     accumulator: float  # time elapsed
@@ -20,23 +21,12 @@ class Animation(Sprite):
         loop: float = 1                     # loop in second
     ):
         super().__init__(image_path)
-        sheet_w, sheet_h = self.image.get_size()
-        frame_w = sheet_w // n_keyframes
-        frame_h = sheet_h // len(rows)
         
         if (len(rows) <= 0 or n_keyframes <= 0):
             Logger.error("Invalid number of rows")
         
-        self.animations = {}
-        for r, name in enumerate(rows):
-            anim : list[pg.Surface] = []
-            for c in range(n_keyframes):
-                frame = self.image.subsurface(pg.Rect(
-                    c * frame_w, r * frame_h,
-                    frame_w, frame_h
-                ))
-                anim.append(pg.transform.smoothscale(frame, size))
-            self.animations[name] = anim
+        # Only the playback state below is per instance
+        self.animations = resource_manager.get_animation_frames(image_path, rows, n_keyframes, size)
             
         self.accumulator = 0
         self.cur_row = rows[0]
@@ -52,11 +42,14 @@ class Animation(Sprite):
     def update(self, dt: float):
          self.accumulator = (self.accumulator + dt) % self.loop
         
-    def draw(self, screen: pg.Surface, camera: Optional[PositionCamera] = None):
+    def current_frame(self) -> pg.Surface:
         frames = self.animations[self.cur_row]
         idx = int((self.accumulator / self.loop) * self.n_keyframes)
+        return frames[idx]
+
+    def draw(self, screen: pg.Surface, camera: Optional[PositionCamera] = None):
         if camera:
-            screen.blit(frames[idx], camera.transform_rect(self.rect))
+            screen.blit(self.current_frame(), camera.transform_rect(self.rect))
         else:
-            screen.blit(frames[idx], self.rect)
+            screen.blit(self.current_frame(), self.rect)
     
\ No newline at end of file
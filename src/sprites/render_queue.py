@@ -0,0 +1,70 @@
+import pygame as pg
+from operator import itemgetter
+from src.utils import PositionCamera
+from src.core.services import profiler
+
+
+class RenderQueue:
+    """
+    Per-frame list of world-space sprites.
+
+    World objects submit an image with a layer and a y-sort key instead of
+    blitting directly. flush() culls everything outside the camera view,
+    sorts by (layer, y) so overlapping characters are drawn back to front,
+    and sends the survivors to the screen in a single Surface.blits() call.
+    """
+    LAYER_MAP = 0       # prebaked map surface
+    LAYER_GROUND = 1    # markers painted on the floor (navigation arrows)
+    LAYER_ENTITIES = 2  # characters, y-sorted against each other
+    LAYER_OVERLAY = 3   # warning signs, chat bubbles
+
+    _items: list[tuple[int, float, int, pg.Surface, pg.Rect]]
+    blit_count: int     # blits issued by the last flush
+    culled_count: int   # submissions skipped by the last flush
+
+    def __init__(self) -> None:
+        self._items = []
+        self.blit_count = 0
+        self.culled_count = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def submit(
+        self, image: pg.Surface, pos: tuple[float, float],
+        layer: int = LAYER_ENTITIES, sort_y: float | None = None
+    ) -> None:
+        rect = image.get_rect(topleft=(int(pos[0]), int(pos[1])))
+        if sort_y is None:
+            sort_y = rect.bottom
+        # len() keeps submission order for ties and avoids comparing surfaces
+        self._items.append((layer, sort_y, len(self._items), image, rect))
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def flush(self, screen: pg.Surface, camera: PositionCamera) -> int:
+        cx, cy = camera.x, camera.y
+        view = pg.Rect(cx, cy, screen.get_width(), screen.get_height())
+
+        self._items.sort(key=itemgetter(0, 1, 2))
+        # The map layer sorts first; blit it separately so the profiler can
+        # tell map cost from sprite cost
+        map_batch = []
+        batch = []
+        for layer, _, _, image, rect in self._items:
+            if view.colliderect(rect):
+                (map_batch if layer == self.LAYER_MAP else batch).append((image, (rect.x - cx, rect.y - cy)))
+
+        profiler.begin("draw.map")
+        screen.blits(map_batch, doreturn=False)
+        profiler.end("draw.map")
+        profiler.begin("draw.entities")
+        screen.blits(batch, doreturn=False)
+        profiler.end("draw.entities")
+
+        self.blit_count = len(map_batch) + len(batch)
+        self.culled_count = len(self._items) - self.blit_count
+        profiler.count("blits", self.blit_count)
+        self._items.clear()
+        return self.blit_count
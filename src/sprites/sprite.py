@@ -8,9 +8,8 @@ class Sprite:
     rect: pg.Rect
     
     def __init__(self, img_path: str, size: tuple[int, int] | None = None):
-        self.image = resource_manager.get_image(img_path)
-        if size is not None:
-            self.image = pg.transform.scale(self.image, size)
+        # Shared with every other Sprite of the same (path, size); don't draw on it
+        self.image = resource_manager.get_image(img_path, size)
         self.rect = self.image.get_rect()
         
     def update(self, dt: float):
@@ -4,6 +4,8 @@ from .logger import Logger
 from .settings import GameSettings
 from .loader import load_tmx, load_img, load_font, load_sound
 from .definition import Position, PositionCamera, Direction, MouseBtn, Key, Teleport
+from .spatial_grid import SpatialGrid
+from .entity_scheduler import EntityScheduler
 
 __all__ = [
     "Logger",
@@ -18,4 +20,6 @@ __all__ = [
     "MouseBtn",
     "Key",
     "Teleport",
+    "SpatialGrid",
+    "EntityScheduler",
 ]
\ No newline at end of file
@@ -0,0 +1,95 @@
+from __future__ import annotations
+from typing import Generic, Hashable, Iterable, TypeVar
+from pygame import Rect
+
+from .spatial_grid import SpatialGrid
+
+T = TypeVar("T", bound=Hashable)
+
+
+class EntityScheduler(Generic[T]):
+    """
+    Picks which entities of a SpatialGrid update this frame, by how far
+    they are from the anchors (the player, and other players when online):
+
+        near    within near_range of an anchor: every frame
+        mid     within mid_range: once every mid_interval frames, with the
+                time since their last update (staggered, so the work is
+                spread over the frames)
+        far     asleep. Nothing looks at them until an anchor comes within
+                mid_range again: the grid query around the anchors is the
+                wake trigger.
+
+    Ranges are in world pixels, measured per axis (a square around each
+    anchor), at the grid's cell granularity. A frame only touches the cells
+    around the anchors, so its cost follows what is near the players, not
+    how many entities the map has. Time spent asleep is not caught up.
+    """
+    grid: SpatialGrid[T]
+    near_range: int
+    mid_range: int
+    mid_interval: int
+    frame: int
+    clock: float
+    _last: dict[T, float]       # awake entities -> clock at their last update
+    _phase: dict[T, int]        # mid entities' stagger, dropped when they fall asleep
+    _next_phase: int
+
+    def __init__(self, grid: SpatialGrid[T], near_range: int, mid_range: int, mid_interval: int = 4):
+        self.grid = grid
+        self.near_range = near_range
+        self.mid_range = max(mid_range, near_range)
+        self.mid_interval = max(1, mid_interval)
+        self.frame = 0
+        self.clock = 0.0
+        self._last = {}
+        self._phase = {}
+        self._next_phase = 0
+
+    def __len__(self) -> int:
+        """Entities currently awake (near or mid)."""
+        return len(self._last)
+
+    def is_awake(self, entity: T) -> bool:
+        return entity in self._last
+
+    def tick(self, dt: float, anchors: Iterable[tuple[float, float]]) -> list[tuple[T, float]]:
+        """Advance one frame; returns (entity, elapsed seconds) for every entity due to update."""
+        self.frame += 1
+        before = self.clock
+        self.clock = now = before + dt
+
+        near: set[T] = set()
+        mid: set[T] = set()
+        for x, y in anchors:
+            near.update(self.grid.query(self._around(x, y, self.near_range)))
+            mid.update(self.grid.query(self._around(x, y, self.mid_range)))
+        mid -= near
+
+        last = self._last
+        awake: dict[T, float] = {}
+        due: list[tuple[T, float]] = []
+        for entity in near:
+            # 剛醒來的從上一個 frame 開始算，不補睡著的時間
+            due.append((entity, now - last.get(entity, before)))
+            awake[entity] = now
+        phases = self._phase
+        for entity in mid:
+            since = last.get(entity, before)
+            phase = phases.get(entity)
+            if phase is None:
+                phase = phases[entity] = self._next_phase
+                self._next_phase = (phase + 1) % self.mid_interval
+            if (self.frame + phase) % self.mid_interval == 0:
+                due.append((entity, now - since))
+                since = now
+            awake[entity] = since
+        # 不在 near / mid 裡的就睡著了（從 grid 拿掉的 entity 也是）
+        for entity in last.keys() - awake.keys():
+            phases.pop(entity, None)
+        self._last = awake
+        return due
+
+    @staticmethod
+    def _around(x: float, y: float, reach: int) -> Rect:
+        return Rect(int(x) - reach, int(y) - reach, 2 * reach, 2 * reach)
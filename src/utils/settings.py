@@ -5,11 +5,17 @@ class Settings:
     # Screen
     SCREEN_WIDTH: int = 1280    # Width of the game window
     SCREEN_HEIGHT: int = 720    # Height of the game window
-    FPS: int = 60               # Frames per second
+    FPS: int = 60               # Frames per second (render cap in "capped" mode)
+    UPDATE_RATE: int = 60       # Fixed simulation steps per second
+    MAX_CATCHUP_STEPS: int = 5  # Max simulation steps per rendered frame
+    MAX_FRAME_TIME: float = 0.25  # Longest frame fed to the simulation (seconds)
+    RENDER_MODE: str = "capped" # "capped" (FPS), "uncapped" or "vsync"
     TITLE: str = "I2P Final"    # Title of the game window
     DEBUG: bool = True          # Debug mode
     TILE_SIZE: int = 64         # Size of each tile in pixels
     DRAW_HITBOXES: bool = False  # Draw hitboxes for debugging
+    MINIMAP_WIDTH: int = 180    # Size of the minimap thumbnail
+    MINIMAP_HEIGHT: int = 120
     # Audio
     MAX_CHANNELS: int = 16
     AUDIO_VOLUME: float = 0.5   # Volume of audio
@@ -0,0 +1,76 @@
+from __future__ import annotations
+from typing import Generic, Hashable, Iterator, TypeVar
+from pygame import Rect
+
+T = TypeVar("T", bound=Hashable)
+
+
+class SpatialGrid(Generic[T]):
+    """
+    Coarse uniform grid of point items (world pixels).
+
+    Items are bucketed by the cell their position falls in, so finding what
+    is near a rect (usually the camera view) only touches the few cells it
+    overlaps instead of every item on the map. Items are points: inflate the
+    query rect by the sprite size to catch sprites that poke into it.
+    """
+    cell_size: int
+    _cells: dict[tuple[int, int], list[T]]
+    _where: dict[T, tuple[int, int]]
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self._cells = {}
+        self._where = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._where
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._where)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, item: T, x: float, y: float) -> None:
+        """Add item at (x, y), or move it there if it is already in the grid."""
+        cell = self._cell(x, y)
+        old = self._where.get(item)
+        if old == cell:
+            return
+        if old is not None:
+            self._cells[old].remove(item)
+            if not self._cells[old]:
+                del self._cells[old]
+        self._cells.setdefault(cell, []).append(item)
+        self._where[item] = cell
+
+    move = insert
+
+    def remove(self, item: T) -> None:
+        cell = self._where.pop(item, None)
+        if cell is None:
+            return
+        self._cells[cell].remove(item)
+        if not self._cells[cell]:
+            del self._cells[cell]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._where.clear()
+
+    def query(self, rect: Rect) -> list[T]:
+        """Items in every cell overlapped by rect (may include a few just outside it)."""
+        x0, y0 = self._cell(rect.left, rect.top)
+        x1, y1 = self._cell(rect.right - 1, rect.bottom - 1)
+        cells = self._cells
+        found: list[T] = []
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found